@@ -0,0 +1,100 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""benchmarks/benchmark_build.py:
+
+Compare the time needed to build the CC-CEDICT trie by inserting
+the entries one by one with trie_insert() and in bulk with
+trie_insert_all().
+
+Run with:
+
+python benchmarks/benchmark_build.py [CEDICT_FILE] [FORM]
+
+When no CEDICT_FILE is given, the local CC-CEDICT copy
+(~/.cedict/cedict.txt) is used.
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import sys
+import time
+
+from glottai.cedict.settings import settings
+from glottai.cedict.trie import trie_insert
+from glottai.cedict.trie.simple.insert import trie_insert_all
+from glottai.cedict.utilities.cedict import read_cedict_trie_items
+
+
+def build_with_trie_insert(items):
+    trie = {}
+    for word, entry in items:
+        trie_insert(trie, word, entry)
+
+    return trie
+
+
+def build_with_trie_insert_all(items):
+    return trie_insert_all({}, items)
+
+
+def measure(build, items):
+    """Return the trie built with BUILD from ITEMS and the time in
+    seconds needed.
+
+    """
+
+    start_time = time.perf_counter()
+    trie = build(items)
+
+    return trie, time.perf_counter() - start_time
+
+
+def main():
+    cedict_file = sys.argv[1] if len(sys.argv) > 1 else None
+    form = sys.argv[2] if len(sys.argv) > 2 else "simplified"
+
+    if cedict_file is None:
+        cedict_file = settings.get_cedict_file()
+
+    items = list(read_cedict_trie_items(cedict_file, form=form))
+
+    print(f"CC-CEDICT file:         {cedict_file} ({form})")
+    print(f"Entries:                {len(items)}")
+    print("")
+
+    expected_trie = None
+    for name, build in [
+        ("trie_insert()", build_with_trie_insert),
+        ("trie_insert_all()", build_with_trie_insert_all),
+    ]:
+        trie, seconds = measure(build, items)
+        print(f"{name + ':':24}{seconds * 1000:8.1f} ms")
+
+        # All builders have to build the same trie
+        if expected_trie is None:
+            expected_trie = trie
+        assert trie == expected_trie
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+
+"""benchmarks/benchmark_lexer.py:
+
+Measure the number of tokens per second of the lexer on a text with
+a high ratio of characters not found in the dictionary: a synthetic
+chat log mixing English and Chinese.
+
+The scaling of lex_parallel() is measured for 1, 2, 4, ... workers up
+to the number of CPUs (at least 2).  The times include starting the
+worker processes and joining their columns into the TokenArray.
+
+Run with:
+
+python benchmarks/benchmark_lexer.py [CEDICT_FILE] [N_LINES]
+
+When no CEDICT_FILE is given, the local CC-CEDICT copy
+(~/.cedict/cedict.txt) is used.
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import os
+import random
+import sys
+import time
+
+from glottai.cedict.lexer.lexer import lex_array, lexer
+from glottai.cedict.lexer.parallel import lex_parallel
+from glottai.cedict.lexer.token import TType
+from glottai.cedict.settings import settings
+from glottai.cedict.utilities.cedict import read_cedict_trie_items
+from glottai.cedict.utilities.cedict import read_cedict_tries
+
+_english = (
+    "ok lol thanks see you tomorrow meeting at the office "
+    "did you get my email haha sure no problem"
+).split()
+
+_others = ["!", "?", ",", "...", ":)", "😂", "👍", "~", "@", "#"]
+
+
+def chat_log(words, n_lines):
+    """Return a chat log of N_LINES lines mixing English, Chinese
+    WORDS, numbers, punctuation and emoji.
+
+    """
+
+    random.seed(0)
+    lines = []
+    for i in range(n_lines):
+        parts = [f"[{i % 24:02d}:{i % 60:02d}] user{i % 7}:"]
+        for _ in range(random.randint(3, 12)):
+            choice = random.random()
+            if choice < 0.4:
+                parts.append(random.choice(_english))
+            elif choice < 0.75:
+                parts.append(random.choice(words))
+            elif choice < 0.85:
+                parts.append(str(random.randint(0, 999)))
+            else:
+                parts.append(random.choice(_others))
+        lines.append(" ".join(parts))
+
+    return "\n".join(lines) + "\n"
+
+
+def measure(function):
+    """Return the result of calling FUNCTION and the time in seconds
+    it needed.
+
+    """
+
+    start_time = time.perf_counter()
+    result = function()
+
+    return result, time.perf_counter() - start_time
+
+
+def worker_counts():
+    """Return the numbers of workers 1, 2, 4, ... up to the number of
+    CPUs - and at least up to 2.
+
+    """
+
+    n_cpus = max(os.cpu_count() or 1, 2)
+
+    counts = [1]
+    while counts[-1] * 2 < n_cpus:
+        counts.append(counts[-1] * 2)
+    counts.append(n_cpus)
+
+    return counts
+
+
+def main():
+    cedict_file = sys.argv[1] if len(sys.argv) > 1 else None
+    n_lines = int(sys.argv[2]) if len(sys.argv) > 2 else 50000
+
+    if cedict_file is None:
+        cedict_file = settings.get_cedict_file()
+
+    _, _, _, trie = read_cedict_tries(cedict_file)
+    words = [
+        word
+        for word, _ in read_cedict_trie_items(cedict_file, form="simplified")
+    ]
+    text = chat_log(words, n_lines)
+
+    tokens, lex_seconds = measure(lambda: lexer(trie, text, 0))
+    _, entry_seconds = measure(lambda: [token.entry for token in tokens])
+    _, array_seconds = measure(lambda: lex_array(trie, text))
+
+    n_tokens = len(tokens)
+    n_cedict = sum(1 for token in tokens if token.ttype == TType.CEDICT)
+
+    print(f"CC-CEDICT file:         {cedict_file}")
+    print(f"Characters:             {len(text)}")
+    print(f"Tokens:                 {n_tokens}")
+    print(f"Not in the dictionary:  {1 - n_cedict / n_tokens:8.1%}")
+    print("")
+    print(f"lexer():                {n_tokens / lex_seconds:10.0f} tokens/s")
+    print(
+        "lexer() + entries:      "
+        f"{n_tokens / (lex_seconds + entry_seconds):10.0f} tokens/s"
+    )
+    print(f"lex_array():            {n_tokens / array_seconds:10.0f} tokens/s")
+    print("")
+    print(f"CPUs:                   {os.cpu_count()}")
+
+    for workers in worker_counts():
+        _, parallel_seconds = measure(
+            lambda: lex_parallel(trie, text, workers=workers)
+        )
+        print(
+            f"lex_parallel({workers:2d}):       "
+            f"{n_tokens / parallel_seconds:10.0f} tokens/s  "
+            f"{array_seconds / parallel_seconds:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
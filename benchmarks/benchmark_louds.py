@@ -0,0 +1,108 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""benchmarks/benchmark_louds.py:
+
+Compare memory usage and lookups/sec of the succinct LOUDS trie
+with the dictionary trie built by trie_insert().
+
+Run with:
+
+python benchmarks/benchmark_louds.py [CEDICT_FILE] [FORM]
+
+When no CEDICT_FILE is given, the local CC-CEDICT copy
+(~/.cedict/cedict.txt) is used.
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import random
+import sys
+import time
+import tracemalloc
+
+from glottai.cedict.settings import settings
+from glottai.cedict.trie import trie_insert, trie_lookup
+from glottai.cedict.trie.louds.louds import LoudsTrie, louds_lookup
+from glottai.cedict.utilities.cedict import read_cedict_trie_items
+
+
+def measure_lookups(lookup, trie, text):
+    """Return the number of longest-prefix lookups per second
+    at every position of TEXT.
+
+    """
+
+    text_length = len(text)
+    start_time = time.perf_counter()
+    for start in range(text_length):
+        lookup(trie, text, text_length, start)
+    seconds = time.perf_counter() - start_time
+
+    return text_length / seconds
+
+
+def main():
+    cedict_file = sys.argv[1] if len(sys.argv) > 1 else None
+    form = sys.argv[2] if len(sys.argv) > 2 else "simplified"
+
+    if cedict_file is None:
+        cedict_file = settings.get_cedict_file()
+
+    items = list(read_cedict_trie_items(cedict_file, form=form))
+
+    # Dictionary trie
+    tracemalloc.start()
+    dict_trie = {}
+    for word, entry in items:
+        trie_insert(dict_trie, word, entry)
+    dict_trie_size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # LOUDS trie
+    louds_trie = LoudsTrie(items)
+    louds_trie_size = louds_trie.memory_size()
+    entries_size = len(louds_trie.entries)
+
+    # Sample text: randomly chosen words
+    random.seed(0)
+    words = [word for word, _ in random.sample(items, min(10000, len(items)))]
+    text = "".join(words)
+
+    dict_rate = measure_lookups(trie_lookup, dict_trie, text)
+    louds_rate = measure_lookups(louds_lookup, louds_trie, text)
+
+    mb = 1024 * 1024
+    print(f"CC-CEDICT file:     {cedict_file} ({form})")
+    print(f"Entries:            {len(items)}")
+    print(f"Nodes:              {len(louds_trie.labels)}")
+    print("")
+    print(f"dict trie:          {dict_trie_size / mb:8.1f} MB")
+    print(f"LOUDS trie:         {louds_trie_size / mb:8.1f} MB")
+    print(f"  of which entries: {entries_size / mb:8.1f} MB")
+    print("")
+    print(f"dict trie:          {dict_rate:10.0f} lookups/sec")
+    print(f"LOUDS trie:         {louds_rate:10.0f} lookups/sec")
+
+
+if __name__ == "__main__":
+    main()
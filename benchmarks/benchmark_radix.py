@@ -0,0 +1,112 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""benchmarks/benchmark_radix.py:
+
+Compare the number of nodes and the lookup time of the radix trie
+with the dictionary trie built by trie_insert().
+
+Run with:
+
+python benchmarks/benchmark_radix.py [CEDICT_FILE] [FORM]
+
+When no CEDICT_FILE is given, the local CC-CEDICT copy
+(~/.cedict/cedict.txt) is used.
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import random
+import sys
+import time
+
+from glottai.cedict.settings import settings
+from glottai.cedict.trie import trie_insert, trie_lookup
+from glottai.cedict.trie.radix.radix import RadixTrie, radix_lookup
+from glottai.cedict.utilities.cedict import read_cedict_trie_items
+
+
+def count_dict_trie_nodes(trie):
+    """Return the number of dictionaries in TRIE."""
+
+    count = 0
+    stack = [trie]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(value for key, value in node.items() if key is not True)
+
+    return count
+
+
+def measure_lookups(lookup, trie, text):
+    """Return the time in seconds needed for a longest-prefix lookup
+    at every position of TEXT.
+
+    """
+
+    text_length = len(text)
+    start_time = time.perf_counter()
+    for start in range(text_length):
+        lookup(trie, text, text_length, start)
+
+    return time.perf_counter() - start_time
+
+
+def main():
+    cedict_file = sys.argv[1] if len(sys.argv) > 1 else None
+    form = sys.argv[2] if len(sys.argv) > 2 else "simplified"
+
+    if cedict_file is None:
+        cedict_file = settings.get_cedict_file()
+
+    items = list(read_cedict_trie_items(cedict_file, form=form))
+
+    dict_trie = {}
+    for word, entry in items:
+        trie_insert(dict_trie, word, entry)
+
+    radix_trie = RadixTrie()
+    for word, entry in items:
+        radix_trie.insert(word, entry)
+
+    # Sample text: randomly chosen words
+    random.seed(0)
+    words = [word for word, _ in random.sample(items, min(10000, len(items)))]
+    text = "".join(words)
+
+    dict_seconds = measure_lookups(trie_lookup, dict_trie, text)
+    radix_seconds = measure_lookups(radix_lookup, radix_trie, text)
+
+    print(f"CC-CEDICT file:  {cedict_file} ({form})")
+    print(f"Entries:         {len(items)}")
+    print(f"Lookups:         {len(text)}")
+    print("")
+    print(f"dict trie:       {count_dict_trie_nodes(dict_trie):8d} nodes")
+    print(f"radix trie:      {radix_trie.node_count():8d} nodes")
+    print("")
+    print(f"dict trie:       {dict_seconds * 1000:8.1f} ms")
+    print(f"radix trie:      {radix_seconds * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+
+"""benchmarks/benchmark_search.py:
+
+Measure prefix completion, fuzzy lookups and wildcard pattern
+queries in the CC-CEDICT trie.
+
+Run with:
+
+python benchmarks/benchmark_search.py [CEDICT_FILE] [WORD...]
+
+When no CEDICT_FILE is given, the local CC-CEDICT copy
+(~/.cedict/cedict.txt) is used.
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import sys
+import time
+
+from glottai.cedict.settings import settings
+from glottai.cedict.trie.simple.search import (
+    trie_complete,
+    trie_fuzzy,
+    trie_match,
+    trie_reverse,
+)
+from glottai.cedict.utilities.cedict import read_cedict_tries
+
+# Number of repetitions per query
+REPEAT = 20
+
+
+def measure(function, *args, repeat=REPEAT):
+    """Return the average time in milliseconds needed for calling
+    FUNCTION with ARGS.
+
+    """
+
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        function(*args)
+
+    return (time.perf_counter() - start_time) * 1000 / repeat
+
+
+def main():
+    cedict_file = sys.argv[1] if len(sys.argv) > 1 else None
+    words = sys.argv[2:] or ["中", "王", "大学", "中华人民共和国"]
+
+    if cedict_file is None:
+        cedict_file = settings.get_cedict_file()
+
+    _, _, _, trie = read_cedict_tries(cedict_file)
+
+    start_time = time.perf_counter()
+    reverse_trie = trie_reverse(trie)
+    seconds = time.perf_counter() - start_time
+
+    print(f"CC-CEDICT file:         {cedict_file}")
+    print(f"Reverse trie build:     {seconds * 1000:8.1f} ms")
+    print("")
+
+    for word in words:
+        n_words = sum(1 for _ in trie_complete(trie, word))
+        print(f"Word {word!r} ({n_words} completions):")
+
+        complete_all = measure(lambda: list(trie_complete(trie, word)))
+        print(f"  all completions:      {complete_all:8.3f} ms")
+        complete_10 = measure(lambda: list(trie_complete(trie, word, 10)))
+        print(f"  first 10 completions: {complete_10:8.3f} ms")
+
+        for max_distance in [1, 2]:
+            n_found = len(trie_fuzzy(trie, word, max_distance))
+            fuzzy = measure(trie_fuzzy, trie, word, max_distance)
+            print(
+                f"  fuzzy k={max_distance}:            {fuzzy:8.3f} ms"
+                f" ({n_found} words)"
+            )
+
+        for pattern in [word[0] + "?" + word[1:], "*" + word]:
+            n_found = len(trie_match(trie, pattern))
+            print(f"  match {pattern!r} ({n_found} words):")
+            match = measure(trie_match, trie, pattern)
+            print(f"    trie:               {match:8.3f} ms")
+            match = measure(trie_match, trie, pattern, None, reverse_trie)
+            print(f"    reverse trie:       {match:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
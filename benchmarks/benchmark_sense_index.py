@@ -0,0 +1,119 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+
+"""benchmarks/benchmark_sense_index.py:
+
+Compare English to Chinese lookups by scanning the entries of the
+CC-CEDICT trie with lookups in the inverted sense index.
+
+Run with:
+
+python benchmarks/benchmark_sense_index.py [CEDICT_FILE] [QUERY...]
+
+When no CEDICT_FILE is given, the local CC-CEDICT copy
+(~/.cedict/cedict.txt) is used.
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import sys
+import time
+
+from glottai.cedict.index.sense_index import SenseIndex, tokenize_sense
+from glottai.cedict.settings import settings
+from glottai.cedict.utilities.cedict import (
+    read_cedict_entry_fields,
+    read_cedict_tries,
+)
+
+# Number of repetitions per query
+REPEAT = 100
+
+
+def scan_trie(trie, query):
+    """Collect the entries of TRIE having all tokens of QUERY in
+    their senses by visiting every node.
+
+    """
+
+    tokens = set(tokenize_sense(query))
+
+    result = []
+    stack = [trie]
+    while stack:
+        node = stack.pop()
+        for key, value in node.items():
+            if key is True:
+                for entry in value.split("\n"):
+                    if tokens <= set(tokenize_sense(entry.split("] ", 1)[1])):
+                        result.append(entry)
+            else:
+                stack.append(value)
+
+    return result
+
+
+def measure(function, *args, repeat=REPEAT):
+    """Return the average time in milliseconds needed for calling
+    FUNCTION with ARGS.
+
+    """
+
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        function(*args)
+
+    return (time.perf_counter() - start_time) * 1000 / repeat
+
+
+def main():
+    cedict_file = sys.argv[1] if len(sys.argv) > 1 else None
+    queries = sys.argv[2:] or ["prince", "son of a king", "university"]
+
+    if cedict_file is None:
+        cedict_file = settings.get_cedict_file()
+
+    _, _, _, trie = read_cedict_tries(cedict_file)
+    fields, _, _ = read_cedict_entry_fields(cedict_file)
+
+    start_time = time.perf_counter()
+    index = SenseIndex.from_entry_fields(fields)
+    seconds = time.perf_counter() - start_time
+
+    print(f"CC-CEDICT file:         {cedict_file}")
+    print(f"Index tokens:           {len(index)}")
+    print(f"Index build:            {seconds * 1000:8.1f} ms")
+    print("")
+
+    for query in queries:
+        print(f"Query {query!r}:")
+        scan = measure(scan_trie, trie, query, repeat=1)
+        print(f"  trie scan:            {scan:8.3f} ms")
+        search = measure(index.search, query)
+        print(f"  index search:         {search:8.3f} ms")
+        for entry_id in index.search(query, limit=3):
+            print(f"    {fields.get(entry_id)}")
+
+
+if __name__ == "__main__":
+    main()
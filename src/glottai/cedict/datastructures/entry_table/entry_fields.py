@@ -0,0 +1,300 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""src/glottai/cedict/datastructures/entry_table/entry_fields.py:
+
+A table storing the pre-parsed fields of the CC-CEDICT entries
+column by column.
+
+The fields are kept in a single EntryTable of strings: first the
+traditional words of all entries, then the simplified words, the
+pinyin with tone numbers, the pinyin with tone marks and finally the
+senses of all entries.  The senses of the entry i are the strings
+[sense_offsets[i], sense_offsets[i + 1]) of the sense column.
+
+File layout (native byte order):
+
+    magic                  b"CEDICTEF"
+    header                 uint32[2]: byte order mark, number of entries
+    sense offsets          uint32[number of entries + 1]
+    strings                an entry table file (see entry_table.py)
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import mmap
+import struct
+from array import array
+from collections import namedtuple
+
+from glottai.cedict.datastructures.entry_table.entry_table import (
+    BYTE_ORDER_MARK,
+    EntryTable,
+    EntryTableException,
+)
+
+MAGIC = b"CEDICTEF"
+
+# Format of the header following the magic bytes
+HEADER_FORMAT = "=2I"
+
+# The string columns preceding the senses
+TRADITIONAL, SIMPLIFIED, PINYIN, PINYIN_MARKS, SENSES = range(5)
+
+# The fields of an entry
+Entry = namedtuple(
+    "Entry", ["traditional", "simplified", "pinyin", "pinyin_marks", "senses"]
+)
+
+
+class EntryFields:
+    """A table of pre-parsed entries addressed by integer entry IDs.
+
+    Tries holding entry IDs can use the table in place of an
+    EntryTable: get() returns the entry lines with the pinyin in tone
+    marks, get_fields() returns the fields of the entries as Entry
+    records without parsing anything.
+
+    Example:
+
+    fields = EntryFields.from_parsed_entries(
+        [("王子", "王子", "wang2 zi3", ["prince", "son of a king"])]
+    )
+    fields[0]
+
+    > Entry(traditional='王子', simplified='王子', pinyin='wang2 zi3',
+    >       pinyin_marks='wáng zǐ', senses=['prince', 'son of a king'])
+
+    fields.get(0)
+
+    > '王子 王子 [wáng zǐ] /prince/son of a king/'
+
+    """
+
+    def __init__(self, strings, sense_offsets):
+        self.strings = strings
+        self.sense_offsets = sense_offsets
+        self._n_entries = len(sense_offsets) - 1
+        self._mmap = None
+
+    @classmethod
+    def from_parsed_entries(cls, entries):
+        """Create an entry field table from ENTRIES, a list of tuples
+        (traditional, simplified, pinyin, senses) as returned by
+        parse_cedict_entry().  The pinyin is expected with tone
+        numbers; the pinyin and the senses are converted to tone
+        marks once here.  The ID of each entry is its index in
+        ENTRIES.
+
+        """
+
+        from glottai.cedict.pinyin import (
+            tone_numbers_to_marks,
+            tone_numbers_to_marks_string,
+        )
+
+        columns = [[], [], [], [], []]
+        sense_offsets = array("I", [0])
+        for traditional, simplified, pinyin, senses in entries:
+            columns[TRADITIONAL].append(traditional)
+            columns[SIMPLIFIED].append(simplified)
+            columns[PINYIN].append(pinyin)
+            columns[PINYIN_MARKS].append(tone_numbers_to_marks(pinyin))
+            columns[SENSES].extend(
+                tone_numbers_to_marks_string(sense) for sense in senses
+            )
+            sense_offsets.append(len(columns[SENSES]))
+
+        strings = EntryTable.from_strings(
+            [string for column in columns for string in column]
+        )
+
+        return cls(strings, sense_offsets)
+
+    @classmethod
+    def open(cls, filename):
+        """Open the entry field table file FILENAME memory-mapped."""
+
+        with open(filename, "rb") as fh:
+            mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            sense_offsets, strings = cls._parse(filename, mapped)
+
+        except Exception:
+            mapped.close()
+            raise
+
+        fields = cls(strings, sense_offsets)
+        fields._mmap = mapped
+
+        return fields
+
+    @staticmethod
+    def _parse(filename, mapped):
+        """Parse the header of the MAPPED entry field table file
+        FILENAME and return a view of the sense offsets and the
+        string table.
+
+        """
+
+        with memoryview(mapped) as view:
+            if bytes(view[: len(MAGIC)]) != MAGIC:
+                msg = f"{filename} is not an entry field table file!"
+                raise EntryTableException(msg)
+
+            position = len(MAGIC)
+            header_size = struct.calcsize(HEADER_FORMAT)
+            byte_order_mark, n_entries = struct.unpack(
+                HEADER_FORMAT, view[position : position + header_size]
+            )
+            position += header_size
+
+            if byte_order_mark != BYTE_ORDER_MARK:
+                msg = (
+                    f"{filename} has been written "
+                    "on a machine with a different byte order!"
+                )
+                raise EntryTableException(msg)
+
+            size = 4 * (n_entries + 1)
+            sense_offsets = view[position : position + size].cast("I")
+
+            try:
+                with view[position + size :] as strings_view:
+                    offsets, data = EntryTable._parse(filename, strings_view)
+
+            except Exception:
+                sense_offsets.release()
+                raise
+
+        return sense_offsets, EntryTable(data, offsets)
+
+    def write(self, filename):
+        """Write the entry field table to the file FILENAME."""
+
+        with open(filename, "wb") as fh:
+            fh.write(MAGIC)
+            fh.write(struct.pack(HEADER_FORMAT, BYTE_ORDER_MARK, len(self)))
+            fh.write(array("I", self.sense_offsets).tobytes())
+
+        self.strings.write(filename, append=True)
+
+    def close(self):
+        """Unmap the file of a table opened with open()."""
+
+        if self._mmap is not None:
+            self.sense_offsets.release()
+            self.strings.offsets.release()
+            self.strings.data.release()
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self._n_entries
+
+    def field(self, column, entry_id):
+        """Decode the field of the string COLUMN (TRADITIONAL,
+        SIMPLIFIED, PINYIN or PINYIN_MARKS) of the entry ENTRY_ID.
+
+        """
+
+        return self.strings[column * self._n_entries + entry_id]
+
+    def senses(self, entry_id):
+        """Decode the list of senses of the entry ENTRY_ID."""
+
+        base = SENSES * self._n_entries
+        begin = self.sense_offsets[entry_id]
+        end = self.sense_offsets[entry_id + 1]
+        strings = self.strings
+
+        return [strings[base + i] for i in range(begin, end)]
+
+    def __getitem__(self, entry_id):
+        """Decode the fields of the entry ENTRY_ID as Entry record."""
+
+        field = self.field
+        return Entry(
+            field(TRADITIONAL, entry_id),
+            field(SIMPLIFIED, entry_id),
+            field(PINYIN, entry_id),
+            field(PINYIN_MARKS, entry_id),
+            self.senses(entry_id),
+        )
+
+    def line(self, entry_id):
+        """Assemble the entry line of ENTRY_ID with the pinyin in tone
+        marks, as stored in the string tries.
+
+        """
+
+        entry = self[entry_id]
+        return (
+            f"{entry.traditional} {entry.simplified} "
+            f"[{entry.pinyin_marks}] /{'/'.join(entry.senses)}/"
+        )
+
+    def get(self, entry_ids):
+        """Assemble the entry line (or lines) referenced by a trie
+        value like EntryTable.get().
+
+        """
+
+        if isinstance(entry_ids, int):
+            return self.line(entry_ids)
+
+        return "\n".join(self.line(entry_id) for entry_id in entry_ids)
+
+    def trie(self, form="traditional"):
+        """Build a trie mapping the words of the hanzi FORM
+        ('traditional' or 'simplified') to the IDs of their entries.
+        The words are read from their column; no entry is parsed.
+
+        """
+
+        from glottai.cedict.trie.simple.insert import trie_insert_entry_id
+
+        column = TRADITIONAL if form == "traditional" else SIMPLIFIED
+
+        trie = {}
+        for entry_id in range(len(self)):
+            trie_insert_entry_id(trie, self.field(column, entry_id), entry_id)
+
+        return trie
+
+    def get_fields(self, entry_ids):
+        """Decode the list of Entry records referenced by a trie
+        value: a single entry ID or a tuple of entry IDs.
+
+        """
+
+        if isinstance(entry_ids, int):
+            return [self[entry_ids]]
+
+        return [self[entry_id] for entry_id in entry_ids]
@@ -0,0 +1,194 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""src/glottai/cedict/datastructures/entry_table/entry_table.py:
+
+A string table storing entries once in a contiguous UTF-8 blob
+with an offset table.
+
+File layout (native byte order):
+
+    magic                  b"CEDICTET"
+    header                 uint32[2]: byte order mark, number of entries
+    offsets                uint32[number of entries + 1]
+    entries                UTF-8 encoded entries
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import mmap
+import struct
+from array import array
+
+MAGIC = b"CEDICTET"
+BYTE_ORDER_MARK = 0x01020304
+
+# Format of the header following the magic bytes
+HEADER_FORMAT = "=2I"
+
+
+class EntryTableException(Exception):
+    pass
+
+
+class EntryTable:
+    """A table of entries addressed by integer entry IDs.
+
+    The entries are stored once in a contiguous UTF-8 blob; the
+    entry with the ID i is the blob slice [offsets[i], offsets[i + 1])
+    and is decoded on access.  Tries can hold entry IDs instead of
+    entry strings and share a single table.  A table written to a
+    file can be opened memory-mapped and shared across processes.
+
+    Example:
+
+    table = EntryTable.from_strings(["王 王 [wáng] /king/", "王子 ..."])
+    table[0]       > '王 王 [wáng] /king/'
+    table.get(1)   > '王子 ...'
+    table.get((0, 1))
+    > '王 王 [wáng] /king/\\n王子 ...'
+
+    """
+
+    def __init__(self, data, offsets):
+        self.data = data
+        self.offsets = offsets
+        self._mmap = None
+
+    @classmethod
+    def from_strings(cls, strings):
+        """Create an entry table from the list of STRINGS.
+        The ID of each string is its index in STRINGS.
+
+        """
+
+        encoded = [string.encode("utf-8") for string in strings]
+
+        offsets = array("I", [0])
+        position = 0
+        for data in encoded:
+            position += len(data)
+            offsets.append(position)
+
+        return cls(b"".join(encoded), offsets)
+
+    @classmethod
+    def open(cls, filename):
+        """Open the entry table file FILENAME memory-mapped."""
+
+        with open(filename, "rb") as fh:
+            mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            offsets, data = cls._parse(filename, mapped)
+
+        except Exception:
+            mapped.close()
+            raise
+
+        table = cls(data, offsets)
+        table._mmap = mapped
+
+        return table
+
+    @staticmethod
+    def _parse(filename, mapped):
+        """Parse the header of the MAPPED entry table file FILENAME
+        and return views of the offsets and the entry data.
+
+        """
+
+        with memoryview(mapped) as view:
+            if bytes(view[: len(MAGIC)]) != MAGIC:
+                msg = f"{filename} is not an entry table file!"
+                raise EntryTableException(msg)
+
+            position = len(MAGIC)
+            header_size = struct.calcsize(HEADER_FORMAT)
+            byte_order_mark, n_entries = struct.unpack(
+                HEADER_FORMAT, view[position : position + header_size]
+            )
+            position += header_size
+
+            if byte_order_mark != BYTE_ORDER_MARK:
+                msg = (
+                    f"{filename} has been written "
+                    "on a machine with a different byte order!"
+                )
+                raise EntryTableException(msg)
+
+            size = 4 * (n_entries + 1)
+            offsets = view[position : position + size].cast("I")
+            data = view[position + size :]
+
+        return offsets, data
+
+    def write(self, filename, append=False):
+        """Write the entry table to the file FILENAME.  When APPEND is
+        True, the table is appended to the end of FILENAME.
+
+        """
+
+        with open(filename, "ab" if append else "wb") as fh:
+            fh.write(MAGIC)
+            fh.write(struct.pack(HEADER_FORMAT, BYTE_ORDER_MARK, len(self)))
+            fh.write(array("I", self.offsets).tobytes())
+            fh.write(self.data)
+
+    def close(self):
+        """Unmap the file of a table opened with open()."""
+
+        if self._mmap is not None:
+            self.offsets.release()
+            self.data.release()
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, entry_id):
+        """Decode the entry with the ID ENTRY_ID."""
+
+        offsets = self.offsets
+        begin, end = offsets[entry_id], offsets[entry_id + 1]
+        return str(self.data[begin:end], "utf-8")
+
+    def get(self, entry_ids):
+        """Decode the entry (or entries) referenced by a trie value.
+
+        ENTRY_IDS is either a single entry ID or a tuple of entry IDs
+        as stored by trie_insert_entry_id().  Several entries are
+        joined with '\\n' like the entries in a string trie.
+
+        """
+
+        if isinstance(entry_ids, int):
+            return self[entry_ids]
+
+        return "\n".join(self[entry_id] for entry_id in entry_ids)
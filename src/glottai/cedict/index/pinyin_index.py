@@ -0,0 +1,309 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""src/glottai/cedict/index/pinyin_index.py:
+
+A trie indexing the CC-CEDICT entries by their pinyin.
+
+The keys are the pinyin syllables of the entries with tone numbers,
+in lower case and without blanks: 'Wang2 zi3' is indexed as
+'wang2zi3'.  Queries can be given with tone numbers ('wang2 zi3'),
+tone marks ('wáng zǐ', 'wángzǐ') or without tones ('wangzi').  While
+walking the trie, the tone numbers of the keys are skipped where the
+query does not specify a tone; the tone of a tone marked vowel has
+to match the next tone number of the key.  'u:', 'ü' and - after
+'l' and 'n' - 'v' are the same, in the keys as in the queries.
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import marshal
+import re
+
+from glottai.cedict.pinyin import split_tone_mark, tone_marks_to_numbers
+
+# Version of the index file format
+INDEX_VERSION = 2
+
+_tones = "12345"
+
+# 'v' written for 'ü' - after 'l' and 'n' only, as 'lv' and 'nv'
+# are the only syllables where 'u' and 'ü' are distinguished
+_v_regex = re.compile(r"(?<=[ln])v")
+
+
+class PinyinIndexException(Exception):
+    pass
+
+
+def pinyin_key(pinyin):
+    """Normalize PINYIN with tone marks or tone numbers to a key of
+    the pinyin index.
+
+    Example:
+
+    pinyin_key('Wáng zǐ')   -> 'wang2zi3'
+    pinyin_key('nu:e4')     -> 'nüe4'
+    pinyin_key("Xī'ān")     -> 'xi1an1'
+    pinyin_key('lv4')       -> 'lü4'
+    pinyin_key('V C D')     -> 'vcd'
+
+    """
+
+    pinyin = tone_marks_to_numbers(pinyin.lower().replace("'", " "))
+    key = "".join(char for char in pinyin if char.isalnum())
+
+    return _v_regex.sub("ü", key)
+
+
+def _query_key(query):
+    """Normalize the QUERY like a key but keep the tone marks, as
+    syllables are not separated in queries like 'wángzǐ'.
+
+    """
+
+    query = query.lower().replace("u:", "ü")
+    key = "".join(char for char in query if char.isalnum())
+
+    return _v_regex.sub("ü", key)
+
+
+class PinyinIndex:
+    """A trie mapping the normalized pinyin of the entries to their
+    entry IDs.
+
+    The entry IDs are those of the EntryTable or EntryFields built
+    from the same cedict file.
+
+    Example:
+
+    fields, _, _ = read_cedict_entry_fields(cedict_filename)
+    index = PinyinIndex.from_entry_fields(fields)
+    index.lookup('wangzi') == index.lookup('wáng zǐ')
+
+    > True
+
+    """
+
+    def __init__(self, trie):
+        self.trie = trie
+
+    @classmethod
+    def from_pinyin(cls, entry_pinyin):
+        """Build the index from ENTRY_PINYIN, an iterable over the
+        pinyin of every entry in the order of the entry IDs.
+
+        """
+
+        from glottai.cedict.trie.simple.insert import trie_insert_entry_id
+
+        trie = {}
+        for entry_id, pinyin in enumerate(entry_pinyin):
+            trie_insert_entry_id(trie, pinyin_key(pinyin), entry_id)
+
+        return cls(trie)
+
+    @classmethod
+    def from_entry_fields(cls, entry_fields):
+        """Build the index from the pinyin of an EntryFields table."""
+
+        from glottai.cedict.datastructures.entry_table.entry_fields import (
+            PINYIN,
+        )
+
+        return cls.from_pinyin(
+            entry_fields.field(PINYIN, entry_id)
+            for entry_id in range(len(entry_fields))
+        )
+
+    @classmethod
+    def load(cls, filename):
+        """Load the index from the file FILENAME."""
+
+        with open(filename, "rb") as fh:
+            try:
+                data = marshal.load(fh)
+            except (EOFError, ValueError, TypeError) as error:
+                msg = f"{filename} is not a pinyin index file: {error}"
+                raise PinyinIndexException(msg)
+
+        if not isinstance(data, tuple) or data[:2] != (
+            "CEDICT pinyin index",
+            INDEX_VERSION,
+        ):
+            msg = f"{filename} is not a pinyin index file!"
+            raise PinyinIndexException(msg)
+
+        return cls(data[2])
+
+    def write(self, filename):
+        """Write the index to the file FILENAME."""
+
+        data = ("CEDICT pinyin index", INDEX_VERSION, self.trie)
+
+        with open(filename, "wb") as fh:
+            marshal.dump(data, fh)
+
+    def _walk(self, key):
+        """Yield the nodes reached by walking KEY through the trie.
+
+        Where the next character of KEY is not a tone number, the
+        tone numbers of the trie are skipped - unless a tone marked
+        vowel has been passed: then the next tone number of the trie
+        has to be its tone.
+
+        """
+
+        # The states are triples (node, index in KEY, pending tone)
+        stack = [(self.trie, 0, None)]
+        while stack:
+            node, i, tone = stack.pop()
+            at_end = i == len(key)
+
+            # Follow the tone numbers of the trie
+            if tone is not None:
+                child = node.get(tone)
+                if child is not None:
+                    stack.append((child, i, None))
+
+            elif (at_end or key[i] not in _tones) and (
+                i == 0 or key[i - 1] not in _tones
+            ):
+                # Skip the tone numbers not given in KEY
+                for number in _tones:
+                    child = node.get(number)
+                    if child is not None:
+                        stack.append((child, i, None))
+
+            if at_end:
+                if tone is None:
+                    yield node
+                continue
+
+            # Follow the next character of KEY
+            char = key[i]
+            vowel_tone = split_tone_mark(char)
+            if vowel_tone is not None:
+                if tone is not None:
+                    # A syllable has a single tone mark
+                    continue
+                char, tone = vowel_tone[0], str(vowel_tone[1])
+
+            elif char in _tones and tone is not None:
+                if char != tone:
+                    continue
+                tone = None
+
+            child = node.get(char)
+            if child is not None:
+                stack.append((child, i + 1, tone))
+
+    def lookup(self, query):
+        """Get the sorted list of the IDs of the entries with the pinyin
+        QUERY given with tone numbers, tone marks or without tones.
+
+        Example:
+
+        index.lookup('wang2zi3')
+        index.lookup('wáng zǐ')
+        index.lookup('wangzi')
+
+        """
+
+        key = _query_key(query)
+        if not key:
+            return []
+
+        entry_ids = set()
+        for node in self._walk(key):
+            value = node.get(True)
+            if value is not None:
+                entry_ids.update((value,) if isinstance(value, int) else value)
+
+        return sorted(entry_ids)
+
+    def prefix_lookup(self, query, limit=None):
+        """Get the sorted list of the IDs of the entries whose pinyin
+        starts with QUERY.  At most LIMIT IDs are returned when LIMIT
+        is given.
+
+        """
+
+        key = _query_key(query)
+
+        entry_ids = set()
+        for node in self._walk(key):
+            stack = [node]
+            while stack:
+                node = stack.pop()
+                for char, child in node.items():
+                    if char is True:
+                        entry_ids.update(
+                            (child,) if isinstance(child, int) else child
+                        )
+                    else:
+                        stack.append(child)
+
+        entry_ids = sorted(entry_ids)
+
+        return entry_ids if limit is None else entry_ids[:limit]
+
+    def fuzzy_lookup(self, query, max_distance=1):
+        """Get the IDs of the entries whose pinyin is within the
+        Levenshtein distance MAX_DISTANCE of QUERY, the closest
+        entries first.  The tones are ignored.
+
+        Example:
+
+        index.fuzzy_lookup('wnagzi', 2)
+
+        """
+
+        from glottai.cedict.trie.simple.search import trie_fuzzy
+
+        # Strip the tones of QUERY
+        key = ""
+        for char in _query_key(query):
+            vowel_tone = split_tone_mark(char)
+            if vowel_tone is not None:
+                char = vowel_tone[0]
+            if char not in _tones:
+                key += char
+
+        if not key:
+            return []
+
+        entry_ids = []
+        for _, value, _ in trie_fuzzy(
+            self.trie, key, max_distance, skip=_tones
+        ):
+            entry_ids.extend((value,) if isinstance(value, int) else value)
+
+        return entry_ids
+
+
+def load_cedict_pinyin_index():
+    """Load the pinyin index of the local CC-CEDICT copy."""
+
+    from glottai.cedict.settings import settings
+
+    return PinyinIndex.load(settings.get_cedict_pinyin_index_file())
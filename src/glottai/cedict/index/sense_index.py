@@ -0,0 +1,367 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""src/glottai/cedict/index/sense_index.py:
+
+An inverted index over the senses of the CC-CEDICT entries for
+English to Chinese lookups.
+
+Every token of the senses maps to a posting list of the IDs of the
+entries containing it, sorted by entry ID, together with the
+precomputed BM25 impact of the token in each entry and the IDs of
+the (at most TOP_SIZE) entries with the highest impact.  Single
+token queries are answered from the top entries.  Queries with
+several tokens score the entries containing one of the rare tokens
+and the top entries of the frequent tokens, looking up the impacts
+of the frequent tokens by binary search.  When the impacts of the
+frequent tokens below their top entries might add up to more than
+the score of the last entry found, all entries are scored.
+Entries with a sense equal to the query are ranked first.
+
+The index is persisted as marshal file; the posting lists are kept
+as bytes and only cast to arrays when queried.
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import heapq
+import marshal
+import math
+import re
+from array import array
+from bisect import bisect_left
+
+# Version of the index file format
+INDEX_VERSION = 1
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Number of best entries stored for every token
+TOP_SIZE = 64
+
+# Tokens occurring in more entries are only used to rank the entries
+# found by the rarer tokens of a query
+RARE_SIZE = 1024
+
+# Pinyin references like '[ye4 zi5]' are not indexed
+_pinyin_regex = re.compile(r"\[[^\]]*\]")
+_token_regex = re.compile(r"[^\W_]+")
+
+
+class SenseIndexException(Exception):
+    pass
+
+
+def tokenize_sense(sense):
+    """Split SENSE into lower case tokens.
+
+    Example:
+
+    tokenize_sense("(bound form) to practice")
+    > ['bound', 'form', 'to', 'practice']
+
+    """
+
+    return _token_regex.findall(_pinyin_regex.sub(" ", sense).lower())
+
+
+def _normalize_sense(sense):
+    """Normalize SENSE for comparing it with a query."""
+
+    return " ".join(tokenize_sense(sense))
+
+
+def _ids(entry_id_bytes):
+    """View ENTRY_ID_BYTES as array of entry IDs."""
+
+    return memoryview(entry_id_bytes).cast("I")
+
+
+def _posting_length(posting):
+    """The number of entries in the POSTING of a token."""
+
+    return len(posting[0]) // 4
+
+
+class SenseIndex:
+    """An inverted index from sense tokens to entry IDs.
+
+    The entry IDs are those of the EntryTable or EntryFields built
+    from the same cedict file.
+
+    Example:
+
+    fields, _, _ = read_cedict_entry_fields(cedict_filename)
+    index = SenseIndex.from_entry_fields(fields)
+    [fields.get(entry_id) for entry_id in index.search("prince")]
+
+    > ['王子 王子 [wáng zǐ] /prince/son of a king/', ...]
+
+    """
+
+    def __init__(self, postings, exact):
+        # token -> (entry ID bytes, impact bytes, top entry ID bytes)
+        self.postings = postings
+        # normalized sense -> tuple of entry IDs
+        self.exact = exact
+
+    @classmethod
+    def from_senses(cls, entry_senses):
+        """Build the index from ENTRY_SENSES, an iterable over the
+        list of senses of every entry in the order of the entry IDs.
+
+        """
+
+        token_counts = {}
+        exact = {}
+        lengths = []
+        for entry_id, senses in enumerate(entry_senses):
+            length = 0
+            for sense in senses:
+                tokens = tokenize_sense(sense)
+                length += len(tokens)
+
+                for token in tokens:
+                    counts = token_counts.setdefault(token, {})
+                    counts[entry_id] = counts.get(entry_id, 0) + 1
+
+                entry_ids = exact.setdefault(" ".join(tokens), [])
+                if not entry_ids or entry_ids[-1] != entry_id:
+                    entry_ids.append(entry_id)
+
+            lengths.append(length)
+
+        n_entries = len(lengths)
+        average_length = sum(lengths) / n_entries if n_entries else 0.0
+
+        postings = {}
+        for token, counts in token_counts.items():
+            # Inverse document frequency
+            df = len(counts)
+            idf = math.log(1.0 + (n_entries - df + 0.5) / (df + 0.5))
+
+            entry_ids = sorted(counts)
+            impacts = []
+            for entry_id in entry_ids:
+                tf = counts[entry_id]
+                norm = 1.0 - BM25_B + BM25_B * lengths[entry_id] / (
+                    average_length or 1.0
+                )
+                impacts.append(
+                    idf * tf * (BM25_K1 + 1.0) / (tf + BM25_K1 * norm)
+                )
+
+            top = heapq.nsmallest(
+                TOP_SIZE,
+                range(len(entry_ids)),
+                key=lambda i: (-impacts[i], entry_ids[i]),
+            )
+
+            postings[token] = (
+                array("I", entry_ids).tobytes(),
+                array("f", impacts).tobytes(),
+                array("I", [entry_ids[i] for i in top]).tobytes(),
+            )
+
+        exact = {sense: tuple(ids) for sense, ids in exact.items() if sense}
+
+        return cls(postings, exact)
+
+    @classmethod
+    def from_entry_fields(cls, entry_fields):
+        """Build the index from the senses of an EntryFields table."""
+
+        return cls.from_senses(
+            entry_fields.senses(entry_id)
+            for entry_id in range(len(entry_fields))
+        )
+
+    @classmethod
+    def load(cls, filename):
+        """Load the index from the file FILENAME."""
+
+        with open(filename, "rb") as fh:
+            try:
+                data = marshal.load(fh)
+            except (EOFError, ValueError, TypeError) as error:
+                msg = f"{filename} is not a sense index file: {error}"
+                raise SenseIndexException(msg)
+
+        if not isinstance(data, tuple) or data[:2] != (
+            "CEDICT sense index",
+            INDEX_VERSION,
+        ):
+            msg = f"{filename} is not a sense index file!"
+            raise SenseIndexException(msg)
+
+        _, _, postings, exact = data
+
+        return cls(postings, exact)
+
+    def write(self, filename):
+        """Write the index to the file FILENAME."""
+
+        data = ("CEDICT sense index", INDEX_VERSION, self.postings, self.exact)
+
+        with open(filename, "wb") as fh:
+            marshal.dump(data, fh)
+
+    def __len__(self):
+        """The number of distinct tokens."""
+
+        return len(self.postings)
+
+    def search(self, query, limit=10):
+        """Get the IDs of the at most LIMIT entries best matching the
+        English QUERY.
+
+        Entries with a sense equal to QUERY (ignoring case and
+        punctuation) come first, followed by the other entries
+        containing any of the tokens of QUERY ranked by BM25.
+
+        """
+
+        tokens = list(dict.fromkeys(tokenize_sense(query)))
+
+        result = list(self.exact.get(_normalize_sense(query), ())[:limit])
+        if len(result) == limit:
+            return result
+
+        seen = set(result)
+        n_wanted = limit - len(result)
+
+        postings = [
+            self.postings[token] for token in tokens if token in self.postings
+        ]
+        if not postings:
+            return result
+
+        if len(postings) == 1:
+            top = _ids(postings[0][2])
+
+            if n_wanted + len(seen) <= len(top):
+                # Take the best entries of the token
+                ranked = [i for i in top if i not in seen][:n_wanted]
+                return result + ranked
+
+            scores = self._scores(postings)
+
+        else:
+            # Score the entries found by the rare tokens and the top
+            # entries of the frequent tokens
+            # and look up the impacts of the frequent tokens
+            rare = [p for p in postings if _posting_length(p) <= RARE_SIZE]
+            frequent = [p for p in postings if _posting_length(p) > RARE_SIZE]
+
+            scores = self._scores(rare)
+            for _, _, top in frequent:
+                for entry_id in _ids(top):
+                    scores.setdefault(entry_id, 0.0)
+
+            for entry_id, impact in list(self._probe(frequent, scores)):
+                scores[entry_id] += impact
+
+            if not self._is_complete(scores, frequent, seen, n_wanted):
+                # An entry not scored might rank higher - score all
+                scores = self._scores(postings)
+
+        for entry_id in seen:
+            scores.pop(entry_id, None)
+
+        ranked = heapq.nsmallest(
+            n_wanted, scores.items(), key=lambda item: (-item[1], item[0])
+        )
+
+        return result + [entry_id for entry_id, _ in ranked]
+
+    @staticmethod
+    def _is_complete(scores, frequent, seen, n_wanted):
+        """True when no entry missing in SCORES can rank among the best
+        N_WANTED entries of SCORES not in SEEN.
+
+        The entries missing in SCORES only contain FREQUENT tokens and
+        are not among their top entries: their score is at most the
+        sum of the lowest impacts of the top entries of the FREQUENT
+        tokens.
+
+        """
+
+        ranked = heapq.nlargest(
+            n_wanted,
+            (
+                score
+                for entry_id, score in scores.items()
+                if entry_id not in seen
+            ),
+        )
+        if len(ranked) < n_wanted:
+            return False
+
+        bound = 0.0
+        for entry_id_bytes, impact_bytes, top in frequent:
+            entry_ids = _ids(entry_id_bytes)
+            top = _ids(top)
+            if len(top) < len(entry_ids):
+                i = bisect_left(entry_ids, top[-1])
+                bound += memoryview(impact_bytes).cast("f")[i]
+
+        # Entries with the same score are ranked by entry ID
+        return ranked[-1] > bound
+
+    @staticmethod
+    def _scores(postings):
+        """Add up the impacts of the POSTINGS per entry ID."""
+
+        scores = {}
+        for entry_id_bytes, impact_bytes, _ in postings:
+            entry_ids = _ids(entry_id_bytes)
+            impacts = memoryview(impact_bytes).cast("f")
+            for entry_id, impact in zip(entry_ids, impacts):
+                scores[entry_id] = scores.get(entry_id, 0.0) + impact
+
+        return scores
+
+    @staticmethod
+    def _probe(postings, scores):
+        """Yield the pairs (entry_id, impact) of the entries of SCORES
+        which are contained in the POSTINGS.
+
+        """
+
+        for entry_id_bytes, impact_bytes, _ in postings:
+            entry_ids = _ids(entry_id_bytes)
+            impacts = memoryview(impact_bytes).cast("f")
+            n = len(entry_ids)
+            for entry_id in scores:
+                i = bisect_left(entry_ids, entry_id)
+                if i < n and entry_ids[i] == entry_id:
+                    yield entry_id, impacts[i]
+
+
+def load_cedict_sense_index():
+    """Load the sense index of the local CC-CEDICT copy."""
+
+    from glottai.cedict.settings import settings
+
+    return SenseIndex.load(settings.get_cedict_sense_index_file())
@@ -0,0 +1,173 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""src/glottai/cedict/lexer/char_class.py:
+
+The classes of the characters not found in the dictionary.
+
+The class of a character is the value of the token type the lexer
+gives it: NEWLINE, PUNCTUATION, LATIN, DIGIT, WHITESPACE or UNKNOWN.
+The classes of the Basic Multilingual Plane are precomputed into a
+table of one byte per code point when first needed, so that the
+lexer classifies a character with a single indexed lookup.
+
+Which characters are punctuation is configured in the [lexer] section
+of the settings.
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import re
+import unicodedata
+
+from .token import TType
+
+# Code points covered by the table: the Basic Multilingual Plane
+TABLE_SIZE = 0x10000
+
+# Line feed, carriage return, next line and the Unicode line and
+# paragraph separators
+NEWLINE_CHARS = "\n\r\x85\u2028\u2029"
+
+# Runs of characters not found in the dictionary
+# which are lexed as a single token
+RUN_REGEXES = {
+    # Latin letters including the accented letters of pinyin
+    # and the full-width Latin letters
+    TType.LATIN.value: re.compile(
+        r"[A-Za-z\u00c0-\u00d6\u00d8-\u00f6\u00f8-\u024f"
+        r"\uff21-\uff3a\uff41-\uff5a]+"
+    ),
+    # Decimal digits of any script
+    TType.DIGIT.value: re.compile(r"\d+"),
+    # Whitespace except newlines
+    TType.WHITESPACE.value: re.compile(r"[^\S\n\r\x85\u2028\u2029]+"),
+}
+
+# The table of character classes - built by get_char_classes()
+_char_classes = None
+
+# The punctuation configured in the settings:
+# (categories, symbol ranges, extra characters)
+_punctuation = None
+
+
+def _get_punctuation():
+    """Get the punctuation configured in the settings."""
+
+    global _punctuation
+
+    if _punctuation is None:
+        from glottai.cedict.settings import settings
+
+        _punctuation = (
+            frozenset(settings.get_lexer_punctuation_categories()),
+            settings.get_lexer_punctuation_symbol_ranges(),
+            frozenset(settings.get_lexer_punctuation_extra()),
+        )
+
+    return _punctuation
+
+
+def classify_char(char):
+    """Compute the class of CHAR without the table.
+
+    Example:
+
+    TType(classify_char("、"))
+
+    > TType.PUNCTUATION
+
+    """
+
+    if char in NEWLINE_CHARS:
+        return TType.NEWLINE.value
+
+    categories, symbol_ranges, extra = _get_punctuation()
+    category = unicodedata.category(char)
+
+    if category in categories or char in extra:
+        return TType.PUNCTUATION.value
+
+    if category[0] == "S":
+        code_point = ord(char)
+        for first, last in symbol_ranges:
+            if first <= code_point <= last:
+                return TType.PUNCTUATION.value
+
+    for run_class, regex in RUN_REGEXES.items():
+        if regex.fullmatch(char):
+            return run_class
+
+    return TType.UNKNOWN.value
+
+
+def get_char_classes():
+    """Get the table of the classes of the characters of the Basic
+    Multilingual Plane indexed by code point.  The table is built
+    when first needed.
+
+    """
+
+    global _char_classes
+
+    if _char_classes is None:
+        _char_classes = bytearray(
+            classify_char(chr(code_point)) for code_point in range(TABLE_SIZE)
+        )
+
+    return _char_classes
+
+
+def reset_char_classes():
+    """Forget the table of character classes and the punctuation read
+    from the settings, for example after changing the settings.
+
+    Example:
+
+    settings.set("lexer.punctuation-extra", "~")
+    reset_char_classes()
+
+    """
+
+    global _char_classes, _punctuation
+
+    _char_classes = None
+    _punctuation = None
+
+
+def get_char_class(char):
+    """Get the class of CHAR.
+
+    Example:
+
+    get_char_class("\\n") == TType.NEWLINE.value
+
+    > True
+
+    """
+
+    code_point = ord(char)
+    if code_point < TABLE_SIZE:
+        return get_char_classes()[code_point]
+
+    return classify_char(char)
@@ -26,26 +26,91 @@ __copyright__ = "Copyright 2023 Dietrich Bollmann"
 __license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
 __date__ = "2022/12/27"
 
-from .token import Token, TType
+from collections.abc import Mapping
+
+from .char_class import (
+    NEWLINE_CHARS,
+    RUN_REGEXES,
+    TABLE_SIZE,
+    classify_char,
+    get_char_class,
+    get_char_classes,
+)
+from .token import Token, TokenArray, TType
 
 from glottai.cedict.trie import trie_lookup
 
 
 def is_newline(char):
-    return char == "\n"
+    return char in NEWLINE_CHARS
 
 
-_punctuation_chars = "，。"
+def is_punctuation(char):
+    return get_char_class(char) == TType.PUNCTUATION.value
 
 
-def is_punctuation(char):
-    return char in _punctuation_chars
+# The token types indexed by their value
+_ttypes = {ttype.value: ttype for ttype in TType}
+
+_CEDICT = TType.CEDICT.value
+_NEWLINE = TType.NEWLINE.value
+_PUNCTUATION = TType.PUNCTUATION.value
+_UNKNOWN = TType.UNKNOWN.value
+
 
+class LexerException(Exception):
+    pass
 
-def lexer(trie, text, start):
+
+def find_word_start(
+    trie, text, text_length, start, end, lookup=trie_lookup
+):
+    """Find the first position in [START, END) of TEXT where a word of
+    TRIE starts.  Returns END when no word starts there.
+
+    Runs of Latin letters, digits or whitespace end where a word
+    starts, so that words like 'ATM' or 'T恤' are found inside runs
+    like 'myATM' or 'ET恤'.  For dictionary tries, the positions of
+    characters not starting any word are skipped without a lookup.
+
+    """
+
+    first_chars = trie if isinstance(trie, Mapping) else None
+    for position in range(start, end):
+        if first_chars is not None and text[position] not in first_chars:
+            continue
+
+        _, _, word_end = lookup(trie, text, text_length, position)
+        if word_end > position:
+            return position
+
+    return end
+
+
+def lexer(trie, text, start, lookup=trie_lookup, entries=None, end=None):
     """Analyse TEXT into a list of tokens as found in TRIE
     starting at character START.
 
+    When END is given, only the window [START, END) of TEXT is lexed:
+    no token extends beyond END.  The text is not copied; the start and
+    end of the tokens are offsets in the whole TEXT.
+
+    LOOKUP is the function used to find the longest word in TRIE
+    which is a prefix of the remaining text.  It defaults to
+    trie_lookup() for dictionary tries; other trie representations
+    provide their own function with the same signature, for example
+    double_array_lookup() for memory-mapped double-array tries.
+
+    When the values of TRIE are entry IDs, ENTRIES is the EntryTable
+    they refer to; the tokens decode their entries from it on access.
+
+    Characters not starting a word of TRIE become single character
+    tokens, except for runs of Latin letters, digits and whitespace
+    (without newlines) which are lexed as a single LATIN, DIGIT or
+    WHITESPACE token - up to the first word of TRIE starting in the
+    run.  The characters are classified with the table
+    of char_class.py; the punctuation is configured in the settings.
+
     Example:
 
     text = "她叫李叶，是一个不太好看的女孩。"
@@ -90,21 +155,53 @@ def lexer(trie, text, start):
 
     """
 
-    text_length = len(text)
-    start = 0
-    tokens = []
+    return list(
+        iter_tokens(trie, text, start, end, lookup=lookup, entries=entries)
+    )
+
+
+def _window_end(text, start, end):
+    """Check the window [START, END) of TEXT and return its end."""
+
+    text_length = len(text) if end is None else end
+    if not 0 <= start <= text_length <= len(text):
+        msg = (
+            f"Invalid window [{start}, {text_length}) "
+            f"of a text of length {len(text)}"
+        )
+        raise LexerException(msg)
+
+    return text_length
+
+
+def iter_tokens(
+    trie, text, start=0, end=None, lookup=trie_lookup, entries=None
+):
+    """Yield the tokens of the window [START, END) of TEXT as found in
+    TRIE one by one.  END defaults to the end of TEXT.  See lexer()
+    for LOOKUP and ENTRIES.
+
+    Example:
+
+    for token in iter_tokens(trie, text, 100, 200):
+        print(token)
+
+    """
+
+    # The end of the window - used as text length by LOOKUP
+    text_length = _window_end(text, start, end)
+
+    char_classes = get_char_classes()
     while True:
         # Done?
         # When the 'start' index is equal to 'text_length'
-        # the whole text has been processed
+        # the whole window has been processed
         if start == text_length:
             # Done
-            #
-            # Return the list of found tokens
-            return tokens
+            return
 
         # Try to find lonest prefix defined in EDICT
-        word, entry, end = trie_lookup(trie, text, text_length, start)
+        word, entry, end = lookup(trie, text, text_length, start)
 
         if word:
             # Found a longest prefix in EDICT
@@ -114,6 +211,7 @@ def lexer(trie, text, start):
                 entry=entry,
                 start=start,
                 end=end,
+                entries=entries,
             )
 
             # Continue with the next prefix
@@ -125,41 +223,110 @@ def lexer(trie, text, start):
             char = text[start]
             end = start + 1
 
-            if is_newline(char):
-                # Newline character
+            code_point = ord(char)
+            if code_point < TABLE_SIZE:
+                char_class = char_classes[code_point]
+            else:
+                char_class = classify_char(char)
+
+            if char_class == _UNKNOWN:
+                # Unknown token
                 token = Token(
-                    ttype=TType.NEWLINE,
+                    ttype=TType.UNKNOWN,
                     word=char,
-                    entry=f"{char} {char} [{char}] /{char}/",
+                    entry=None,
                     start=start,
                     end=end,
                 )
 
-            elif is_punctuation(char):
-                # Punctuation character
+            elif char_class == _NEWLINE or char_class == _PUNCTUATION:
+                # Newline or punctuation character
                 token = Token(
-                    ttype=TType.PUNCTUATION,
+                    ttype=_ttypes[char_class],
                     word=char,
-                    entry=f"{char} {char} [{char}] /{char}/",
+                    entry=None,
                     start=start,
                     end=end,
                 )
 
             else:
-                # Unknown token
+                # Run of Latin letters, digits or whitespace
+                # ending where a word starts
+                regex = RUN_REGEXES[char_class]
+                end = regex.match(text, start, text_length).end()
+                end = find_word_start(
+                    trie, text, text_length, start + 1, end, lookup
+                )
+                run = text[start:end]
                 token = Token(
-                    ttype=TType.UNKNOWN,
-                    word=char,
-                    entry=f"{char} {char} [{char}] /{char}/",
+                    ttype=_ttypes[char_class],
+                    word=run,
+                    entry=None,
                     start=start,
                     end=end,
                 )
 
-            # Continue with the next character in text
+            # Continue after the token
             start = end
 
-        # Append the found token to the list of tokens
-        tokens.append(token)
+        yield token
+
+
+def lex_array(
+    trie, text, start=0, end=None, lookup=trie_lookup, entries=None
+):
+    """Analyse the window [START, END) of TEXT into a TokenArray of the
+    tokens found in TRIE.  The tokens are the same as those returned by
+    lexer() but only their token types and offsets are stored; their
+    words and entries are resolved from TEXT and TRIE when accessed.
+
+    Example:
+
+    tokens = lex_array(trie, text)
+    print_tokens(tokens[:10])
+
+    """
+
+    text_length = _window_end(text, start, end)
+
+    tokens = TokenArray(trie, text, lookup, entries)
+    ttypes_append = tokens.ttypes.append
+    starts_append = tokens.starts.append
+    ends_append = tokens.ends.append
+
+    char_classes = get_char_classes()
+    while start < text_length:
+        _, _, end = lookup(trie, text, text_length, start)
+
+        if end > start:
+            # Found a longest prefix in EDICT
+            ttype_value = _CEDICT
+
+        else:
+            char = text[start]
+            end = start + 1
+
+            code_point = ord(char)
+            if code_point < TABLE_SIZE:
+                ttype_value = char_classes[code_point]
+            else:
+                ttype_value = classify_char(char)
+
+            regex = RUN_REGEXES.get(ttype_value)
+            if regex is not None:
+                # Run of Latin letters, digits or whitespace
+                # ending where a word starts
+                end = regex.match(text, start, text_length).end()
+                end = find_word_start(
+                    trie, text, text_length, start + 1, end, lookup
+                )
+
+        ttypes_append(ttype_value)
+        starts_append(start)
+        ends_append(end)
+        start = end
+
+    return tokens
 
 
 def print_tokens(tokens, indent=0, varname=None, end="\n", pretty_print=False):
@@ -0,0 +1,205 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""src/glottai/cedict/lexer/parallel.py:
+
+Lex large texts in a pool of worker processes.
+
+The text is split after newlines and sentence-final punctuation where
+no word of the dictionary crosses the split point, so that lexing the
+parts independently gives the same tokens as lexing the whole text.
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import multiprocessing
+import os
+import re
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from .lexer import lex_array
+from .stream import max_key_length
+from .token import TokenArray
+
+from glottai.cedict.trie import trie_lookup
+
+# Texts shorter than this are lexed in the calling process
+MIN_PARALLEL_LENGTH = 1 << 16
+
+# Number of parts per worker, for balancing the load
+PARTS_PER_WORKER = 4
+
+# The characters after which the text may be split
+_split_regex = re.compile(r"[\n。！？]")
+
+# The state of a worker process - set by _init_worker()
+_worker = None
+
+
+class LexParallelException(Exception):
+    pass
+
+
+def _is_split_point(trie, text, position, max_depth, lookup):
+    """True when no word of TRIE starting in the MAX_DEPTH characters
+    before POSITION extends beyond POSITION.
+
+    """
+
+    text_length = len(text)
+    for start in range(max(0, position - max_depth + 1), position):
+        _, _, end = lookup(trie, text, text_length, start)
+        if end > position:
+            return False
+
+    return True
+
+
+def split_points(trie, text, n_parts, max_depth=None, lookup=trie_lookup):
+    """Get the list of at most N_PARTS - 1 positions splitting TEXT
+    into parts of about the same length which can be lexed
+    independently.  The positions follow a newline or a sentence-final
+    punctuation mark ('。', '！', '？') not being part of a word in
+    TRIE.
+
+    """
+
+    if max_depth is None:
+        max_depth = max_key_length(trie)
+
+    positions = []
+    text_length = len(text)
+    for i in range(1, n_parts):
+        search_start = i * text_length // n_parts
+        if positions and search_start < positions[-1]:
+            search_start = positions[-1]
+
+        while True:
+            match = _split_regex.search(text, search_start)
+            if match is None:
+                return positions
+
+            position = match.end()
+            if position < text_length and _is_split_point(
+                trie, text, position, max_depth, lookup
+            ):
+                positions.append(position)
+                break
+
+            search_start = position
+
+    return positions
+
+
+def _init_worker(trie, text, lookup):
+    """Remember the TRIE, the TEXT and the LOOKUP function in the
+    worker process.
+
+    """
+
+    global _worker
+
+    _worker = (trie, text, lookup)
+
+
+def _lex_part(start, end):
+    """Lex the part [START, END) of the text of the worker process.
+
+    Only the columns of the tokens are returned, as they are cheap to
+    send back to the calling process: the bytes of their token type
+    values and the bytes of the array of their end offsets.  Their
+    start offsets follow from START and the end offsets; their words
+    and entries are resolved from the text and the trie when accessed.
+
+    """
+
+    trie, text, lookup = _worker
+
+    tokens = lex_array(trie, text, start, end, lookup=lookup)
+
+    return tokens.ttypes.tobytes(), tokens.ends.tobytes()
+
+
+def lex_parallel(
+    trie, text, workers=None, lookup=trie_lookup, entries=None, max_depth=None
+):
+    """Analyse TEXT into a TokenArray of the tokens found in TRIE using
+    a pool of WORKERS processes (the number of CPUs by default).  The
+    tokens are the same as those returned by lex_array(trie, text, 0,
+    lookup=lookup, entries=entries).
+
+    The text is split at split_points() into parts lexed by the
+    workers.  Where processes can be forked, the workers share the
+    TRIE and the TEXT of the calling process; otherwise they are
+    pickled once per worker.  The workers only send back the token
+    type and offset columns of their tokens, which are joined into
+    the returned TokenArray; no token objects or entries are built or
+    pickled.  Short texts are lexed in the calling process.
+
+    Example:
+
+    with open("novel.txt", encoding="utf-8") as fh:
+        tokens = lex_parallel(trie, fh.read(), workers=8)
+
+    """
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers < 1:
+        msg = f"The number of workers has to be positive: {workers}"
+        raise LexParallelException(msg)
+
+    if workers == 1 or len(text) < MIN_PARALLEL_LENGTH:
+        return lex_array(trie, text, lookup=lookup, entries=entries)
+
+    positions = split_points(
+        trie, text, workers * PARTS_PER_WORKER, max_depth, lookup
+    )
+    bounds = [0] + positions + [len(text)]
+
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+    else:
+        context = multiprocessing.get_context()
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(trie, text, lookup),
+    ) as executor:
+        parts = executor.map(_lex_part, bounds[:-1], bounds[1:])
+
+        tokens = TokenArray(trie, text, lookup, entries)
+        for start, (ttypes, end_bytes) in zip(bounds, parts):
+            ends = array("I")
+            ends.frombytes(end_bytes)
+
+            # Every token starts where the previous one ends
+            starts = array("I", [start])
+            starts.extend(ends[:-1])
+
+            tokens.extend(ttypes, starts[: len(ends)], ends)
+
+    return tokens
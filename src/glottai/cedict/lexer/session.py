@@ -0,0 +1,215 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""src/glottai/cedict/lexer/session.py:
+
+Re-lex a text incrementally after edits.
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+from collections import namedtuple
+
+from .lexer import LexerException, iter_tokens, lexer
+from .stream import max_key_length
+
+from glottai.cedict.trie import trie_lookup
+
+# The tokens replaced by an edit:
+# the tokens [index, index + removed) have been replaced by TOKENS
+Relex = namedtuple("Relex", ["index", "removed", "tokens"])
+
+
+class LexerSession:
+    """The tokens of a text kept up to date while the text is edited.
+
+    After an edit, the text is only lexed again from the last token
+    which might be changed by the edit - a token ending in the
+    MAX_DEPTH characters before the edit, MAX_DEPTH being the length
+    of the longest word in TRIE - until a token starts where a token
+    started before the edit.  The tokens following that point are
+    kept and their offsets shifted lazily: a pending shift is applied
+    to the tokens from an index on and only moved on when the next
+    edit happens elsewhere.  The time needed by an edit depends on the
+    size of the edit and its distance to the previous edit, not on
+    the length of the text.
+
+    Example:
+
+    session = LexerSession(trie, "她叫李叶。")
+    session.edit(3, 1, "华")
+    session.tokens
+
+    """
+
+    def __init__(
+        self, trie, text, lookup=trie_lookup, entries=None, max_depth=None
+    ):
+        self.trie = trie
+        self.text = text
+        self.lookup = lookup
+        self.entries = entries
+        if max_depth is None:
+            max_depth = max_key_length(trie)
+        self.max_depth = max_depth
+
+        self._tokens = lexer(trie, text, 0, lookup=lookup, entries=entries)
+
+        # The offsets of the tokens from index _shift_index on
+        # have to be shifted by _shift
+        self._shift_index = 0
+        self._shift = 0
+
+    def __len__(self):
+        return len(self._tokens)
+
+    @property
+    def tokens(self):
+        """The list of the tokens of the current text."""
+
+        self._apply_shift(len(self._tokens))
+
+        return self._tokens
+
+    def _start(self, i):
+        """The start offset of the token I."""
+
+        start = self._tokens[i].start
+        return start + self._shift if i >= self._shift_index else start
+
+    def _end(self, i):
+        """The end offset of the token I."""
+
+        end = self._tokens[i].end
+        return end + self._shift if i >= self._shift_index else end
+
+    def _apply_shift(self, stop):
+        """Apply the pending shift to the tokens before the index STOP."""
+
+        tokens = self._tokens
+        shift = self._shift
+        if shift:
+            for i in range(self._shift_index, stop):
+                tokens[i].start += shift
+                tokens[i].end += shift
+
+        if stop > self._shift_index:
+            self._shift_index = stop
+
+    def _shift_range(self, begin, stop, shift):
+        """Shift the offsets of the tokens [BEGIN, STOP) by SHIFT."""
+
+        tokens = self._tokens
+        for i in range(begin, stop):
+            tokens[i].start += shift
+            tokens[i].end += shift
+
+    def _first_changed(self, offset):
+        """Find the index of the first token which might be changed by
+        an edit at OFFSET: the first token ending after OFFSET -
+        MAX_DEPTH.
+
+        """
+
+        low, high = 0, len(self._tokens)
+        bound = offset - max(self.max_depth, 1)
+        while low < high:
+            middle = (low + high) // 2
+            if self._end(middle) > bound:
+                high = middle
+            else:
+                low = middle + 1
+
+        return low
+
+    def edit(self, offset, deleted, inserted):
+        """Replace the DELETED characters at OFFSET of the text with
+        the string INSERTED and update the tokens.
+
+        Returns a Relex record: the tokens [index, index + removed) of
+        the previous token list have been replaced by the new tokens.
+
+        """
+
+        text = self.text
+        if offset < 0 or deleted < 0 or offset + deleted > len(text):
+            msg = (
+                f"Invalid edit of {deleted} characters at {offset} "
+                f"in a text of length {len(text)}"
+            )
+            raise LexerException(msg)
+
+        text = text[:offset] + inserted + text[offset + deleted :]
+        delta = len(inserted) - deleted
+
+        # The tokens before FIRST are not changed by the edit
+        tokens = self._tokens
+        n_tokens = len(tokens)
+        first = self._first_changed(offset)
+        if first < n_tokens:
+            start = self._start(first)
+        else:
+            start = self._end(first - 1) if first else 0
+
+        # Lex from START until a token starts after the edit
+        # where an old token started
+        old_edit_end = offset + deleted
+        new_edit_end = offset + len(inserted)
+        new_tokens = []
+        resync = n_tokens
+        k = first
+        for token in iter_tokens(
+            self.trie, text, start, lookup=self.lookup, entries=self.entries
+        ):
+            if token.start >= new_edit_end:
+                while k < n_tokens and self._start(k) + delta < token.start:
+                    k += 1
+
+                if (
+                    k < n_tokens
+                    and self._start(k) + delta == token.start
+                    and self._start(k) >= old_edit_end
+                ):
+                    resync = k
+                    break
+
+            new_tokens.append(token)
+
+        # Move the pending shift behind the new tokens
+        shift_index = self._shift_index
+        if shift_index <= first:
+            # The kept tokens before FIRST get the pending shift now
+            self._apply_shift(first)
+            shift_index = resync
+
+        else:
+            # The kept tokens after RESYNC up to the pending shift
+            # are shifted by DELTA now
+            shift_index = max(shift_index, resync)
+            self._shift_range(resync, shift_index, delta)
+
+        tokens[first:resync] = new_tokens
+        self._shift_index = shift_index - resync + first + len(new_tokens)
+        self._shift += delta
+        self.text = text
+
+        return Relex(first, resync - first, new_tokens)
@@ -0,0 +1,217 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""src/glottai/cedict/lexer/stream.py:
+
+Lex texts read chunk by chunk from a file.
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+from collections.abc import Mapping
+
+from .char_class import RUN_REGEXES
+from .lexer import find_word_start, lexer
+
+from glottai.cedict.trie import trie_lookup
+
+# Number of characters read at once
+CHUNK_SIZE = 1 << 20
+
+
+class LexStreamException(Exception):
+    pass
+
+
+def max_key_length(trie):
+    """Get the length of the longest word in the dictionary TRIE.
+
+    Tries which are no dictionaries can provide the length as
+    attribute 'max_word_length' (see SqliteTrie).  For the other
+    tries - like the double-array, LOUDS and radix tries - the length
+    cannot be computed: the MAX_DEPTH of the functions using it has
+    to be given explicitly.
+
+    """
+
+    max_word_length = getattr(trie, "max_word_length", None)
+    if max_word_length is not None:
+        return max_word_length
+
+    if not isinstance(trie, Mapping):
+        msg = (
+            f"The length of the longest word of a {type(trie).__name__} "
+            "is unknown - please give MAX_DEPTH explicitly"
+        )
+        raise LexStreamException(msg)
+
+    max_length = 0
+    stack = [(trie, 0)]
+    while stack:
+        node, length = stack.pop()
+        if length > max_length:
+            max_length = length
+
+        for char, child in node.items():
+            if char is not True:
+                stack.append((child, length + 1))
+
+    return max_length
+
+
+def iter_lex(
+    trie,
+    fileobj,
+    chunk_size=CHUNK_SIZE,
+    lookup=trie_lookup,
+    entries=None,
+    max_depth=None,
+):
+    """Yield the tokens of the text read from the file object FILEOBJ
+    (opened in text mode) as found in TRIE.  The tokens are the same
+    as those returned by lexer() for the whole text; their start and
+    end are offsets in the whole text.
+
+    The text is read in chunks of CHUNK_SIZE characters.  The tokens
+    of the last MAX_DEPTH characters of a chunk - the length of the
+    longest word in TRIE - might continue in the next chunk: they are
+    lexed again together with the next chunk.  A run of Latin
+    letters, digits or whitespace reaching the end of a chunk is
+    continued with the following chunks without lexing it again.  The
+    memory needed depends on CHUNK_SIZE and the length of the longest
+    token, not on the length of the text.
+
+    MAX_DEPTH is computed from TRIE when not given - see
+    max_key_length() for the tries which need it explicitly.  LOOKUP
+    and ENTRIES are passed on to lexer().
+
+    Example:
+
+    with open("novel.txt", encoding="utf-8") as fh:
+        for token in iter_lex(trie, fh):
+            print(token)
+
+    """
+
+    if max_depth is None:
+        max_depth = max_key_length(trie)
+
+    # The text not lexed yet and its offset in the whole text
+    carry = ""
+    offset = 0
+
+    # The token of a run of Latin letters, digits or whitespace which
+    # might continue after the text read so far and the parts of its
+    # word; CARRY holds the text following the parts
+    run = None
+    run_parts = []
+
+    while True:
+        data = fileobj.read(chunk_size)
+
+        if run is not None:
+            # Continue the run with the text read
+            text = carry + data
+            regex = RUN_REGEXES[run.ttype.value]
+            match = regex.match(text)
+            length = match.end() if match else 0
+
+            # Words are only found reliably where they cannot extend
+            # beyond the text read so far
+            if data:
+                checked = max(0, min(length, len(text) - max_depth))
+            else:
+                checked = length
+
+            end = find_word_start(trie, text, len(text), 0, checked, lookup)
+            if (
+                data
+                and end == checked
+                and (checked < length or length == len(text))
+            ):
+                # The run continues in the text not checked yet
+                run_parts.append(text[:checked])
+                carry = text[checked:]
+                continue
+
+            run_parts.append(text[:end])
+            run.word = "".join(run_parts)
+            run.end = run.start + len(run.word)
+            yield run
+
+            # Lex the rest after the run
+            carry = ""
+            data = text[end:]
+            offset = run.end
+            run = None
+            run_parts = []
+
+        text = carry + data
+        if not text:
+            return
+
+        tokens = lexer(trie, text, 0, lookup=lookup, entries=entries)
+
+        if not data:
+            # End of file: all tokens are final
+            n_final = len(tokens)
+
+        else:
+            # The tokens starting before SAFE are final -
+            # except for runs of Latin letters, digits or whitespace
+            # ending after SAFE: a word might start in their rest
+            safe = len(text) - max_depth
+            n_final = 0
+            for token in tokens:
+                if token.start >= safe or token.end == len(text):
+                    break
+                if token.end > safe and token.ttype.value in RUN_REGEXES:
+                    break
+                n_final += 1
+
+        for token in tokens[:n_final]:
+            token.start += offset
+            token.end += offset
+            yield token
+
+        if not data:
+            return
+
+        if n_final < len(tokens):
+            token = tokens[n_final]
+            if token.start < safe and token.ttype.value in RUN_REGEXES:
+                # A run starting before SAFE: its part before SAFE is
+                # final, only its end is not known yet
+                run_parts = [text[token.start : safe]]
+                carry = text[safe:]
+                token.start += offset
+                run = token
+                continue
+
+            rest = token.start
+
+        else:
+            rest = len(text)
+
+        # Lex the rest again with the next chunk
+        carry = text[rest:]
+        offset += rest
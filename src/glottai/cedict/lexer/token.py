@@ -28,6 +28,7 @@ __license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
 __date__ = "2022/12/27"
 
 
+from array import array
 from enum import Enum
 
 
@@ -36,18 +37,78 @@ class TType(Enum):
     CEDICT = 1
     NEWLINE = 2
     PUNCTUATION = 3
+    LATIN = 4
+    DIGIT = 5
+    WHITESPACE = 6
+
+
+def word_entry(word):
+    """Get the pseudo entry of the token of WORD not found in the
+    dictionary.
+
+    Example:
+
+    word_entry("，")
+
+    > "， ， [，] /，/"
+
+    """
+
+    return f"{word} {word} [{word}] /{word}/"
 
 
 class Token:
-    """ """
+    """A token found by the lexer.
+
+    When an EntryTable is given as ENTRIES, ENTRY is the entry ID (or
+    the tuple of entry IDs) stored in the trie and the entry string
+    is only decoded from the table when the 'entry' attribute is
+    accessed.  With an EntryFields table the pre-parsed fields of the
+    entries are available as the 'fields' attribute.
+
+    The tokens of words not found in the dictionary have no entry:
+    when ENTRY is None, the 'entry' attribute is the pseudo entry
+    "WORD WORD [WORD] /WORD/" formatted when accessed.
 
-    def __init__(self, ttype, word, entry, start, end):
+    """
+
+    __slots__ = ("ttype", "word", "_entry", "entries", "start", "end")
+
+    def __init__(self, ttype, word, entry, start, end, entries=None):
         self.ttype = ttype
         self.word = word
-        self.entry = entry
+        self._entry = entry
+        self.entries = entries
         self.start = start
         self.end = end
 
+    @property
+    def entry(self):
+        if self.entries is not None:
+            return self.entries.get(self._entry)
+
+        if self._entry is None:
+            return word_entry(self.word)
+
+        return self._entry
+
+    @entry.setter
+    def entry(self, entry):
+        self._entry = entry
+        self.entries = None
+
+    @property
+    def fields(self):
+        """The list of Entry records of the token when ENTRIES is an
+        EntryFields table; None otherwise.
+
+        """
+
+        if self.entries is None or not hasattr(self.entries, "get_fields"):
+            return None
+
+        return self.entries.get_fields(self._entry)
+
     def print(self, end="\n"):
         print(f"{self}: {self.entry}", end=end)
 
@@ -95,6 +156,201 @@ class Token:
         )
 
 
+class TokenView(Token):
+    """A token of a TokenArray.
+
+    The attributes of the token are read from the columns of the
+    array when accessed; the word is sliced from the text and the
+    entry looked up in the trie.
+
+    """
+
+    __slots__ = ("_tokens", "_index")
+
+    def __init__(self, tokens, index):
+        self._tokens = tokens
+        self._index = index
+
+    @property
+    def ttype(self):
+        return self._tokens.get_ttype(self._index)
+
+    @property
+    def word(self):
+        return self._tokens.get_word(self._index)
+
+    @property
+    def start(self):
+        return self._tokens.starts[self._index]
+
+    @property
+    def end(self):
+        return self._tokens.ends[self._index]
+
+    @property
+    def entry(self):
+        return self._tokens.get_entry(self._index)
+
+    @property
+    def fields(self):
+        return self._tokens.get_fields(self._index)
+
+
+class TokenArray:
+    """The tokens found by the lexer stored in columns: the values of
+    their token types in an array of bytes and their start and end
+    offsets in arrays of unsigned integers - 9 bytes per token.
+
+    The words and entries are not stored: they are resolved from the
+    TEXT and the TRIE (using LOOKUP) when accessed.  When the values
+    of TRIE are entry IDs, ENTRIES is the EntryTable they refer to.
+
+    Indexing and iterating yield TokenView objects which can be used
+    like the Token objects returned by lexer().
+
+    Example:
+
+    tokens = lex_array(trie, text)
+    print_tokens(tokens)
+
+    """
+
+    def __init__(self, trie, text, lookup, entries=None):
+        self.trie = trie
+        self.text = text
+        self.lookup = lookup
+        self.entries = entries
+
+        self.ttypes = array("B")
+        self.starts = array("I")
+        self.ends = array("I")
+
+    def append(self, ttype_value, start, end):
+        """Append the token [START, END) of the type with the value
+        TTYPE_VALUE.
+
+        """
+
+        self.ttypes.append(ttype_value)
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def extend(self, ttypes, starts, ends):
+        """Append the tokens given by the columns TTYPES (bytes of token
+        type values), STARTS and ENDS (arrays of offsets).
+
+        """
+
+        self.ttypes.frombytes(ttypes)
+        self.starts.extend(starts)
+        self.ends.extend(ends)
+
+    def __len__(self):
+        return len(self.ttypes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [
+                TokenView(self, i) for i in range(*index.indices(len(self)))
+            ]
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("TokenArray index out of range")
+
+        return TokenView(self, index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield TokenView(self, index)
+
+    def get_ttype(self, index):
+        """Get the token type of the token INDEX."""
+
+        return _ttypes[self.ttypes[index]]
+
+    def get_word(self, index):
+        """Get the word of the token INDEX."""
+
+        return self.text[self.starts[index] : self.ends[index]]
+
+    def get_value(self, index):
+        """Get the value stored in the trie for the token INDEX - None
+        for tokens not found in the dictionary.
+
+        """
+
+        if self.ttypes[index] != _CEDICT:
+            return None
+
+        start = self.starts[index]
+        end = self.ends[index]
+        _, value, _ = self.lookup(self.trie, self.text, end, start)
+
+        return value
+
+    def get_entry(self, index):
+        """Get the entry of the token INDEX."""
+
+        if self.ttypes[index] != _CEDICT:
+            return word_entry(self.get_word(index))
+
+        value = self.get_value(index)
+        if self.entries is not None:
+            return self.entries.get(value)
+
+        return value
+
+    def get_fields(self, index):
+        """Get the list of Entry records of the token INDEX when
+        ENTRIES is an EntryFields table; None otherwise.
+
+        """
+
+        if self.entries is None or not hasattr(self.entries, "get_fields"):
+            return None
+
+        if self.ttypes[index] != _CEDICT:
+            return None
+
+        return self.entries.get_fields(self.get_value(index))
+
+    def to_list(self):
+        """Get the list of the Token objects of the array - the same as
+        returned by lexer().
+
+        """
+
+        tokens = []
+        for index in range(len(self)):
+            if self.ttypes[index] == _CEDICT:
+                entry = self.get_value(index)
+                entries = self.entries
+            else:
+                entry = None
+                entries = None
+
+            token = Token(
+                ttype=self.get_ttype(index),
+                word=self.get_word(index),
+                entry=entry,
+                start=self.starts[index],
+                end=self.ends[index],
+                entries=entries,
+            )
+            tokens.append(token)
+
+        return tokens
+
+
+# The token types indexed by their value
+_ttypes = {ttype.value: ttype for ttype in TType}
+
+_CEDICT = TType.CEDICT.value
+
+
 def pretty_print_token_list(token_list, varname=None, indent=0, end="\n"):
     """ """
 
@@ -254,3 +254,78 @@ def tone_numbers_to_marks_string(string):
 
     # Reassemble the string
     return "{}[{}]{}".format(pre, pinyin, rest)
+
+
+# Tone marked vowels mapped to the pairs (vowel, tone)
+_tone_marked_vowels = {
+    marked: (vowel, tone)
+    for vowel, marks in [
+        ("a", "āáǎà"),
+        ("e", "ēéěè"),
+        ("i", "īíǐì"),
+        ("o", "ōóǒò"),
+        ("u", "ūúǔù"),
+        ("ü", "ǖǘǚǜ"),
+        ("A", "ĀÁǍÀ"),
+        ("E", "ĒÉĚÈ"),
+        ("I", "ĪÍǏÌ"),
+        ("O", "ŌÓǑÒ"),
+        ("U", "ŪÚǓÙ"),
+        ("Ü", "ǕǗǙǛ"),
+    ]
+    for tone, marked in enumerate(marks, 1)
+}
+
+
+def split_tone_mark(char):
+    """
+    Split a tone marked vowel CHAR into the vowel and the tone.
+    Return None when CHAR has no tone mark.
+
+    Example:
+
+    'ǎ' -> ('a', 3)
+    'a' -> None
+    """
+
+    return _tone_marked_vowels.get(char)
+
+
+def tone_marks_to_numbers_syllable(syllable):
+    """
+    Tone marks to tone numbers for a single syllable.
+
+    'u:' is written as 'ü' like in tone_numbers_to_marks_syllable().
+    Syllables without tone mark are returned without tone number, as
+    the neutral tone cannot be distinguished from a missing tone.
+
+    Example:
+
+    'wáng' -> 'wang2'
+    'nu:è' -> 'nüe4'
+    'you'  -> 'you'
+    """
+
+    # Allow for 'ü' to be written as 'u:'
+    syllable = syllable.replace("u:", "ü")
+
+    for i, char in enumerate(syllable):
+        if char in _tone_marked_vowels:
+            vowel, tone = _tone_marked_vowels[char]
+            return f"{syllable[:i]}{vowel}{syllable[i + 1:]}{tone}"
+
+    return syllable
+
+
+def tone_marks_to_numbers(word):
+    """
+    Tone marks to tone numbers.
+
+    Example:
+
+    'jiāo péng you' -> 'jiao1 peng2 you'
+    """
+
+    return " ".join(
+        tone_marks_to_numbers_syllable(syllable) for syllable in word.split()
+    )
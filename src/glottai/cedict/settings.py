@@ -308,6 +308,74 @@ class Settings:
             print("Only 'traditional' or 'simplified' are defined.")
             sys.exit(1)
 
+    def get_cedict_trie_da_file(self, form="traditional"):
+        """Get the file path of the memory-mapped double-array
+        CC-CEDICT trie file for simplified or traditional hanzi.
+
+        Use the parameter 'form' with either 'traditional' (this is
+        the default) or 'simplified' as value to get the respective
+        version.
+
+        """
+
+        # Assert that FORM is either 'traditional' or 'simplified'
+        self.assert_hanzi_form(form)
+
+        cedict_dir = self.get_cedict_dir()
+        cedict_trie_da_file = settings.get(f"local.cedict-trie-{form}-da-file")
+        cedict_trie_da_file_path = cedict_dir / cedict_trie_da_file
+
+        return cedict_trie_da_file_path
+
+    def get_cedict_entry_fields_file(self):
+        """Get the file path of the memory-mapped table of pre-parsed
+        CC-CEDICT entry fields.
+
+        """
+
+        cedict_dir = self.get_cedict_dir()
+        cedict_entry_fields_file = settings.get(
+            "local.cedict-entry-fields-file"
+        )
+        cedict_entry_fields_file_path = cedict_dir / cedict_entry_fields_file
+
+        return cedict_entry_fields_file_path
+
+    def get_cedict_sqlite_file(self):
+        """Get the file path of the CC-CEDICT SQLite database."""
+
+        cedict_dir = self.get_cedict_dir()
+        cedict_sqlite_file = settings.get("local.cedict-sqlite-file")
+        cedict_sqlite_file_path = cedict_dir / cedict_sqlite_file
+
+        return cedict_sqlite_file_path
+
+    def get_cedict_sense_index_file(self):
+        """Get the file path of the inverted index over the senses of
+        the CC-CEDICT entries.
+
+        """
+
+        cedict_dir = self.get_cedict_dir()
+        cedict_sense_index_file = settings.get("local.cedict-sense-index-file")
+        cedict_sense_index_file_path = cedict_dir / cedict_sense_index_file
+
+        return cedict_sense_index_file_path
+
+    def get_cedict_pinyin_index_file(self):
+        """Get the file path of the index of the CC-CEDICT entries by
+        their pinyin.
+
+        """
+
+        cedict_dir = self.get_cedict_dir()
+        cedict_pinyin_index_file = settings.get(
+            "local.cedict-pinyin-index-file"
+        )
+        cedict_pinyin_index_file_path = cedict_dir / cedict_pinyin_index_file
+
+        return cedict_pinyin_index_file_path
+
     def get_number_of_backups(self):
         """Get the number of CC-CEDICT backups which should be available."""
 
@@ -326,6 +394,41 @@ class Settings:
 
         return hanzi_default_form
 
+    def get_lexer_punctuation_categories(self):
+        """Get the list of the Unicode general categories of the
+        characters lexed as punctuation.
+
+        """
+
+        punctuation_categories = settings.get("lexer.punctuation-categories")
+
+        return list(punctuation_categories or [])
+
+    def get_lexer_punctuation_symbol_ranges(self):
+        """Get the list of the code point ranges [first, last] whose
+        symbols are lexed as punctuation.
+
+        """
+
+        punctuation_symbol_ranges = settings.get(
+            "lexer.punctuation-symbol-ranges"
+        )
+
+        return [
+            (int(first), int(last))
+            for first, last in punctuation_symbol_ranges or []
+        ]
+
+    def get_lexer_punctuation_extra(self):
+        """Get the string of the further characters lexed as
+        punctuation.
+
+        """
+
+        punctuation_extra = settings.get("lexer.punctuation-extra")
+
+        return punctuation_extra or ""
+
     def get_formatting_columns_settings(self):
         """Get the settings controlling the formatting of CC-CEDICT
         entries and assert that it has an adequate value.
@@ -0,0 +1,261 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""src/glottai/cedict/trie/double_array/build.py:
+
+Build a double-array trie from a dictionary trie
+and write it to a binary file which can be memory-mapped.
+
+File layout (native byte order):
+
+    magic                  b"CEDICTDA"
+    header                 uint32[6]: format version, byte order mark,
+                           number of cells, number of entries,
+                           size of the variables and alphabet sections
+    variables              JSON encoded CEDICT_variables (UTF-8)
+    alphabet               all characters used in keys (UTF-8)
+    padding                to a multiple of 4 bytes
+    base                   int32[number of cells]
+    check                  int32[number of cells]
+    offsets                uint32[number of entries + 1]
+    entries                UTF-8 encoded entries
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import json
+import struct
+from array import array
+
+MAGIC = b"CEDICTDA"
+FORMAT_VERSION = 1
+BYTE_ORDER_MARK = 0x01020304
+
+# Format of the header following the magic bytes
+HEADER_FORMAT = "=6I"
+
+# check[] value of unused cells
+FREE = -1
+
+# check[] value of the root cell
+ROOT = -2
+
+# End of the list of free cells
+NONE = -1
+
+# Number of free cells tried in a search for a base value before
+# the preceding free cells are skipped in all further searches
+MAX_TRIES = 64
+
+
+def build_double_array(trie):
+    """Build a double-array representation of the dictionary TRIE
+    as produced by trie_insert().
+
+    Returns the tuple (alphabet, base, check, entries) where
+
+    - ALPHABET is a string with all characters used in keys.  The
+      character ALPHABET[i] is encoded with the code i + 1; the code 0
+      is reserved for the terminal transition leading to an entry.
+    - BASE and CHECK are the double-array lists.  A transition from
+      cell S with code C leads to cell T = BASE[S] + C when
+      CHECK[T] == S.  The root is cell 0.
+    - ENTRIES is the list of entry strings.  A cell S with an entry
+      either has a negative BASE[S] = -(entry index + 1), when it has
+      no further children, or a terminal child T = BASE[S] + 0 with
+      BASE[T] = -(entry index + 1).
+
+    """
+
+    # Collect the alphabet
+    chars = set()
+    stack = [trie]
+    while stack:
+        node = stack.pop()
+        for key, value in node.items():
+            if key is not True:
+                chars.add(key)
+                stack.append(value)
+
+    alphabet = "".join(sorted(chars))
+    codes = {char: code for code, char in enumerate(alphabet, 1)}
+
+    base = [0]
+    check = [ROOT]
+    entries = []
+
+    # The free cells form a doubly linked list ordered by index.
+    # The search for a free base value starts at HEAD; cells beyond
+    # the end of the arrays are free as well.
+    next_free = [NONE]
+    prev_free = [NONE]
+    head = NONE
+    tail = NONE
+
+    def extend(size):
+        """Extend the arrays to SIZE cells adding them to the free
+        list.
+
+        """
+
+        nonlocal head, tail
+
+        for t in range(len(check), size):
+            base.append(0)
+            check.append(FREE)
+            next_free.append(NONE)
+            prev_free.append(tail)
+            if tail == NONE:
+                head = t
+            else:
+                next_free[tail] = t
+            tail = t
+
+    def occupy(t, parent):
+        """Mark cell T as used by a transition from PARENT."""
+
+        nonlocal head, tail
+
+        check[t] = parent
+        prev, next = prev_free[t], next_free[t]
+        if prev != NONE:
+            next_free[prev] = next
+        if next != NONE:
+            prev_free[next] = prev
+        if head == t:
+            head = next
+        if tail == t:
+            tail = prev
+
+    queue = [(trie, 0)]
+    for node, index in queue:
+        # An empty trie is a single root cell without transitions
+        if not node:
+            continue
+
+        # Nodes without children store their entry directly
+        if len(node) == 1 and True in node:
+            base[index] = -(len(entries) + 1)
+            entries.append(node[True])
+            continue
+
+        # Codes of the transitions leaving the node
+        children = sorted(
+            (0 if key is True else codes[key], value)
+            for key, value in node.items()
+        )
+        node_codes = [code for code, _ in children]
+        lowest = node_codes[0]
+
+        # Find the first base value for which all transitions
+        # lead to free cells.  Try the free cells in order;
+        # when none of them fits, use the cells beyond the end.
+        size = len(check)
+        position = head
+        tries = 0
+        while position != NONE:
+            b = position - lowest
+            if b > 0:
+                for code in node_codes:
+                    t = b + code
+                    if t < size and check[t] != FREE:
+                        break
+                else:
+                    break
+
+            position = next_free[position]
+            tries += 1
+
+            # Densely used regions are skipped in further searches
+            if tries == MAX_TRIES:
+                head = position
+
+        if position == NONE:
+            b = max(size, lowest + 1) - lowest
+
+        # Make sure the arrays are large enough
+        extend(b + node_codes[-1] + 1)
+
+        # Occupy the cells
+        base[index] = b
+        for code, value in children:
+            t = b + code
+            occupy(t, index)
+            if code == 0:
+                base[t] = -(len(entries) + 1)
+                entries.append(value)
+            else:
+                queue.append((value, t))
+
+    return alphabet, base, check, entries
+
+
+def write_double_array_trie_to_file(filename, variables, trie):
+    """Build the double-array representation of TRIE and write it
+    together with the CC-CEDICT VARIABLES to the binary file FILENAME.
+
+    """
+
+    alphabet, base, check, entries = build_double_array(trie)
+
+    variables_json = json.dumps(variables, ensure_ascii=False)
+    variables_bytes = variables_json.encode("utf-8")
+    alphabet_bytes = alphabet.encode("utf-8")
+
+    # Encode the entries and calculate their offsets
+    entry_bytes = [entry.encode("utf-8") for entry in entries]
+    offsets = array("I", [0])
+    position = 0
+    for data in entry_bytes:
+        position += len(data)
+        offsets.append(position)
+
+    header = struct.pack(
+        HEADER_FORMAT,
+        FORMAT_VERSION,
+        BYTE_ORDER_MARK,
+        len(check),
+        len(entries),
+        len(variables_bytes),
+        len(alphabet_bytes),
+    )
+
+    with open(filename, "wb") as fh:
+        fh.write(MAGIC)
+        fh.write(header)
+        fh.write(variables_bytes)
+        fh.write(alphabet_bytes)
+
+        # Align the arrays to 4 bytes
+        size = (
+            len(MAGIC)
+            + len(header)
+            + len(variables_bytes)
+            + len(alphabet_bytes)
+        )
+        fh.write(b"\0" * (-size % 4))
+
+        fh.write(array("i", base).tobytes())
+        fh.write(array("i", check).tobytes())
+        fh.write(offsets.tobytes())
+        for data in entry_bytes:
+            fh.write(data)
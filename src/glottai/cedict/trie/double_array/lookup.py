@@ -0,0 +1,228 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""src/glottai/cedict/trie/double_array/lookup.py:
+
+Open memory-mapped double-array trie files
+and look up words in them.
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import json
+import mmap
+import struct
+
+from .build import BYTE_ORDER_MARK, FORMAT_VERSION, HEADER_FORMAT, MAGIC
+
+
+class DoubleArrayTrieException(Exception):
+    pass
+
+
+class DoubleArrayTrie:
+    """A double-array trie memory-mapped from a file written by
+    write_double_array_trie_to_file().
+
+    Opening the file only parses the small header; the base, check
+    and entry arrays are used in place.  All processes opening the
+    same file share a single copy of it in the page cache.
+
+    Example:
+
+    with DoubleArrayTrie("~/.cedict/cedict_trie_simplified.da") as trie:
+        tokens = lexer(trie, text, 0, lookup=double_array_lookup)
+
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+
+        with open(filename, "rb") as fh:
+            self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._parse()
+
+        except Exception:
+            self.close()
+            raise
+
+    def _parse(self):
+        """Parse the header and map the arrays."""
+
+        with memoryview(self._mmap) as data:
+            if bytes(data[: len(MAGIC)]) != MAGIC:
+                msg = f"{self.filename} is not a double-array trie file!"
+                raise DoubleArrayTrieException(msg)
+
+            position = len(MAGIC)
+            header_size = struct.calcsize(HEADER_FORMAT)
+            (
+                version,
+                byte_order_mark,
+                n_cells,
+                n_entries,
+                variables_size,
+                alphabet_size,
+            ) = struct.unpack(
+                HEADER_FORMAT, data[position : position + header_size]
+            )
+            position += header_size
+
+            if version != FORMAT_VERSION:
+                msg = (
+                    f"Unsupported double-array trie format version {version} "
+                    f"in {self.filename}!"
+                )
+                raise DoubleArrayTrieException(msg)
+
+            if byte_order_mark != BYTE_ORDER_MARK:
+                msg = (
+                    f"{self.filename} has been written "
+                    "on a machine with a different byte order!"
+                )
+                raise DoubleArrayTrieException(msg)
+
+            variables = data[position : position + variables_size]
+            self.variables = json.loads(str(variables, "utf-8"))
+            position += variables_size
+
+            alphabet = str(data[position : position + alphabet_size], "utf-8")
+            self.codes = {char: code for code, char in enumerate(alphabet, 1)}
+            position += alphabet_size
+            position += -position % 4
+
+            def array_view(format, length):
+                nonlocal position
+                size = 4 * length
+                view = data[position : position + size].cast(format)
+                position += size
+                return view
+
+            self.base = array_view("i", n_cells)
+            self.check = array_view("i", n_cells)
+            self.offsets = array_view("I", n_entries + 1)
+            self.entries = data[position:]
+
+    def close(self):
+        """Release the arrays and unmap the file."""
+
+        for name in ["base", "check", "offsets", "entries"]:
+            view = self.__dict__.pop(name, None)
+            if view is not None:
+                view.release()
+
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        """The number of entries."""
+        return len(self.offsets) - 1
+
+    def entry(self, index):
+        """Decode the entry with the given INDEX."""
+
+        offsets = self.offsets
+        return str(self.entries[offsets[index] : offsets[index + 1]], "utf-8")
+
+    def lookup(self, text, text_length, start):
+        """Find the longest prefix of TEXT starting at START.
+        See double_array_lookup().
+
+        """
+
+        return double_array_lookup(self, text, text_length, start)
+
+
+def double_array_lookup(trie, text, text_length, start):
+    """Find the longest word in the double-array TRIE which is a
+    prefix of TEXT[START:TEXT_LENGTH].
+
+    The function can be used in place of trie_lookup(): it returns
+    the tuple (word, entry, end) for the longest word found and
+    (None, None, START) when no word has been found.
+
+    """
+
+    codes = trie.codes
+    base = trie.base
+    check = trie.check
+    n_cells = len(check)
+
+    found = -1
+    end = start
+
+    state = 0
+    b = base[0]
+    i = start
+    while i < text_length:
+        code = codes.get(text[i])
+        if code is None:
+            break
+
+        # Follow the transition
+        t = b + code
+        if t >= n_cells or check[t] != state:
+            break
+
+        state = t
+        b = base[state]
+        i += 1
+
+        if b < 0:
+            # A leaf storing its entry directly
+            found = -b - 1
+            end = i
+            break
+
+        if b < n_cells and check[b] == state:
+            # A node with a terminal transition
+            found = -base[b] - 1
+            end = i
+
+    if found < 0:
+        return None, None, start
+
+    return text[start:end], trie.entry(found), end
+
+
+def load_double_array_trie(form=None):
+    """Open the double-array CC-CEDICT trie for the hanzi FORM
+    ('traditional' or 'simplified').  When no FORM is given, the
+    default form from the settings is used.
+
+    """
+
+    from glottai.cedict.settings import settings
+
+    if form is None:
+        form = settings.get_hanzi_default_form()
+
+    filename = settings.get_cedict_trie_da_file(form)
+
+    return DoubleArrayTrie(filename)
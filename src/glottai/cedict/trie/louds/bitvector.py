@@ -0,0 +1,205 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""src/glottai/cedict/trie/louds/bitvector.py:
+
+A static bit vector with rank and select directories.
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+from array import array
+from bisect import bisect_left
+
+WORD_SIZE = 64
+
+# Every SELECT_SAMPLE_RATE-th one (zero) the index of the word
+# containing it is stored in the select directory
+SELECT_SAMPLE_RATE = 512
+
+
+def _select_in_word(word, k):
+    """Return the position of the K-th (1-based) set bit in WORD."""
+
+    for _ in range(k - 1):
+        # Clear the lowest set bit
+        word &= word - 1
+
+    return (word & -word).bit_length() - 1
+
+
+class BitVector:
+    """A static bit vector supporting
+
+    - rank1(i): the number of ones in the positions [0, i),
+    - select1(k) / select0(k): the position of the k-th (1-based)
+      one / zero.
+
+    The bits are stored in 64 bit words.  The rank directory stores
+    the number of ones before each word, the select directories store
+    the word index of every 512th one and zero.  All directories are
+    arrays of unsigned integers; together they add about 50% to the
+    size of the bits.
+
+    Example:
+
+    bv = BitVector([1, 0, 1, 1, 0])
+    bv.rank1(3)   > 2
+    bv.select1(2) > 2
+    bv.select0(2) > 4
+
+    """
+
+    def __init__(self, bits):
+        bits = list(bits)
+        self.size = len(bits)
+
+        # Pack the bits into words
+        words = array("Q")
+        for offset in range(0, self.size, WORD_SIZE):
+            word = 0
+            for shift, bit in enumerate(bits[offset : offset + WORD_SIZE]):
+                if bit:
+                    word |= 1 << shift
+            words.append(word)
+        self.words = words
+
+        # Rank directory:
+        # ranks[k] is the number of ones in words[0:k]
+        ranks = array("I", [0])
+        ones = 0
+        for word in words:
+            ones += word.bit_count()
+            ranks.append(ones)
+        self.ranks = ranks
+        self.ones = ones
+        self.zeros = self.size - ones
+
+        # Select directories:
+        # The index of the word containing
+        # the (j * SELECT_SAMPLE_RATE + 1)-th one (zero)
+        select1_samples = array("I")
+        select0_samples = array("I")
+        for k, after in enumerate(ranks[1:]):
+            while len(select1_samples) * SELECT_SAMPLE_RATE < after:
+                select1_samples.append(k)
+
+            zeros_after = min((k + 1) * WORD_SIZE, self.size) - after
+            while len(select0_samples) * SELECT_SAMPLE_RATE < zeros_after:
+                select0_samples.append(k)
+        self.select1_samples = select1_samples
+        self.select0_samples = select0_samples
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, i):
+        return (self.words[i >> 6] >> (i & 63)) & 1
+
+    def rank1(self, i):
+        """Return the number of ones in the positions [0, I)."""
+
+        k = i >> 6
+        r = self.ranks[k]
+        shift = i & 63
+        if shift:
+            r += (self.words[k] & ((1 << shift) - 1)).bit_count()
+        return r
+
+    def rank0(self, i):
+        """Return the number of zeros in the positions [0, I)."""
+        return i - self.rank1(i)
+
+    def select1(self, k):
+        """Return the position of the K-th (1-based) one."""
+
+        ranks = self.ranks
+        samples = self.select1_samples
+
+        # Narrow down the search using the select directory
+        j = (k - 1) // SELECT_SAMPLE_RATE
+        lo = samples[j]
+        hi = samples[j + 1] + 1 if j + 1 < len(samples) else len(ranks) - 1
+
+        # Find the word containing the K-th one
+        w = bisect_left(ranks, k, lo + 1, hi + 1) - 1
+
+        return (w << 6) + _select_in_word(self.words[w], k - ranks[w])
+
+    def select0(self, k):
+        """Return the position of the K-th (1-based) zero."""
+
+        ranks = self.ranks
+        samples = self.select0_samples
+
+        # Narrow down the search using the select directory
+        j = (k - 1) // SELECT_SAMPLE_RATE
+        lo = samples[j]
+        hi = samples[j + 1] + 1 if j + 1 < len(samples) else len(ranks) - 1
+
+        # Find the word containing the K-th zero
+        # by binary search over the zeros before each word
+        while lo < hi:
+            mid = (lo + hi + 1) >> 1
+            if (mid << 6) - ranks[mid] < k:
+                lo = mid
+            else:
+                hi = mid - 1
+
+        zeros_before = (lo << 6) - ranks[lo]
+        inverted = ~self.words[lo] & 0xFFFFFFFFFFFFFFFF
+
+        return (lo << 6) + _select_in_word(inverted, k - zeros_before)
+
+    def next_zero(self, i):
+        """Return the position of the first zero at or after I.
+
+        When there is no zero at or after I, the size of the bit
+        vector is returned.
+
+        """
+
+        words = self.words
+        k = i >> 6
+        inverted = ~words[k] & (-1 << (i & 63)) & 0xFFFFFFFFFFFFFFFF
+        while not inverted:
+            k += 1
+            if k == len(words):
+                return self.size
+            inverted = ~words[k] & 0xFFFFFFFFFFFFFFFF
+
+        i = (k << 6) + (inverted & -inverted).bit_length() - 1
+
+        return min(i, self.size)
+
+    def memory_size(self):
+        """The number of bytes used by the bits and the directories."""
+
+        return sum(
+            data.itemsize * len(data)
+            for data in [
+                self.words,
+                self.ranks,
+                self.select1_samples,
+                self.select0_samples,
+            ]
+        )
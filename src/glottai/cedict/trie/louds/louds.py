@@ -0,0 +1,278 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""src/glottai/cedict/trie/louds/louds.py:
+
+A succinct trie using the LOUDS (level-order unary degree sequence)
+encoding of its topology.
+
+The nodes are numbered in breadth-first order, the root being node
+0.  The topology is stored in a single bit vector: after the bits
+'10' representing a virtual super root, each node in turn
+contributes one '1' per child followed by a '0'.  With the rank and
+select directories of the bit vector the children of node V are the
+nodes
+
+    first = select0(V + 1) - V,  ...,  first + degree - 1
+
+where degree is the number of ones following the (V + 1)-th zero.
+The label of the edge leading to node V is LABELS[V]; the labels of
+the children of a node are sorted, so the child for a given
+character is found by binary search.  A second bit vector marks the
+nodes representing words; the entry of a word node V is the
+rank1(V)-th entry of the entry table.
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+from array import array
+from bisect import bisect_left
+
+from .bitvector import BitVector
+
+
+class LoudsTrie:
+    """A succinct trie built from (key, value) pairs.
+
+    The pairs are the same as those inserted with trie_insert();
+    several values for the same key are joined with '\\n'.
+
+    Example:
+
+    trie = LoudsTrie([('word', 'word-entry'), ('wo', 'wo-entry')])
+
+    louds_lookup(trie, 'words', 5, 0)
+    > ('word', 'word-entry', 4)
+
+    list(trie.prefix_items('wo'))
+    > [('wo', 'wo-entry'), ('word', 'word-entry')]
+
+    """
+
+    def __init__(self, items):
+        # Merge the values of identical keys
+        values = {}
+        for key, value in items:
+            if key in values:
+                values[key] += "\n" + value
+            else:
+                values[key] = value
+
+        keys = sorted(values)
+
+        bits = [1, 0]
+        # The root has no label
+        labels = ["\0"]
+        terminal = []
+        entries = []
+
+        # Breadth-first traversal of the implicit trie:
+        # Each node is represented by the range of sorted keys
+        # [lo, hi) sharing its prefix of length DEPTH.
+        queue = [(0, len(keys), 0)]
+        for lo, hi, depth in queue:
+            # The shortest key comes first;
+            # it represents a word when its length equals DEPTH
+            if lo < hi and len(keys[lo]) == depth:
+                terminal.append(1)
+                entries.append(values[keys[lo]])
+                lo += 1
+            else:
+                terminal.append(0)
+
+            # Group the remaining keys by their next character
+            i = lo
+            while i < hi:
+                char = keys[i][depth]
+                j = i + 1
+                while j < hi and keys[j][depth] == char:
+                    j += 1
+
+                queue.append((i, j, depth + 1))
+                labels.append(char)
+                bits.append(1)
+                i = j
+
+            bits.append(0)
+
+        self.louds = BitVector(bits)
+        self.labels = "".join(labels)
+        self.terminal = BitVector(terminal)
+
+        # Entry table: UTF-8 encoded entries and their offsets
+        data = [entry.encode("utf-8") for entry in entries]
+        offsets = array("I", [0])
+        position = 0
+        for entry_bytes in data:
+            position += len(entry_bytes)
+            offsets.append(position)
+        self.offsets = offsets
+        self.entries = b"".join(data)
+
+    def __len__(self):
+        """The number of words."""
+        return len(self.offsets) - 1
+
+    def entry(self, index):
+        """Decode the entry with the given INDEX."""
+
+        offsets = self.offsets
+        return self.entries[offsets[index] : offsets[index + 1]].decode()
+
+    def children(self, node):
+        """Return the range of the children of NODE."""
+
+        # Position of the zero preceding the ones of NODE
+        position = self.louds.select0(node + 1)
+        degree = self.louds.next_zero(position + 1) - position - 1
+        first = position - node
+
+        return first, first + degree
+
+    def child(self, node, char):
+        """Return the child of NODE reached with CHAR
+        or None when there is no such child.
+
+        """
+
+        first, end = self.children(node)
+        i = bisect_left(self.labels, char, first, end)
+        if i < end and self.labels[i] == char:
+            return i
+
+        return None
+
+    def node_entry(self, node):
+        """Return the entry of the word represented by NODE
+        or None when NODE does not represent a word.
+
+        """
+
+        if self.terminal[node]:
+            return self.entry(self.terminal.rank1(node))
+
+        return None
+
+    def find(self, key):
+        """Return the node representing KEY
+        or None when KEY is not a prefix of any word.
+
+        """
+
+        node = 0
+        for char in key:
+            node = self.child(node, char)
+            if node is None:
+                return None
+
+        return node
+
+    def __contains__(self, key):
+        node = self.find(key)
+        return node is not None and self.terminal[node] == 1
+
+    def __getitem__(self, key):
+        node = self.find(key)
+        entry = None if node is None else self.node_entry(node)
+        if entry is None:
+            raise KeyError(key)
+
+        return entry
+
+    def prefix_items(self, prefix=""):
+        """Iterate in key order over the (word, entry) pairs of all
+        words starting with PREFIX.
+
+        """
+
+        node = self.find(prefix)
+        if node is None:
+            return
+
+        labels = self.labels
+
+        # Depth first traversal
+        # The stack holds (node, word) pairs
+        stack = [(node, prefix)]
+        while stack:
+            node, word = stack.pop()
+
+            entry = self.node_entry(node)
+            if entry is not None:
+                yield word, entry
+
+            # Push the children in reverse order
+            # to visit them in label order
+            first, end = self.children(node)
+            for child in range(end - 1, first - 1, -1):
+                stack.append((child, word + labels[child]))
+
+    def memory_size(self):
+        """The number of bytes used by the topology, the labels and
+        the entry table.
+
+        """
+
+        # The labels are stored with 2 bytes per character
+        # unless characters outside the BMP occur
+        width = 4 if self.labels and ord(max(self.labels)) > 0xFFFF else 2
+        labels_size = width * len(self.labels)
+
+        return (
+            self.louds.memory_size()
+            + self.terminal.memory_size()
+            + labels_size
+            + self.offsets.itemsize * len(self.offsets)
+            + len(self.entries)
+        )
+
+
+def louds_lookup(trie, text, text_length, start):
+    """Find the longest word in the LOUDS TRIE which is a prefix of
+    TEXT[START:TEXT_LENGTH].
+
+    The function can be used in place of trie_lookup(): it returns
+    the tuple (word, entry, end) for the longest word found and
+    (None, None, START) when no word has been found.
+
+    """
+
+    node = 0
+    found = None
+    end = start
+
+    terminal = trie.terminal
+    i = start
+    while i < text_length:
+        node = trie.child(node, text[i])
+        if node is None:
+            break
+
+        i += 1
+        if terminal[node]:
+            found = node
+            end = i
+
+    if found is None:
+        return None, None, start
+
+    return text[start:end], trie.node_entry(found), end
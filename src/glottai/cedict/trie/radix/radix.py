@@ -0,0 +1,248 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""src/glottai/cedict/trie/radix/radix.py:
+
+A path-compressed radix trie.
+
+Long CC-CEDICT idioms and names produce long chains of nodes with a
+single child in the dictionary trie.  In a radix trie such chains
+collapse into a single edge labelled with a substring.
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+class RadixNode:
+    """A radix trie node.
+
+    VALUE is the entry of the word ending at the node or None.
+    EDGES maps the first character of each outgoing edge label to the
+    pair (label, child node).
+
+    """
+
+    __slots__ = ("value", "edges")
+
+    def __init__(self, value=None):
+        self.value = value
+        self.edges = {}
+
+
+class RadixTrie:
+    """A path-compressed trie with the semantics of the dictionary
+    trie built by trie_insert(): several values inserted under the
+    same key are joined with '\\n'.
+
+    Example:
+
+    trie = RadixTrie()
+    trie.insert('不太好', '不太好 ...')
+    trie.insert('不', '不 不 [bù] /no/')
+
+    radix_lookup(trie, '不太好看', 4, 0)
+    > ('不太好', '不太好 ...', 3)
+
+    """
+
+    def __init__(self):
+        self.root = RadixNode()
+
+    @classmethod
+    def from_trie(cls, trie):
+        """Create a radix trie with the words of the dictionary TRIE."""
+
+        radix_trie = cls()
+
+        # Depth first traversal
+        # The stack holds (node, word) pairs
+        stack = [(trie, "")]
+        while stack:
+            node, word = stack.pop()
+            for key, value in node.items():
+                if key is True:
+                    radix_trie.insert(word, value)
+                else:
+                    stack.append((value, word + key))
+
+        return radix_trie
+
+    def insert(self, key, value):
+        """Insert VALUE under KEY."""
+
+        node = self.root
+        key_length = len(key)
+        i = 0
+        while i < key_length:
+            edge = node.edges.get(key[i])
+
+            if edge is None:
+                # Add a new edge with the remaining key as label
+                node.edges[key[i]] = (key[i:], RadixNode(value))
+                return
+
+            label, child = edge
+
+            # Length of the common prefix of the label
+            # and the remaining key
+            n = 1
+            label_length = len(label)
+            while (
+                n < label_length
+                and i + n < key_length
+                and label[n] == key[i + n]
+            ):
+                n += 1
+
+            if n < label_length:
+                # Split the edge
+                middle = RadixNode()
+                middle.edges[label[n]] = (label[n:], child)
+                node.edges[key[i]] = (label[:n], middle)
+                child = middle
+
+            node = child
+            i += n
+
+        if node.value is None:
+            node.value = value
+
+        else:
+            # Join several values for the same key with '\n'
+            node.value += "\n" + value
+
+    def find(self, key):
+        """Return the value stored under KEY or None."""
+
+        node = self.root
+        i = 0
+        while i < len(key):
+            edge = node.edges.get(key[i])
+            if edge is None:
+                return None
+
+            label, node = edge
+            if not key.startswith(label, i):
+                return None
+
+            i += len(label)
+
+        return node.value
+
+    def __contains__(self, key):
+        return self.find(key) is not None
+
+    def __getitem__(self, key):
+        value = self.find(key)
+        if value is None:
+            raise KeyError(key)
+
+        return value
+
+    def items(self, prefix=""):
+        """Iterate in key order over the (word, value) pairs of all
+        words starting with PREFIX.
+
+        """
+
+        # Find the node representing the shortest word
+        # starting with PREFIX
+        node = self.root
+        word = ""
+        while len(word) < len(prefix):
+            edge = node.edges.get(prefix[len(word)])
+            if edge is None:
+                return
+
+            label, node = edge
+            rest = prefix[len(word) :]
+            if not (label.startswith(rest) or rest.startswith(label)):
+                return
+
+            word += label
+
+        # Depth first traversal
+        # The stack holds (node, word) pairs
+        stack = [(node, word)]
+        while stack:
+            node, word = stack.pop()
+            if node.value is not None:
+                yield word, node.value
+
+            # Push the children in reverse order
+            # to visit them in key order
+            for first in sorted(node.edges, reverse=True):
+                label, child = node.edges[first]
+                stack.append((child, word + label))
+
+    def __iter__(self):
+        for word, _ in self.items():
+            yield word
+
+    def __len__(self):
+        return sum(1 for _ in self.items())
+
+    def node_count(self):
+        """Return the number of nodes."""
+
+        count = 0
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            count += 1
+            stack.extend(child for _, child in node.edges.values())
+
+        return count
+
+
+def radix_lookup(trie, text, text_length, start):
+    """Find the longest word in the radix TRIE which is a prefix of
+    TEXT[START:TEXT_LENGTH].
+
+    The function can be used in place of trie_lookup(): it returns
+    the tuple (word, entry, end) for the longest word found and
+    (None, None, START) when no word has been found.
+
+    """
+
+    node = trie.root
+    value = None
+    end = start
+
+    i = start
+    while i < text_length:
+        edge = node.edges.get(text[i])
+        if edge is None:
+            break
+
+        label, node = edge
+        i += len(label)
+        if i > text_length or not text.startswith(label, i - len(label)):
+            break
+
+        if node.value is not None:
+            value = node.value
+            end = i
+
+    if value is None:
+        return None, None, start
+
+    return text[start:end], value, end
@@ -71,3 +71,79 @@ def trie_insert(trie, key, value):
             # When an entry does not exist yet store the new string
             # value using True als key.
             trie[True] = value
+
+
+def trie_insert_all(trie, items):
+    """Inserts all (key, value) pairs of ITEMS into the TRIE and
+    returns the TRIE.
+
+    The result is the same as inserting the pairs one by one with
+    trie_insert(); the keys are inserted iteratively, however,
+    without recursion and without slicing the key at every level.
+    ITEMS can be any iterable, for example a generator reading the
+    entries of a CC-CEDICT file.
+
+    Example:
+
+    trie = trie_insert_all({}, [('a', 'a'), ('ab', 'ab'), ('b', 'b')])
+    trie
+
+    > {'a': {True: 'a', 'b': {True: 'ab'}}, 'b': {True: 'b'}}
+
+    """
+
+    for key, value in items:
+        # Follow or create the nodes for the characters of KEY
+        node = trie
+        for char in key:
+            child = node.get(char)
+            if child is None:
+                child = node[char] = {}
+            node = child
+
+        if True in node:
+            # Join several values for the same key with '\n'
+            node[True] += "\n" + value
+
+        else:
+            node[True] = value
+
+    return trie
+
+
+def trie_insert_entry_id(trie, key, entry_id):
+    """Inserts the integer ENTRY_ID under KEY into the TRIE.
+
+    The entry IDs refer to the entries of an EntryTable.  A single
+    entry ID is stored as it is; when several entries exist for the
+    same key, their IDs are stored as a tuple.  EntryTable.get()
+    decodes both forms.
+
+    Example:
+
+    trie = {}
+    trie_insert_entry_id(trie, 'ab', 0)
+    trie_insert_entry_id(trie, 'a', 1)
+    trie_insert_entry_id(trie, 'a', 2)
+    trie
+
+    > {'a': {True: (1, 2), 'b': {True: 0}}}
+
+    """
+
+    # Find or create the node representing KEY
+    node = trie
+    for char in key:
+        if char not in node:
+            node[char] = {}
+        node = node[char]
+
+    if True in node:
+        # Append the new entry ID to the existing ones
+        entry_ids = node[True]
+        if isinstance(entry_ids, int):
+            entry_ids = (entry_ids,)
+        node[True] = entry_ids + (entry_id,)
+
+    else:
+        node[True] = entry_id
@@ -0,0 +1,187 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""src/glottai/cedict/trie/simple/load.py:
+
+Load the generated CC-CEDICT trie files using a validated binary
+snapshot.
+
+Compiling the multi-megabyte dictionary literal of a generated trie
+file takes seconds.  When a trie file is loaded, a marshal snapshot
+of its variables and trie is stored next to it (with the extension
+'.marshal') and used on subsequent loads.  The snapshot is keyed by
+the 'time' variable of the CC-CEDICT file and the SHA-256 hash of
+the trie file; when either changes, the trie file is compiled again
+and the snapshot is rewritten.
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import hashlib
+import marshal
+import os
+import re
+import time
+from pathlib import Path
+
+# Version of the snapshot format
+SNAPSHOT_VERSION = 1
+
+# Extension of the snapshot files
+SNAPSHOT_SUFFIX = ".marshal"
+
+# Regular expression to extract the 'time' variable
+# from the variable section of a trie file
+_time_regex = re.compile(rb"^  'time': '([^']*)'", re.MULTILINE)
+
+
+def get_snapshot_file(trie_file):
+    """Get the file path of the snapshot for TRIE_FILE."""
+
+    trie_file = Path(trie_file)
+    return trie_file.with_suffix(SNAPSHOT_SUFFIX)
+
+
+def _snapshot_key(source):
+    """Calculate the key identifying the trie file with the content
+    SOURCE: the snapshot format version, the marshal version, the
+    CC-CEDICT 'time' variable and the hash of the file.
+
+    """
+
+    m = _time_regex.search(source)
+    cedict_time = m.group(1).decode("utf-8") if m else None
+    file_hash = hashlib.sha256(source).hexdigest()
+
+    return (SNAPSHOT_VERSION, marshal.version, cedict_time, file_hash)
+
+
+def _read_snapshot(snapshot_file, key):
+    """Read the (variables, trie) pair from SNAPSHOT_FILE.
+    Return None when there is no valid snapshot for KEY.
+
+    """
+
+    try:
+        with open(snapshot_file, "rb") as fh:
+            # The snapshot starts with its key
+            # followed by the (variables, trie) pair
+            if marshal.load(fh) != key:
+                return None
+
+            return marshal.load(fh)
+
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+
+def _write_snapshot(snapshot_file, key, variables, trie):
+    """Write a snapshot of VARIABLES and TRIE for KEY to
+    SNAPSHOT_FILE.  When the directory is not writable, no snapshot
+    is written.
+
+    """
+
+    tmp_file = snapshot_file.with_name(f"{snapshot_file.name}.{os.getpid()}")
+    try:
+        with open(tmp_file, "wb") as fh:
+            marshal.dump(key, fh)
+            marshal.dump((variables, trie), fh)
+
+        # Replace the snapshot atomically
+        os.replace(tmp_file, snapshot_file)
+
+    except OSError:
+        try:
+            os.unlink(tmp_file)
+        except OSError:
+            pass
+
+
+def load_trie_file(trie_file, snapshot=True, report=False):
+    """Load the generated trie file TRIE_FILE and return the pair
+    (CEDICT_variables, CEDICT_trie).
+
+    When SNAPSHOT is True, a valid snapshot is used instead of the
+    trie file and a new snapshot is written when the existing one is
+    missing or stale.  When REPORT is True, the time needed for
+    loading is printed.
+
+    """
+
+    start_time = time.perf_counter()
+
+    trie_file = Path(trie_file)
+    with open(trie_file, "rb") as fh:
+        source = fh.read()
+
+    if snapshot:
+        snapshot_file = get_snapshot_file(trie_file)
+        key = _snapshot_key(source)
+
+        data = _read_snapshot(snapshot_file, key)
+        if data is not None:
+            if report:
+                _report(trie_file, "snapshot", start_time)
+
+            return data
+
+    # Compile and execute the trie file
+    namespace = {}
+    exec(compile(source, str(trie_file), "exec"), namespace)
+    variables = namespace["CEDICT_variables"]
+    trie = namespace["CEDICT_trie"]
+
+    if report:
+        _report(trie_file, "trie file", start_time)
+
+    if snapshot:
+        _write_snapshot(snapshot_file, key, variables, trie)
+
+    return variables, trie
+
+
+def _report(trie_file, source, start_time):
+    """Print the time needed to load TRIE_FILE from SOURCE."""
+
+    milliseconds = (time.perf_counter() - start_time) * 1000
+    print(f"Loaded {trie_file} from {source} in {milliseconds:.1f} ms")
+
+
+def load_cedict_trie(form=None, snapshot=True, report=False):
+    """Load the CC-CEDICT trie for the hanzi FORM ('traditional' or
+    'simplified') from the local CC-CEDICT directory and return the
+    pair (CEDICT_variables, CEDICT_trie).  When no FORM is given, the
+    default form from the settings is used.
+
+    See load_trie_file() for SNAPSHOT and REPORT.
+
+    """
+
+    from glottai.cedict.settings import settings
+
+    if form is None:
+        form = settings.get_hanzi_default_form()
+
+    trie_file = settings.get_cedict_trie_file(form)
+
+    return load_trie_file(trie_file, snapshot=snapshot, report=report)
@@ -0,0 +1,361 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""src/glottai/cedict/trie/simple/search.py:
+
+Search the words of a trie.
+
+    trie_complete()        the words starting with a prefix in the
+                           order in which write_trie_to_file() writes
+                           them, generated lazily
+    trie_fuzzy()           the words within a Levenshtein distance of
+                           a word
+    trie_match()           the words matching a pattern with the
+                           wildcards '?' (a single character) and '*'
+                           (any number of characters)
+    trie_reverse()         a trie of the reversed words, used by
+                           trie_match() for patterns starting with a
+                           wildcard
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+from functools import cmp_to_key
+
+from glottai.cedict.trie.simple.write import _trie_compare_keys
+
+_trie_sort_key = cmp_to_key(_trie_compare_keys)
+
+
+def _sorted_items(node):
+    """Iterate over the (key, value) pairs of the trie NODE in the
+    order of _trie_compare_keys().
+
+    """
+
+    return iter(sorted(node.items(), key=_trie_sort_key))
+
+
+def trie_find_node(trie, prefix):
+    """Get the node of the TRIE reached by PREFIX or None when no word
+    of the trie starts with PREFIX.
+
+    """
+
+    node = trie
+    for char in prefix:
+        node = node.get(char)
+        if node is None:
+            return None
+
+    return node
+
+
+def trie_complete(trie, prefix="", limit=None, offset=0):
+    """Yield the pairs (word, value) of the words in the TRIE starting
+    with PREFIX, PREFIX itself included.
+
+    The first OFFSET words are skipped and at most LIMIT words are
+    yielded when LIMIT is given.  The words are generated lazily: the
+    subtree of PREFIX is only walked as far as the words are consumed.
+
+    Example:
+
+    trie = {'王': {True: 'wang',
+                   '子': {True: 'wangzi'},
+                   '后': {True: 'wanghou'}}}
+    list(trie_complete(trie, '王', limit=2))
+
+    > [('王', 'wang'), ('王后', 'wanghou')]
+
+    list(trie_complete(trie, '王', offset=2))
+
+    > [('王子', 'wangzi')]
+
+    """
+
+    if limit is not None and limit <= 0:
+        return
+
+    node = trie_find_node(trie, prefix)
+    if node is None:
+        return
+
+    # Number of words to visit
+    stop = None if limit is None else offset + limit
+
+    # The words found so far
+    count = 0
+
+    # Stack of the pairs (word, iterator over the sorted node items)
+    stack = [(prefix, _sorted_items(node))]
+    while stack:
+        word, items = stack[-1]
+        for key, value in items:
+            if key is True:
+                if count >= offset:
+                    yield word, value
+
+                count += 1
+                if count == stop:
+                    return
+
+            else:
+                # Descend into the child before visiting its siblings
+                stack.append((word + key, _sorted_items(value)))
+                break
+
+        else:
+            stack.pop()
+
+
+def trie_fuzzy(trie, word, max_distance=1, skip=""):
+    """Get the words of the TRIE within the Levenshtein distance
+    MAX_DISTANCE of WORD as list of triples (word, value, distance)
+    sorted by distance and word.
+
+    The trie is walked together with the states of the Levenshtein
+    automaton of WORD - a position in WORD and the number of edits
+    left - so that a subtree is only entered while edits are left or
+    its characters match WORD.  The characters of the trie keys in
+    SKIP are skipped without costing an edit (used for the tone
+    numbers of the pinyin index).
+
+    Example:
+
+    trie = {'王': {True: 'wang', '子': {True: 'wangzi'}}}
+    trie_fuzzy(trie, '王字')
+
+    > [('王', 'wang', 1), ('王子', 'wangzi', 1)]
+
+    """
+
+    n = len(word)
+
+    # word -> (distance, value)
+    found = {}
+
+    def add(key, node, distance):
+        if True in node and (key not in found or found[key][0] > distance):
+            found[key] = (distance, node[True])
+
+    # (node id, position in WORD) -> the most edits left when visited
+    visited = {}
+
+    # Stack of the states (node, key, position in WORD, edits left)
+    stack = [(trie, "", 0, max_distance)]
+    while stack:
+        node, key, i, edits = stack.pop()
+
+        state = (id(node), i)
+        if visited.get(state, -1) >= edits:
+            continue
+        visited[state] = edits
+
+        if i == n:
+            add(key, node, max_distance - edits)
+
+        else:
+            # Match the next character of WORD
+            child = node.get(word[i])
+            if child is not None:
+                stack.append((child, key + word[i], i + 1, edits))
+
+            # Delete the next character of WORD
+            if edits:
+                stack.append((node, key, i + 1, edits - 1))
+
+        for char in skip:
+            child = node.get(char)
+            if child is not None:
+                stack.append((child, key + char, i, edits))
+
+        if not edits:
+            continue
+
+        if edits > 1 or skip:
+            for char, child in node.items():
+                if char is True or char in skip:
+                    continue
+
+                # Insert CHAR
+                stack.append((child, key + char, i, edits - 1))
+
+                # Substitute the next character of WORD with CHAR
+                if i < n and char != word[i]:
+                    stack.append((child, key + char, i + 1, edits - 1))
+
+            continue
+
+        # The last edit: the rest of WORD has to follow exactly.
+        # As all children are tried here, they are filtered by the
+        # first character of the rest before walking it.
+        rests = [word[i:]]
+        if i < n:
+            rests.append(word[i + 1 :])
+
+        for rest in rests:
+            # Insert a character or substitute the next character of
+            # WORD
+            first = rest[0] if rest else True
+            candidates = [
+                (char, child)
+                for char, child in node.items()
+                if char is not True and first in child
+            ]
+
+            for char, child in candidates:
+                end = child
+                for next_char in rest:
+                    end = end.get(next_char)
+                    if end is None:
+                        break
+
+                else:
+                    add(key + char + rest, end, max_distance)
+
+    return sorted(
+        (
+            (key, value, distance)
+            for key, (distance, value) in found.items()
+        ),
+        key=lambda item: (item[2], item[0]),
+    )
+
+
+def trie_reverse(trie):
+    """Build a trie mapping the reversed words of TRIE to their
+    values.  The values are shared with TRIE.
+
+    Example:
+
+    trie_reverse({'大': {'学': {True: 'daxue'}}})
+
+    > {'学': {'大': {True: 'daxue'}}}
+
+    """
+
+    reverse_trie = {}
+    stack = [(trie, "")]
+    while stack:
+        node, word = stack.pop()
+        for char, child in node.items():
+            if char is not True:
+                stack.append((child, word + char))
+                continue
+
+            reverse_node = reverse_trie
+            for reverse_char in reversed(word):
+                reverse_node = reverse_node.setdefault(reverse_char, {})
+            reverse_node[True] = child
+
+    return reverse_trie
+
+
+def _literal_length(pattern):
+    """The number of characters before the first wildcard of
+    PATTERN.
+
+    """
+
+    for i, char in enumerate(pattern):
+        if char in "?*":
+            return i
+
+    return len(pattern)
+
+
+def trie_match(trie, pattern, limit=None, reverse_trie=None):
+    """Get the words of the TRIE matching PATTERN as list of pairs
+    (word, value) sorted by word.  In PATTERN, '?' matches a single
+    character and '*' any number of characters.  At most LIMIT words
+    are returned when LIMIT is given.
+
+    Only the subtrees reachable by the characters of PATTERN are
+    walked, so the characters before the first wildcard select the
+    subtree to search.  When REVERSE_TRIE - the trie_reverse() of
+    TRIE - is given and PATTERN ends with more characters than it
+    starts with before a wildcard (like '*学'), the reversed PATTERN
+    is matched against REVERSE_TRIE instead of walking all words.
+
+    Example:
+
+    trie_match(trie, '中?国')
+    trie_match(trie, '*学', reverse_trie=trie_reverse(trie))
+
+    """
+
+    reverse = reverse_trie is not None and _literal_length(
+        pattern[::-1]
+    ) > _literal_length(pattern)
+    if reverse:
+        trie, pattern = reverse_trie, pattern[::-1]
+
+    n = len(pattern)
+
+    # word -> value
+    found = {}
+
+    # The visited states (node id, position in PATTERN)
+    visited = set()
+
+    # Stack of the states (node, key, position in PATTERN)
+    stack = [(trie, "", 0)]
+    while stack:
+        node, key, j = stack.pop()
+
+        state = (id(node), j)
+        if state in visited:
+            continue
+        visited.add(state)
+
+        if j == n:
+            if True in node:
+                found[key] = node[True]
+            continue
+
+        char = pattern[j]
+        if char == "*":
+            # Match no more characters
+            stack.append((node, key, j + 1))
+
+            # Match one more character
+            for next_char, child in node.items():
+                if next_char is not True:
+                    stack.append((child, key + next_char, j))
+
+        elif char == "?":
+            for next_char, child in node.items():
+                if next_char is not True:
+                    stack.append((child, key + next_char, j + 1))
+
+        else:
+            child = node.get(char)
+            if child is not None:
+                stack.append((child, key + char, j + 1))
+
+    if reverse:
+        found = {key[::-1]: value for key, value in found.items()}
+
+    items = sorted(found.items())
+
+    return items if limit is None else items[:limit]
@@ -0,0 +1,105 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""src/glottai/cedict/trie/simple/shards.py:
+
+Lazily load tries written in shards by write_trie_to_file().
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+from collections.abc import Mapping
+from pathlib import Path
+
+from .load import load_trie_file
+
+
+class ShardedTrie(Mapping):
+    """The top level of a trie written in shards.
+
+    Only the small shard index is read when the trie is opened.  A
+    shard is loaded the first time one of its leading characters is
+    accessed, so the memory used is proportional to the vocabulary
+    actually looked up.  A ShardedTrie behaves like the top-level
+    dictionary of the trie and can be used with trie_lookup() and the
+    lexer.
+
+    Example:
+
+    with open(index_file, "w", encoding="utf-8") as fh:
+        write_trie_to_file(
+            fh, header, variables, trie, shard_dir=index_file.parent / "shards"
+        )
+
+    trie = ShardedTrie(index_file)
+    tokens = lexer(trie, text, 0)
+
+    """
+
+    def __init__(self, index_file, snapshot=True):
+        index_file = Path(index_file)
+        with open(index_file, "rb") as fh:
+            source = fh.read()
+
+        namespace = {}
+        exec(compile(source, str(index_file), "exec"), namespace)
+
+        self.variables = namespace["CEDICT_variables"]
+        self._shard_dir = index_file.parent / namespace["CEDICT_shard_dir"]
+        self._shards = namespace["CEDICT_shards"]
+        self._snapshot = snapshot
+
+        # The subtries of the leading characters of all loaded shards
+        self._trie = {}
+
+        # The names of the loaded shards
+        self._loaded = set()
+
+    def __getitem__(self, char):
+        trie = self._trie
+        if char not in trie:
+            # Raises KeyError for unknown leading characters
+            name = self._shards[char]
+            self._load_shard(name)
+
+        return trie[char]
+
+    def __contains__(self, char):
+        return char in self._shards
+
+    def __iter__(self):
+        return iter(self._shards)
+
+    def __len__(self):
+        return len(self._shards)
+
+    def _load_shard(self, name):
+        """Load the shard NAME."""
+
+        shard_file = self._shard_dir / f"{name}.py"
+        _, trie = load_trie_file(shard_file, snapshot=self._snapshot)
+        self._trie.update(trie)
+        self._loaded.add(name)
+
+    def loaded_shards(self):
+        """Return the names of the shards loaded so far."""
+        return sorted(self._loaded)
@@ -0,0 +1,257 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""src/glottai/cedict/trie/simple/update.py:
+
+Patch a trie in place with the changes between two CC-CEDICT files.
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+from glottai.cedict.pinyin import tone_numbers_to_marks_string
+from glottai.cedict.trie.simple.insert import trie_insert_all
+from glottai.cedict.utilities.cedict import get_cedict_entry_word
+
+
+class TrieUpdateException(Exception):
+    pass
+
+
+def trie_remove(trie, key, value):
+    """Remove VALUE from the values stored under KEY in the TRIE.
+
+    Several values for the same key are joined with '\\n' (see
+    trie_insert()); only the line VALUE is removed from them.  When no
+    value is left, nodes which became empty are removed as well.
+
+    Returns True when VALUE was found and removed; False otherwise.
+
+    Example:
+
+    trie = {'a': {True: 'x\\ny', 'b': {True: 'z'}}}
+    trie_remove(trie, 'a', 'x')
+    trie_remove(trie, 'ab', 'z')
+    trie
+
+    > {'a': {True: 'y'}}
+
+    """
+
+    # Find the node representing KEY
+    # and remember the path leading to it
+    path = []
+    node = trie
+    for char in key:
+        child = node.get(char)
+        if child is None:
+            return False
+        path.append((node, char))
+        node = child
+
+    if True not in node:
+        return False
+
+    values = node[True].split("\n")
+    if value not in values:
+        return False
+
+    values.remove(value)
+    if values:
+        node[True] = "\n".join(values)
+        return True
+
+    del node[True]
+
+    # Prune the nodes which became empty
+    while path and not node:
+        parent, char = path.pop()
+        del parent[char]
+        node = parent
+
+    return True
+
+
+def trie_replace(trie, key, old, new):
+    """Replace the value OLD stored under KEY in the TRIE with NEW,
+    keeping the position of the value among the other values of KEY.
+
+    Returns True when OLD was found and replaced; False otherwise.
+
+    """
+
+    # Find the node representing KEY
+    node = trie
+    for char in key:
+        node = node.get(char)
+        if node is None:
+            return False
+
+    if True not in node:
+        return False
+
+    values = node[True].split("\n")
+    if old not in values:
+        return False
+
+    values[values.index(old)] = new
+    node[True] = "\n".join(values)
+
+    return True
+
+
+def trie_order_entries(trie, entries, form="traditional"):
+    """Put the values stored in the TRIE for the hanzi FORM
+    ('traditional' or 'simplified') under the words of the entry lines
+    ENTRIES in the order of ENTRIES.  Values not found in ENTRIES are
+    kept after them.
+
+    With the entry lines of a cedict file, the values are in the same
+    order as in a trie built from scratch from the file.
+
+    Example:
+
+    trie = {'a': {True: 'a a [a] /y/\\na a [a] /x/'}}
+    trie_order_entries(trie, ['a a [a] /x/', 'a a [a] /y/'])
+    trie
+
+    > {'a': {True: 'a a [a] /x/\\na a [a] /y/'}}
+
+    """
+
+    word_entries = {}
+    for entry in entries:
+        word = get_cedict_entry_word(entry, form=form)
+        word_entries.setdefault(word, []).append(
+            tone_numbers_to_marks_string(entry)
+        )
+
+    for word, ordered in word_entries.items():
+        node = trie
+        for char in word:
+            node = node.get(char)
+            if node is None:
+                break
+
+        if node is None or True not in node:
+            continue
+
+        rank = {value: i for i, value in enumerate(ordered)}
+        values = node[True].split("\n")
+        values.sort(key=lambda value: rank.get(value, len(rank)))
+        node[True] = "\n".join(values)
+
+
+def apply_changes(trie, changes, form="traditional", entries=None):
+    """Patch the TRIE for the hanzi FORM ('traditional' or
+    'simplified') in place with CHANGES and return it.
+
+    CHANGES are Change records as yielded by iter_diff() from
+    glottai.cedict.utilities.diff.  Their entry lines are converted to
+    tone marks as when building the trie from scratch.  Changed
+    entries keep their position among the entries of the same word;
+    added entries are appended to them.
+
+    When ENTRIES - the entry lines of the new cedict file, or at least
+    those of the added and changed words - are given, the entries of
+    the added and changed words are put in their order with
+    trie_order_entries(): the patched trie then equals a trie built
+    from scratch from the new cedict file.
+
+    A TrieUpdateException is raised when an entry to be removed or
+    changed cannot be found in the TRIE, i.e. when the TRIE has not
+    been built from the old CC-CEDICT file of CHANGES.
+
+    Example:
+
+    changes = list(iter_diff(backup_file, cedict_file))
+    apply_changes(trie, changes, form='simplified')
+
+    """
+
+    for change in changes:
+        if change.op == "add":
+            new = tone_numbers_to_marks_string(change.new)
+            new_word = get_cedict_entry_word(change.new, form=form)
+            trie_insert_all(trie, [(new_word, new)])
+            continue
+
+        old = tone_numbers_to_marks_string(change.old)
+        old_word = get_cedict_entry_word(change.old, form=form)
+
+        if change.op == "change":
+            new = tone_numbers_to_marks_string(change.new)
+            new_word = get_cedict_entry_word(change.new, form=form)
+
+            # Replace the entry in place when its word did not change
+            if old_word == new_word and trie_replace(
+                trie, old_word, old, new
+            ):
+                continue
+
+        if not trie_remove(trie, old_word, old):
+            raise TrieUpdateException(
+                f"Entry not found in the trie: {change.old}"
+            )
+
+        if change.op == "change":
+            trie_insert_all(trie, [(new_word, new)])
+
+    if entries is not None:
+        words = {
+            get_cedict_entry_word(change.new, form=form)
+            for change in changes
+            if change.new is not None
+        }
+        trie_order_entries(
+            trie,
+            (
+                entry
+                for entry in entries
+                if get_cedict_entry_word(entry, form=form) in words
+            ),
+            form=form,
+        )
+
+    return trie
+
+
+def trie_differences(trie1, trie2, prefix=""):
+    """Yield the keys of all words for which TRIE1 and TRIE2 store
+    different values.  Several values for the same key have to be in
+    the same order.
+
+    Example:
+
+    list(trie_differences({'a': {True: 'x\\ny'}, 'b': {True: 'z'}},
+                          {'a': {True: 'y\\nx'}}))
+
+    > ['a', 'b']
+
+    """
+
+    if trie1.get(True) != trie2.get(True):
+        yield prefix
+
+    for char in sorted(set(trie1).union(trie2) - {True}):
+        yield from trie_differences(
+            trie1.get(char, {}), trie2.get(char, {}), prefix + char
+        )
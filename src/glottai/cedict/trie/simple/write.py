@@ -30,18 +30,44 @@ __date__ = "2023/06/16"
 from functools import cmp_to_key
 
 
-def write_trie_to_file(fh, header, variables, trie, format="readable"):
+def write_trie_to_file(
+    fh,
+    header,
+    variables,
+    trie,
+    format="readable",
+    shard_dir=None,
+    shard_by="char",
+):
     """Write the given HEADER, VARIABLES and TRIE to the file
     represented by FH.
 
     FORMAT can either be 'compact' or 'readable'.
 
+    When a SHARD_DIR is given, the trie is split into shards by the
+    leading character of its words and each shard is written as a
+    trie file of its own into SHARD_DIR.  The file represented by FH
+    then only contains a small index mapping each leading character
+    to the name of its shard.  SHARD_DIR has to be in the same
+    directory as the index file.  SHARD_BY can either be 'char' to
+    write one shard per leading character or 'block' to write one
+    shard per block of 256 code points.  Use ShardedTrie from
+    glottai.cedict.trie.simple.shards to load the shards lazily.
+
     """
 
+    if shard_dir is not None:
+        shards = _write_shards(
+            shard_dir, header, variables, trie, format, shard_by
+        )
+
     # Write trie to file
     _write_header(fh, header)
     _write_variables(fh, variables)
-    _write_trie(fh, trie, format=format)
+    if shard_dir is None:
+        _write_trie(fh, trie, format=format)
+    else:
+        _write_shard_index(fh, shard_dir, shards)
     _write_footer(fh)
 
 
@@ -134,6 +160,82 @@ def _write_footer(fh):
 # ==========================================================
 
 
+def get_shard_name(char, shard_by="char"):
+    """Get the name of the shard containing the words starting with
+    CHAR.
+
+    SHARD_BY can either be 'char' for one shard per leading character
+    or 'block' for one shard per block of 256 code points.
+
+    """
+
+    if shard_by == "char":
+        return f"shard_{ord(char):06x}"
+
+    elif shard_by == "block":
+        return f"shard_{ord(char) >> 8:04x}xx"
+
+    else:
+        # ERROR Unknown shard criterion - exiting
+        print(f"ERROR Unknown shard criterion: {shard_by}")
+        print("Only 'char' and 'block' are defined criteria.")
+        import sys
+
+        sys.exit(1)
+
+
+def _write_shards(shard_dir, header, variables, trie, format, shard_by):
+    """Write the TRIE split into shards to SHARD_DIR.
+
+    Return a dictionary mapping each leading character to the name
+    of its shard.
+
+    """
+
+    from pathlib import Path
+
+    shard_dir = Path(shard_dir)
+    shard_dir.mkdir(parents=True, exist_ok=True)
+
+    # Split the trie into shards
+    shard_tries = {}
+    shards = {}
+    for char, subtrie in trie.items():
+        name = get_shard_name(char, shard_by=shard_by)
+        shard_tries.setdefault(name, {})[char] = subtrie
+        shards[char] = name
+
+    # Write each shard as a trie file of its own
+    for name, shard_trie in shard_tries.items():
+        shard_file = shard_dir / f"{name}.py"
+        with open(shard_file, "w", encoding="utf-8") as shard_fh:
+            write_trie_to_file(
+                shard_fh, header, variables, shard_trie, format=format
+            )
+
+    return shards
+
+
+def _write_shard_index(fh, shard_dir, shards):
+    """Write the index of the SHARDS in SHARD_DIR to the file
+    represented by FH.
+
+    """
+
+    from pathlib import Path
+
+    # Write the name of the shard directory
+    fh.write(f"CEDICT_shard_dir = {repr(Path(shard_dir).name)}\n")
+    fh.write("\n")
+
+    # Write the index
+    fh.write("CEDICT_shards = {\n")
+    for char, name in sorted(shards.items()):
+        fh.write(f"  {repr(char)}: {repr(name)},\n")
+    fh.write("}\n")
+    fh.write("\n")
+
+
 def _write_trie_compact(fh, trie):
     """Write TRIE to FH in compact format to the file represented by
     FH."""
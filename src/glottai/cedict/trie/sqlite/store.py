@@ -0,0 +1,377 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""src/glottai/cedict/trie/sqlite/store.py:
+
+Store CC-CEDICT in a SQLite database and look up words in it.
+
+Tables:
+
+    entries                one row per entry: id (the index of the
+                           entry in the cedict file), traditional,
+                           simplified, pinyin (tone numbers),
+                           pinyin_marks, senses ('/' separated) and
+                           entry (the line with tone marks);
+                           traditional, simplified, pinyin and
+                           pinyin_marks are indexed
+    senses_fts             FTS5 full-text index over entries.senses
+    variables              the CEDICT_variables of the cedict file
+    metadata               format version and maximal word length
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import sqlite3
+from pathlib import Path
+
+FORMAT_VERSION = 1
+
+# Upper bound for the words starting with a given prefix:
+# the largest code point sorts after any other character.
+_PREFIX_END = "\U0010ffff"
+
+_SCHEMA = """
+CREATE TABLE entries (
+    id           INTEGER PRIMARY KEY,
+    traditional  TEXT NOT NULL,
+    simplified   TEXT NOT NULL,
+    pinyin       TEXT NOT NULL,
+    pinyin_marks TEXT NOT NULL,
+    senses       TEXT NOT NULL,
+    entry        TEXT NOT NULL
+);
+CREATE TABLE variables (
+    name         TEXT PRIMARY KEY,
+    value        TEXT NOT NULL
+);
+CREATE TABLE metadata (
+    name         TEXT PRIMARY KEY,
+    value        TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE senses_fts USING fts5(
+    senses, content='entries', content_rowid='id'
+);
+"""
+
+_INDEXES = """
+CREATE INDEX entries_traditional ON entries (traditional);
+CREATE INDEX entries_simplified ON entries (simplified);
+CREATE INDEX entries_pinyin ON entries (pinyin);
+CREATE INDEX entries_pinyin_marks ON entries (pinyin_marks);
+INSERT INTO senses_fts (senses_fts) VALUES ('rebuild');
+"""
+
+
+class SqliteTrieException(Exception):
+    pass
+
+
+def write_sqlite_store(filename, cedict_filename):
+    """Parse the cedict file CEDICT_FILENAME - plain or gzip
+    compressed - in a single pass and write it to the SQLite database
+    FILENAME.  An existing database FILENAME is replaced.
+
+    """
+
+    from glottai.cedict.pinyin import (
+        tone_numbers_to_marks,
+        tone_numbers_to_marks_string,
+    )
+    from glottai.cedict.utilities.cedict import (
+        parse_cedict_entry,
+        read_cedict,
+    )
+
+    _, variables, entries = read_cedict(cedict_filename)
+
+    def rows():
+        for entry_id, entry in enumerate(entries):
+            traditional, simplified, pinyin, senses = parse_cedict_entry(
+                entry
+            )
+            entry = tone_numbers_to_marks_string(entry)
+            senses = tone_numbers_to_marks_string("/".join(senses))
+            yield (
+                entry_id,
+                traditional,
+                simplified,
+                pinyin,
+                tone_numbers_to_marks(pinyin),
+                senses,
+                entry,
+            )
+
+    # Write to a temporary file and replace FILENAME when done
+    filename = Path(filename)
+    tmp_filename = filename.with_name(filename.name + ".tmp")
+    tmp_filename.unlink(missing_ok=True)
+
+    connection = sqlite3.connect(tmp_filename)
+    try:
+        with connection:
+            connection.executescript(_SCHEMA)
+            connection.executemany(
+                "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)", rows()
+            )
+            connection.executemany(
+                "INSERT INTO variables VALUES (?, ?)", variables.items()
+            )
+            max_word_length = connection.execute(
+                "SELECT max(max(length(traditional)), "
+                "max(length(simplified))) FROM entries"
+            ).fetchone()[0]
+            connection.executemany(
+                "INSERT INTO metadata VALUES (?, ?)",
+                [
+                    ("format-version", str(FORMAT_VERSION)),
+                    ("max-word-length", str(max_word_length or 0)),
+                ],
+            )
+            connection.executescript(_INDEXES)
+
+    finally:
+        connection.close()
+
+    tmp_filename.replace(filename)
+
+
+class SqliteTrie:
+    """A read-only connection to a CC-CEDICT SQLite database written
+    by write_sqlite_store() for looking up the words of the hanzi
+    FORM ('traditional' or 'simplified').
+
+    Many processes can share one database file; every process only
+    keeps the SQLite page cache in memory.
+
+    Example:
+
+    with SqliteTrie("~/.cedict/cedict.sqlite", "simplified") as trie:
+        tokens = lexer(trie, text, 0, lookup=sqlite_lookup)
+        trie.prefix_items("王")
+
+    """
+
+    def __init__(self, filename, form="traditional"):
+        if form not in ("traditional", "simplified"):
+            msg = f"Unknown hanzi form: {form}"
+            raise SqliteTrieException(msg)
+
+        self.filename = filename
+        self.form = form
+
+        if not Path(filename).is_file():
+            msg = f"{filename} does not exist!"
+            raise SqliteTrieException(msg)
+
+        uri = Path(filename).resolve().as_uri() + "?mode=ro"
+        self.connection = sqlite3.connect(uri, uri=True)
+
+        try:
+            metadata = dict(
+                self.connection.execute("SELECT name, value FROM metadata")
+            )
+            self.variables = dict(
+                self.connection.execute("SELECT name, value FROM variables")
+            )
+
+        except sqlite3.DatabaseError as error:
+            self.connection.close()
+            msg = f"{filename} is not a CC-CEDICT SQLite database: {error}"
+            raise SqliteTrieException(msg)
+
+        if int(metadata["format-version"]) != FORMAT_VERSION:
+            self.connection.close()
+            msg = f"{filename} has an unsupported format version!"
+            raise SqliteTrieException(msg)
+
+        self.max_word_length = int(metadata["max-word-length"])
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self.connection.execute(
+            "SELECT count(*) FROM entries"
+        ).fetchone()[0]
+
+    def lookup(self, word):
+        """Get the entry (or the '\\n' separated entries) of WORD or None
+        when WORD is not in the dictionary.
+
+        """
+
+        entries = [
+            entry
+            for (entry,) in self.connection.execute(
+                f"SELECT entry FROM entries WHERE {self.form} = ? "
+                "ORDER BY id",
+                (word,),
+            )
+        ]
+
+        return "\n".join(entries) if entries else None
+
+    def __contains__(self, word):
+        return self.lookup(word) is not None
+
+    def __getitem__(self, word):
+        entry = self.lookup(word)
+        if entry is None:
+            raise KeyError(word)
+
+        return entry
+
+    def prefix_items(self, prefix, limit=None):
+        """Get the list of (word, entry) pairs of all words starting
+        with PREFIX in the order of their code points.  Several
+        entries of a word are joined with '\\n'.  At most LIMIT words
+        are returned when LIMIT is given.
+
+        """
+
+        rows = self.connection.execute(
+            f"SELECT {self.form}, entry FROM entries "
+            f"WHERE {self.form} >= ? AND {self.form} < ? "
+            f"ORDER BY {self.form}, id",
+            (prefix, prefix + _PREFIX_END),
+        )
+
+        items = []
+        for word, entry in rows:
+            if items and items[-1][0] == word:
+                items[-1] = (word, items[-1][1] + "\n" + entry)
+                continue
+
+            if limit is not None and len(items) == limit:
+                break
+
+            items.append((word, entry))
+
+        return items
+
+    def longest_prefix(self, text, start=0, end=None):
+        """Find the longest word which is a prefix of TEXT[START:END].
+
+        Returns the pair (word, entry) or (None, None) when no word is
+        found.
+
+        """
+
+        if end is None:
+            end = len(text)
+
+        n = min(self.max_word_length, end - start)
+        if n <= 0:
+            return None, None
+
+        # Look up all prefixes at once
+        candidates = [text[start : start + i] for i in range(1, n + 1)]
+        rows = self.connection.execute(
+            f"SELECT {self.form}, entry FROM entries "
+            f"WHERE {self.form} IN ({', '.join('?' * n)}) ORDER BY id",
+            candidates,
+        ).fetchall()
+
+        if not rows:
+            return None, None
+
+        word = max((word for word, _ in rows), key=len)
+        entry = "\n".join(entry for w, entry in rows if w == word)
+
+        return word, entry
+
+    def pinyin_items(self, pinyin):
+        """Get the list of entries with the PINYIN, given either with
+        tone numbers ('wang2 zi3') or with tone marks ('wáng zǐ').
+
+        """
+
+        return [
+            entry
+            for (entry,) in self.connection.execute(
+                "SELECT entry FROM entries "
+                "WHERE pinyin = ? OR pinyin_marks = ? ORDER BY id",
+                (pinyin, pinyin),
+            )
+        ]
+
+    def search_senses(self, query, limit=20):
+        """Get the list of at most LIMIT entries whose senses match
+        the FTS5 QUERY, best matches first.
+
+        Example:
+
+        trie.search_senses("prince")
+        trie.search_senses('"son of a king"')
+
+        """
+
+        return [
+            entry
+            for (entry,) in self.connection.execute(
+                "SELECT entries.entry FROM senses_fts "
+                "JOIN entries ON entries.id = senses_fts.rowid "
+                "WHERE senses_fts MATCH ? ORDER BY rank LIMIT ?",
+                (query, limit),
+            )
+        ]
+
+
+def sqlite_lookup(trie, text, text_length, start):
+    """Find the longest word in the SqliteTrie TRIE which is a prefix
+    of TEXT[START:TEXT_LENGTH].
+
+    The function can be used in place of trie_lookup(): it returns
+    the tuple (word, entry, end) for the longest word found and
+    (None, None, START) when no word has been found.
+
+    """
+
+    word, entry = trie.longest_prefix(text, start, text_length)
+
+    if word is None:
+        return None, None, start
+
+    return word, entry, start + len(word)
+
+
+def load_sqlite_trie(form=None):
+    """Open the CC-CEDICT SQLite database for the hanzi FORM
+    ('traditional' or 'simplified').  When no FORM is given, the
+    default form from the settings is used.
+
+    """
+
+    from glottai.cedict.settings import settings
+
+    if form is None:
+        form = settings.get_hanzi_default_form()
+
+    filename = settings.get_cedict_sqlite_file()
+
+    return SqliteTrie(filename, form)
@@ -0,0 +1,409 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""src/glottai/cedict/utilities/build.py:
+
+Build the CC-CEDICT trie files.
+
+"""
+
+import time
+
+from glottai.cedict.settings import settings
+
+
+class CedictBuildException(Exception):
+    pass
+
+
+def build_cedict_trie_files(
+    cedict_filename=None, format="readable", parallel=False, report=False
+):
+    """Build the traditional and the simplified CC-CEDICT trie files
+    from the cedict file CEDICT_FILENAME.
+
+    CEDICT_FILENAME defaults to the local copy of the CC-CEDICT
+    archive file.  The archive is streamed and parsed only once for
+    both tries; it is not gunzipped to disk.  The trie files are
+    written to the paths returned by settings.get_cedict_trie_file()
+    and their double-array versions to the paths returned by
+    settings.get_cedict_trie_da_file().  FORMAT can either be
+    'compact' or 'readable'.
+
+    When PARALLEL is True, the two trie files are written by two
+    forked worker processes at the same time.  On platforms without
+    fork() the files are written one after the other.  When REPORT is
+    True, the time needed for every stage and the total wall-clock
+    time are printed.
+
+    Returns the variables of the cedict file.
+
+    Example:
+
+    download(url, settings.get_cedict_gz_file())
+    build_cedict_trie_files(parallel=True, report=True)
+
+    > Parsed .../cedict.txt.gz in 2140.7 ms
+    > Wrote .../cedict_trie_traditional.py in 461.2 ms
+    > Wrote .../cedict_trie_traditional.da in 1530.4 ms
+    > ...
+    > Built both trie files in 2650.3 ms
+
+    """
+
+    from glottai.cedict.utilities.cedict import read_cedict_tries
+
+    if cedict_filename is None:
+        cedict_filename = settings.get_cedict_gz_file()
+
+    start_time = time.perf_counter()
+
+    header, variables, traditional_trie, simplified_trie = (
+        read_cedict_tries(cedict_filename)
+    )
+
+    if report:
+        _report(f"Parsed {cedict_filename}", start_time)
+
+    jobs = [
+        (
+            settings.get_cedict_trie_file(form),
+            settings.get_cedict_trie_da_file(form),
+            header,
+            variables,
+            trie,
+            format,
+        )
+        for form, trie in (
+            ("traditional", traditional_trie),
+            ("simplified", simplified_trie),
+        )
+    ]
+
+    if parallel and _can_fork():
+        _write_trie_files_parallel(jobs, report)
+
+    else:
+        for job in jobs:
+            _write_trie_file(*job, report=report)
+
+    if report:
+        _report("Built both trie files", start_time)
+
+    return variables
+
+
+def build_cedict_entry_fields_file(cedict_filename=None, report=False):
+    """Parse the entries of the cedict file CEDICT_FILENAME once into
+    their fields and write them column by column to the entry field
+    file returned by settings.get_cedict_entry_fields_file().
+
+    CEDICT_FILENAME defaults to the local copy of the CC-CEDICT
+    archive file.  See build_cedict_trie_files() for REPORT.
+
+    Example:
+
+    build_cedict_entry_fields_file()
+    fields = EntryFields.open(settings.get_cedict_entry_fields_file())
+    trie = fields.trie('simplified')
+
+    """
+
+    from glottai.cedict.utilities.cedict import read_cedict_entry_fields
+
+    if cedict_filename is None:
+        cedict_filename = settings.get_cedict_gz_file()
+
+    start_time = time.perf_counter()
+
+    entry_fields, _, _ = read_cedict_entry_fields(cedict_filename)
+
+    if report:
+        _report(f"Parsed {cedict_filename}", start_time)
+
+    entry_fields_file = settings.get_cedict_entry_fields_file()
+    entry_fields.write(entry_fields_file)
+
+    if report:
+        _report(f"Wrote {entry_fields_file}", start_time)
+
+    return entry_fields
+
+
+def build_cedict_index_files(cedict_filename=None, report=False):
+    """Build the entry field file of the cedict file CEDICT_FILENAME
+    with build_cedict_entry_fields_file() and the indexes over its
+    entries: the inverted index over their senses and the index by
+    their pinyin.  The indexes are written to the files returned by
+    settings.get_cedict_sense_index_file() and
+    settings.get_cedict_pinyin_index_file(); their entry IDs refer to
+    the entry field file.
+
+    See build_cedict_trie_files() for CEDICT_FILENAME and REPORT.
+
+    Example:
+
+    build_cedict_index_files()
+    fields = EntryFields.open(settings.get_cedict_entry_fields_file())
+    index = load_cedict_sense_index()
+    [fields.get(entry_id) for entry_id in index.search("prince")]
+    index = load_cedict_pinyin_index()
+    [fields.get(entry_id) for entry_id in index.lookup("wangzi")]
+
+    """
+
+    from glottai.cedict.index.pinyin_index import PinyinIndex
+    from glottai.cedict.index.sense_index import SenseIndex
+
+    entry_fields = build_cedict_entry_fields_file(
+        cedict_filename, report=report
+    )
+
+    for index_class, index_file in (
+        (SenseIndex, settings.get_cedict_sense_index_file()),
+        (PinyinIndex, settings.get_cedict_pinyin_index_file()),
+    ):
+        start_time = time.perf_counter()
+
+        index_class.from_entry_fields(entry_fields).write(index_file)
+
+        if report:
+            _report(f"Wrote {index_file}", start_time)
+
+
+def build_cedict_sqlite_file(cedict_filename=None, report=False):
+    """Write the cedict file CEDICT_FILENAME to the SQLite database
+    returned by settings.get_cedict_sqlite_file().
+
+    CEDICT_FILENAME defaults to the local copy of the CC-CEDICT
+    archive file.  See build_cedict_trie_files() for REPORT.
+
+    Example:
+
+    build_cedict_sqlite_file()
+    trie = load_sqlite_trie('simplified')
+
+    """
+
+    from glottai.cedict.trie.sqlite.store import write_sqlite_store
+
+    if cedict_filename is None:
+        cedict_filename = settings.get_cedict_gz_file()
+
+    start_time = time.perf_counter()
+
+    sqlite_file = settings.get_cedict_sqlite_file()
+    write_sqlite_store(sqlite_file, cedict_filename)
+
+    if report:
+        _report(f"Wrote {sqlite_file}", start_time)
+
+
+def update_cedict_trie_files(
+    old_cedict_filename,
+    cedict_filename=None,
+    format="readable",
+    check=False,
+    report=False,
+):
+    """Update the traditional and the simplified CC-CEDICT trie files
+    with the changes between the cedict files OLD_CEDICT_FILENAME and
+    CEDICT_FILENAME instead of rebuilding them from scratch.
+
+    The trie files have to be built from OLD_CEDICT_FILENAME, usually
+    the last backup of the local CC-CEDICT copy.  CEDICT_FILENAME
+    defaults to the local copy of the CC-CEDICT archive file.  The
+    tries are loaded, patched in place with apply_changes() - the
+    entries of the added and changed words are put in the order of
+    CEDICT_FILENAME - and written back together with the header of
+    CEDICT_FILENAME.  The
+    double-array trie files are written again from the patched tries.
+
+    When CHECK is True, the patched tries are compared with tries
+    built from scratch from CEDICT_FILENAME and a CedictBuildException
+    is raised - before any file is written - when they differ.  See
+    build_cedict_trie_files() for FORMAT and REPORT.
+
+    Returns the list of applied changes.
+
+    Example:
+
+    update_cedict_trie_files(backup_file, check=True, report=True)
+
+    > Found 312 changes in 1204.5 ms
+    > ...
+
+    """
+
+    from glottai.cedict.trie.simple.load import load_cedict_trie
+    from glottai.cedict.trie.simple.update import apply_changes
+    from glottai.cedict.utilities.cedict import (
+        get_cedict_entry_word,
+        read_cedict_entries,
+        read_cedict_header,
+    )
+    from glottai.cedict.utilities.diff import iter_diff
+
+    if cedict_filename is None:
+        cedict_filename = settings.get_cedict_gz_file()
+
+    start_time = time.perf_counter()
+
+    changes = list(iter_diff(old_cedict_filename, cedict_filename))
+    header, variables = read_cedict_header(cedict_filename)
+
+    if report:
+        _report(f"Found {len(changes)} changes", start_time)
+
+    # The entries of the words added or changed in both forms
+    words = {
+        get_cedict_entry_word(change.new, form=form)
+        for change in changes
+        if change.new is not None
+        for form in ["traditional", "simplified"]
+    }
+    entries = [
+        entry
+        for entry in read_cedict_entries(cedict_filename)
+        if get_cedict_entry_word(entry, form="traditional") in words
+        or get_cedict_entry_word(entry, form="simplified") in words
+    ]
+
+    tries = {}
+    for form in ["traditional", "simplified"]:
+        _, trie = load_cedict_trie(form)
+        tries[form] = apply_changes(trie, changes, form=form, entries=entries)
+
+    if report:
+        _report("Patched both tries", start_time)
+
+    if check:
+        _check_tries(tries, cedict_filename)
+
+        if report:
+            _report("Checked both tries", start_time)
+
+    for form, trie in tries.items():
+        _write_trie_file(
+            settings.get_cedict_trie_file(form),
+            settings.get_cedict_trie_da_file(form),
+            header,
+            variables,
+            trie,
+            format,
+            report,
+        )
+
+    if report:
+        _report("Updated both trie files", start_time)
+
+    return changes
+
+
+def _check_tries(tries, cedict_filename):
+    """Raise a CedictBuildException when the TRIES differ from the
+    tries built from scratch from CEDICT_FILENAME.
+
+    """
+
+    from glottai.cedict.trie.simple.update import trie_differences
+    from glottai.cedict.utilities.cedict import read_cedict_tries
+
+    _, _, traditional_trie, simplified_trie = read_cedict_tries(
+        cedict_filename
+    )
+
+    for form, fresh_trie in (
+        ("traditional", traditional_trie),
+        ("simplified", simplified_trie),
+    ):
+        words = list(trie_differences(tries[form], fresh_trie))
+        if words:
+            raise CedictBuildException(
+                f"The updated {form} trie differs from a fresh build "
+                f"for {len(words)} words: {', '.join(words[:10])}"
+            )
+
+
+def _write_trie_file(
+    trie_file, da_file, header, variables, trie, format, report
+):
+    """Write HEADER, VARIABLES and TRIE to TRIE_FILE and VARIABLES and
+    the double-array representation of TRIE to DA_FILE.
+
+    """
+
+    from glottai.cedict.trie.double_array.build import (
+        write_double_array_trie_to_file,
+    )
+    from glottai.cedict.trie.simple.write import write_trie_to_file
+
+    start_time = time.perf_counter()
+
+    with open(trie_file, "w", encoding="utf-8") as fh:
+        write_trie_to_file(fh, header, variables, trie, format=format)
+
+    if report:
+        _report(f"Wrote {trie_file}", start_time)
+
+    start_time = time.perf_counter()
+
+    write_double_array_trie_to_file(da_file, variables, trie)
+
+    if report:
+        _report(f"Wrote {da_file}", start_time)
+
+
+def _can_fork():
+    """True when worker processes can be forked; False otherwise."""
+
+    import multiprocessing
+
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def _write_trie_files_parallel(jobs, report):
+    """Run _write_trie_file() for every job of JOBS in a forked worker
+    process of its own.  The forked workers share the tries of the
+    parent process; nothing is pickled.
+
+    """
+
+    import multiprocessing
+
+    context = multiprocessing.get_context("fork")
+
+    workers = [
+        context.Process(target=_write_trie_file, args=(*job, report))
+        for job in jobs
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    for worker, job in zip(workers, jobs):
+        if worker.exitcode != 0:
+            raise CedictBuildException(
+                f"Writing {job[0]} failed with exit code {worker.exitcode}"
+            )
+
+
+def _report(message, start_time):
+    """Print MESSAGE with the time passed since START_TIME."""
+
+    milliseconds = (time.perf_counter() - start_time) * 1000
+    print(f"{message} in {milliseconds:.1f} ms")
@@ -173,6 +173,304 @@ def _read_cedict_variables_fh(cedict_fh, binary=False):
     return variables
 
 
+def read_cedict_entries(cedict_filename):
+    """Iterate over the entry lines of the cedict file
+    CEDICT_FILENAME.  Comment lines are skipped and trailing newlines
+    removed.
+
+    Example:
+
+    for entry in read_cedict_entries(cedict_filename):
+        print(entry)
+
+    > 學 学 [xue2] /to learn/to study/to imitate/science/-ology/
+    > 習 习 [Xi2] /surname Xi/
+    > ...
+
+    """
+
+    with open_cedict(cedict_filename) as fh:
+        for line in fh:
+            if not line.startswith("#"):
+                yield line.rstrip("\n")
+
+
+def open_cedict(cedict_filename):
+    """Open the cedict file CEDICT_FILENAME for reading text.  Files
+    ending in '.gz' are decompressed on the fly.
+
+    """
+
+    if str(cedict_filename).endswith(".gz"):
+        import gzip
+
+        return gzip.open(cedict_filename, "rt", encoding="utf-8")
+
+    else:
+        return open(cedict_filename, "r", encoding="utf-8")
+
+
+def _read_cedict_header_fh(cedict_fh):
+    """Read the header of the cedict file represented by the text
+    file handle CEDICT_FH.
+
+    Returns the tuple (header, variables, line): the comment lines of
+    the header without the variable lines and trailing whitespace,
+    the variables as returned by read_cedict_variables() and the first
+    entry line, which has already been read from CEDICT_FH.  LINE is
+    '' when the file has no entries.
+
+    """
+
+    header = []
+    variables = {}
+
+    line = cedict_fh.readline()
+    while line.startswith("#"):
+        if _is_header_line(line):
+            # Split variable name and value
+            name, value = line[3:].strip().split("=")
+            variables[name] = value
+
+        else:
+            header.append(line.rstrip())
+
+        # Read next line
+        line = cedict_fh.readline()
+
+    return header, variables, line
+
+
+def read_cedict_header(cedict_filename):
+    """Read the header of the cedict file CEDICT_FILENAME and return
+    the pair (header, variables).  See read_cedict().
+
+    """
+
+    with open_cedict(cedict_filename) as fh:
+        header, variables, _ = _read_cedict_header_fh(fh)
+
+    return header, variables
+
+
+def read_cedict(cedict_filename):
+    """Read the cedict file CEDICT_FILENAME as a stream.
+
+    The header is parsed right away; the entries are read lazily while
+    iterating over the returned entry iterator, so the file - plain
+    or gzip compressed - is read only once and never decompressed to
+    disk.
+
+    Returns the tuple (header, variables, entries).
+
+    Example:
+
+    header, variables, entries = read_cedict("cedict.txt.gz")
+    for entry in entries:
+        print(entry)
+
+    > 學 学 [xue2] /to learn/to study/to imitate/science/-ology/
+    > ...
+
+    """
+
+    fh = open_cedict(cedict_filename)
+    try:
+        header, variables, line = _read_cedict_header_fh(fh)
+    except BaseException:
+        fh.close()
+        raise
+
+    def entries():
+        with fh:
+            if line:
+                yield line.rstrip("\n")
+            for entry in fh:
+                if not entry.startswith("#"):
+                    yield entry.rstrip("\n")
+
+    return header, variables, entries()
+
+
+def get_cedict_entry_word(entry, form="traditional"):
+    """Get the traditional or simplified word of a CC-CEDICT ENTRY.
+
+    Example:
+
+    entry: '學習 学习 [xue2 xi2] /to learn/to study/'
+    get_cedict_entry_word(entry, form='traditional') -> '學習'
+    get_cedict_entry_word(entry, form='simplified')  -> '学习'
+
+    """
+
+    traditional, simplified, _ = entry.split(" ", 2)
+
+    return traditional if form == "traditional" else simplified
+
+
+def parse_cedict_entry(entry):
+    """Split the CC-CEDICT ENTRY into its fields.
+
+    Returns the tuple (traditional, simplified, pinyin, senses).
+
+    Example:
+
+    parse_cedict_entry('學習 学习 [xue2 xi2] /to learn/to study/')
+
+    > ('學習', '学习', 'xue2 xi2', ['to learn', 'to study'])
+
+    """
+
+    traditional, simplified, rest = entry.split(" ", 2)
+
+    # Split '[pin1 yin1] /sense/.../sense/'
+    end = rest.index("]")
+    pinyin = rest[1:end]
+    senses = rest[end + 1 :].strip().strip("/").split("/")
+
+    return traditional, simplified, pinyin, senses
+
+
+def read_cedict_trie_items(cedict_filename, form="traditional"):
+    """Iterate over the (word, entry) pairs to be inserted into the
+    CC-CEDICT trie for the hanzi FORM ('traditional' or
+    'simplified').  The pinyin of the entries is converted to tone
+    marks.
+
+    Example:
+
+    for word, entry in read_cedict_trie_items(cedict_filename):
+        trie_insert(trie, word, entry)
+
+    """
+
+    from glottai.cedict.pinyin import tone_numbers_to_marks_string
+
+    for entry in read_cedict_entries(cedict_filename):
+        word = get_cedict_entry_word(entry, form=form)
+        yield word, tone_numbers_to_marks_string(entry)
+
+
+def read_cedict_entry_tries(cedict_filename):
+    """Read the cedict file CEDICT_FILENAME into an EntryTable and
+    a traditional and a simplified trie holding entry IDs.
+
+    Every entry (with the pinyin converted to tone marks) is stored
+    only once in the entry table; both tries refer to it by its ID,
+    which is the index of the entry in the cedict file.
+
+    Returns the tuple (entry_table, traditional_trie, simplified_trie).
+
+    Example:
+
+    table, _, trie = read_cedict_entry_tries(cedict_filename)
+    tokens = lexer(trie, text, 0, entries=table)
+
+    """
+
+    from glottai.cedict.datastructures.entry_table.entry_table import (
+        EntryTable,
+    )
+    from glottai.cedict.pinyin import tone_numbers_to_marks_string
+    from glottai.cedict.trie.simple.insert import trie_insert_entry_id
+
+    entries = []
+    traditional_trie = {}
+    simplified_trie = {}
+    for entry_id, entry in enumerate(read_cedict_entries(cedict_filename)):
+        traditional, simplified, _ = entry.split(" ", 2)
+        trie_insert_entry_id(traditional_trie, traditional, entry_id)
+        trie_insert_entry_id(simplified_trie, simplified, entry_id)
+        entries.append(tone_numbers_to_marks_string(entry))
+
+    entry_table = EntryTable.from_strings(entries)
+
+    return entry_table, traditional_trie, simplified_trie
+
+
+def read_cedict_tries(cedict_filename):
+    """Build the traditional and the simplified trie from the cedict
+    file CEDICT_FILENAME in a single streaming pass.
+
+    Every entry line is read, split and converted to tone marks only
+    once; both tries share the resulting entry string.  CEDICT_FILENAME
+    can be the gzip compressed file as downloaded from MDBG.
+
+    Returns the tuple (header, variables, traditional_trie,
+    simplified_trie).
+
+    Example:
+
+    header, variables, traditional_trie, simplified_trie = (
+        read_cedict_tries(settings.get_cedict_gz_file())
+    )
+
+    """
+
+    from glottai.cedict.pinyin import tone_numbers_to_marks_string
+    from glottai.cedict.trie.simple.insert import trie_insert_all
+
+    header, variables, entries = read_cedict(cedict_filename)
+
+    # Parse every entry once
+    parsed = []
+    for entry in entries:
+        traditional, simplified, _ = entry.split(" ", 2)
+        entry = tone_numbers_to_marks_string(entry)
+        parsed.append((traditional, simplified, entry))
+
+    # Insert the same entry objects into both tries
+    traditional_trie = trie_insert_all(
+        {}, ((traditional, entry) for traditional, _, entry in parsed)
+    )
+    simplified_trie = trie_insert_all(
+        {}, ((simplified, entry) for _, simplified, entry in parsed)
+    )
+
+    return header, variables, traditional_trie, simplified_trie
+
+
+def read_cedict_entry_fields(cedict_filename):
+    """Read the cedict file CEDICT_FILENAME into an EntryFields table
+    and a traditional and a simplified trie holding entry IDs.
+
+    Like read_cedict_entry_tries() but every entry is parsed once
+    into its fields, which are stored column by column, so that
+    lookups can return the fields without parsing the entry again.
+
+    Returns the tuple (entry_fields, traditional_trie,
+    simplified_trie).
+
+    Example:
+
+    fields, _, trie = read_cedict_entry_fields(cedict_filename)
+    tokens = lexer(trie, text, 0, entries=fields)
+    tokens[0].fields
+
+    > [Entry(traditional='學習', simplified='学习', pinyin='xue2 xi2',
+    >        pinyin_marks='xué xí', senses=['to learn', 'to study'])]
+
+    """
+
+    from glottai.cedict.datastructures.entry_table.entry_fields import (
+        EntryFields,
+    )
+    from glottai.cedict.trie.simple.insert import trie_insert_entry_id
+
+    entries = []
+    traditional_trie = {}
+    simplified_trie = {}
+    for entry_id, entry in enumerate(read_cedict_entries(cedict_filename)):
+        entry = parse_cedict_entry(entry)
+        trie_insert_entry_id(traditional_trie, entry[0], entry_id)
+        trie_insert_entry_id(simplified_trie, entry[1], entry_id)
+        entries.append(entry)
+
+    entry_fields = EntryFields.from_parsed_entries(entries)
+
+    return entry_fields, traditional_trie, simplified_trie
+
+
 def get_repository_cedict_version():
     """Get the current CC-CEDICT version (timestamp) from the repository."""
 
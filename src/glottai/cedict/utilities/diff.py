@@ -20,6 +20,14 @@ Print the differences between the entries of two CC-CEDICT files.
 
 """
 
+from collections import namedtuple
+
+# A change between two CC-CEDICT files.
+# OP is one of 'add', 'remove' or 'change';
+# OLD and NEW are the old and the new entry line
+# or None for added and removed entries respectively.
+Change = namedtuple("Change", ["op", "old", "new"])
+
 
 def _next_line(fh):
     """Get the next non-comment line."""
@@ -62,10 +70,12 @@ def _get_entry(entry):
     return word
 
 
-def diff(file1, file2):
-    """Compare the CC-CEDICT FILE1 with the CC-CEDICT FILE2 line by line.
+def iter_diff(file1, file2):
+    """Compare the CC-CEDICT FILE1 with the CC-CEDICT FILE2 line by line
+    and yield the differences as Change records.
 
     The FILE1 is supposed to be an older CC-CEDICT version compared to FILE2.
+    Both files can be gzip compressed.
 
     Example:
 
@@ -83,27 +93,24 @@ def diff(file1, file2):
     ddd ddd new entry for ddd
     --
 
-    diff:
-    --
-
-    + bbb bbb added entry for bbb
-
-    - ccc ccc eliminated entry
+    list(iter_diff(old_file, new_file))
 
-    < ddd ddd old entry for ddd
-    > ddd ddd new entry for ddd
-
-    --
+    > [Change(op='add', old=None, new='bbb bbb added entry for bbb'),
+    >  Change(op='remove', old='ccc ccc eliminated entry', new=None),
+    >  Change(op='change',
+    >         old='ddd ddd old entry for ddd',
+    >         new='ddd ddd new entry for ddd')]
 
     """
 
-    with open(file1, "r") as fh1:
-        with open(file2, "r") as fh2:
+    from glottai.cedict.utilities.cedict import open_cedict
+
+    with open_cedict(file1) as fh1:
+        with open_cedict(file2) as fh2:
             # Start with the first entries of both files
             line1 = _next_line(fh1)
             line2 = _next_line(fh2)
 
-            print("")
             while True:
                 # Compare the lines
                 if line1 == line2:
@@ -127,8 +134,7 @@ def diff(file1, file2):
                 else:  # line1 != line2
                     if line2 is None:
                         # The entry for word1 has been eliminated
-                        print("-", line1)
-                        print("")
+                        yield Change("remove", line1, None)
 
                         # Get next non-comment line from file1
                         line1 = _next_line(fh1)
@@ -138,8 +144,7 @@ def diff(file1, file2):
 
                     if line1 is None:
                         # An entry for word2 has been newly added
-                        print("+", line2)
-                        print("")
+                        yield Change("add", None, line2)
 
                         # Get next non-comment line from file2
                         line2 = _next_line(fh2)
@@ -153,8 +158,7 @@ def diff(file1, file2):
 
                     if word2 is None or word1 < word2:
                         # The entry for word1 has been eliminated
-                        print("-", line1)
-                        print("")
+                        yield Change("remove", line1, None)
 
                         # Get next non-comment line from file1
                         line1 = _next_line(fh1)
@@ -164,8 +168,7 @@ def diff(file1, file2):
 
                     elif word1 > word2:
                         # An entry for word2 has been newly added
-                        print("+", line2)
-                        print("")
+                        yield Change("add", None, line2)
 
                         # Get next non-comment line from file2
                         line2 = _next_line(fh2)
@@ -175,9 +178,7 @@ def diff(file1, file2):
 
                     else:  # word1 == word2
                         # The entry for the given word has been edited
-                        print("<", line1)
-                        print(">", line2)
-                        print("")
+                        yield Change("change", line1, line2)
 
                         # Get next non-comment lines from files
                         line1 = _next_line(fh1)
@@ -185,3 +186,53 @@ def diff(file1, file2):
 
                         # and continue with them
                         continue
+
+
+def diff(file1, file2):
+    """Compare the CC-CEDICT FILE1 with the CC-CEDICT FILE2 line by line.
+
+    The FILE1 is supposed to be an older CC-CEDICT version compared to FILE2.
+
+    Example:
+
+    old file:
+    --
+    aaa aaa entry for aaa
+    ccc ccc eliminated entry
+    ddd ddd old entry for ddd
+    --
+
+    new file:
+    --
+    aaa aaa entry for aaa
+    bbb bbb added entry for bbb
+    ddd ddd new entry for ddd
+    --
+
+    diff:
+    --
+
+    + bbb bbb added entry for bbb
+
+    - ccc ccc eliminated entry
+
+    < ddd ddd old entry for ddd
+    > ddd ddd new entry for ddd
+
+    --
+
+    """
+
+    print("")
+    for change in iter_diff(file1, file2):
+        if change.op == "add":
+            print("+", change.new)
+
+        elif change.op == "remove":
+            print("-", change.old)
+
+        else:  # change.op == "change"
+            print("<", change.old)
+            print(">", change.new)
+
+        print("")
@@ -86,3 +86,80 @@ def format_backup_extension(cedict_file):
     backup_extension = format_UTC_date_as_file_extension(date_str)
 
     return backup_extension
+
+
+def _display_width(string):
+    """The number of terminal columns needed to display STRING: wide
+    characters like hanzi take two columns.
+
+    """
+
+    import unicodedata
+
+    return sum(
+        2 if unicodedata.east_asian_width(char) in "WF" else 1
+        for char in string
+    )
+
+
+def _pad(string, width):
+    """Pad STRING with blanks to the display WIDTH.  At least one blank
+    is appended to separate the following column.
+
+    """
+
+    return string + " " * max(width - _display_width(string), 1)
+
+
+def format_entry(entry, columns=None):
+    """Format the pre-parsed CC-CEDICT ENTRY - an Entry record as
+    returned by EntryFields.get_fields() - in columns and return the
+    resulting lines.
+
+    COLUMNS maps 'indent', 'simplified', 'traditional', 'pinyin' and
+    'senses' to column widths.  It defaults to the 'formatting.columns'
+    setting.  The senses are wrapped to the width of the senses
+    column.
+
+    Example:
+
+    format_entry(entry, columns={'indent': 2, 'simplified': 10,
+        'traditional': 12, 'pinyin': 14, 'senses': 60})
+
+    > ['  王子      王子        wáng zǐ       prince; son of a king']
+
+    """
+
+    import textwrap
+
+    if columns is None:
+        from glottai.cedict.settings import settings
+
+        columns = settings.get_formatting_columns_settings()
+
+    prefix = (
+        " " * columns["indent"]
+        + _pad(entry.simplified, columns["simplified"])
+        + _pad(entry.traditional, columns["traditional"])
+        + _pad(entry.pinyin_marks, columns["pinyin"])
+    )
+
+    senses = textwrap.wrap("; ".join(entry.senses), columns["senses"])
+    if not senses:
+        return [prefix.rstrip()]
+
+    # Indent the continuation lines to the senses column
+    indent = " " * _display_width(prefix)
+
+    return [prefix + senses[0]] + [indent + line for line in senses[1:]]
+
+
+def format_entries(entries, columns=None):
+    """Format the list of pre-parsed CC-CEDICT ENTRIES with
+    format_entry() and return the lines joined with newlines.
+
+    """
+
+    return "\n".join(
+        line for entry in entries for line in format_entry(entry, columns)
+    )
@@ -0,0 +1,135 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""tests/glottai/cedict/datastructures/entry_table/test_entry_fields.py:
+
+Unit tests for the EntryFields table of pre-parsed entries.
+
+Run with:
+
+pytest tests/glottai/cedict/datastructures/entry_table/test_entry_fields.py
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import pytest
+
+from glottai.cedict.datastructures.entry_table.entry_fields import (
+    Entry,
+    EntryFields,
+)
+from glottai.cedict.datastructures.entry_table.entry_table import (
+    EntryTableException,
+)
+from glottai.cedict.lexer.lexer import lexer
+from glottai.cedict.utilities.cedict import (
+    parse_cedict_entry,
+    read_cedict_entry_fields,
+    read_cedict_entry_tries,
+)
+from glottai.cedict.utilities.format import format_entry
+from glottai.cedict.utilities.paths import get_material_dir
+
+
+_test_entries = [
+    "王 王 [wang2] /king or monarch/",
+    "王子 王子 [wang2 zi3] /prince/son of a king/",
+    "葉 叶 [Ye4] /surname Ye/",
+    "葉 叶 [ye4] /leaf/page/see 葉子|叶子[ye4 zi5]/",
+]
+
+_cedict_xiaowangzi_file = (
+    get_material_dir() / ".cedict" / "cedict_xiaowangzi.txt"
+)
+
+
+def _entry_fields():
+    return EntryFields.from_parsed_entries(
+        [parse_cedict_entry(entry) for entry in _test_entries]
+    )
+
+
+def test_entry_fields_000():
+    fields = _entry_fields()
+
+    assert len(fields) == 4
+    assert fields[1] == Entry(
+        "王子", "王子", "wang2 zi3", "wáng zǐ", ["prince", "son of a king"]
+    )
+    assert fields[3].senses == ["leaf", "page", "see 葉子|叶子[yè zi]"]
+    assert fields.get(0) == "王 王 [wáng] /king or monarch/"
+    assert fields.get((2, 3)) == (
+        "葉 叶 [Yè] /surname Ye/\n葉 叶 [yè] /leaf/page/see 葉子|叶子[yè zi]/"
+    )
+    assert fields.get_fields(0) == [fields[0]]
+    assert fields.trie("simplified") == {
+        "王": {True: 0, "子": {True: 1}},
+        "叶": {True: (2, 3)},
+    }
+
+
+def test_entry_fields_010(tmp_path):
+    filename = tmp_path / "entries.ef"
+    _entry_fields().write(filename)
+
+    with EntryFields.open(filename) as fields:
+        assert len(fields) == 4
+        assert [fields[i] for i in range(4)] == [
+            _entry_fields()[i] for i in range(4)
+        ]
+
+
+def test_entry_fields_020(tmp_path):
+    filename = tmp_path / "entries.ef"
+    filename.write_bytes(b"no entry field table")
+
+    with pytest.raises(EntryTableException):
+        EntryFields.open(filename)
+
+
+def test_read_cedict_entry_fields_000():
+    fields, traditional_trie, simplified_trie = read_cedict_entry_fields(
+        _cedict_xiaowangzi_file
+    )
+    table, _, _ = read_cedict_entry_tries(_cedict_xiaowangzi_file)
+
+    assert traditional_trie == simplified_trie
+    assert [fields.get(i) for i in range(4)] == [table[i] for i in range(4)]
+
+    tokens = lexer(simplified_trie, "王子", 0, entries=fields)
+    assert tokens[0].entry == "王子 王子 [wáng zǐ] /prince/son of a king/"
+    assert tokens[0].fields == [fields[3]]
+
+
+def test_format_entry_000():
+    columns = {
+        "indent": 2,
+        "simplified": 6,
+        "traditional": 6,
+        "pinyin": 10,
+        "senses": 20,
+    }
+
+    assert format_entry(_entry_fields()[1], columns) == [
+        "  王子  王子  wáng zǐ   prince; son of a",
+        "                        king",
+    ]
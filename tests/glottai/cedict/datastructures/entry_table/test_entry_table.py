@@ -0,0 +1,114 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""tests/glottai/cedict/datastructures/entry_table/test_entry_table.py:
+
+Unit tests for the EntryTable string table.
+
+Run with:
+
+pytest tests/glottai/cedict/datastructures/entry_table/test_entry_table.py
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import pytest
+
+from glottai.cedict.datastructures.entry_table.entry_table import (
+    EntryTable,
+    EntryTableException,
+)
+from glottai.cedict.lexer.lexer import lexer
+from glottai.cedict.lexer.token import Token, TType
+from glottai.cedict.trie.simple.insert import trie_insert_entry_id
+
+
+_test_entries = [
+    "王 王 [wáng] /king or monarch/",
+    "王子 王子 [wáng zǐ] /prince/son of a king/",
+    "葉 叶 [Yè] /surname Ye/",
+    "葉 叶 [yè] /leaf/page/",
+]
+
+
+def test_entry_table_000():
+    table = EntryTable.from_strings(_test_entries)
+
+    assert len(table) == 4
+    assert [table[i] for i in range(4)] == _test_entries
+    assert table.get(1) == "王子 王子 [wáng zǐ] /prince/son of a king/"
+    assert table.get((2, 3)) == "葉 叶 [Yè] /surname Ye/\n葉 叶 [yè] /leaf/page/"
+
+
+def test_entry_table_010(tmp_path):
+    filename = tmp_path / "entries.et"
+    EntryTable.from_strings(_test_entries).write(filename)
+
+    with EntryTable.open(filename) as table:
+        assert len(table) == 4
+        assert [table[i] for i in range(4)] == _test_entries
+
+
+def test_entry_table_020(tmp_path):
+    filename = tmp_path / "entries.et"
+    filename.write_bytes(b"no entry table")
+
+    with pytest.raises(EntryTableException):
+        EntryTable.open(filename)
+
+
+def test_lexer_entry_table_000():
+    """Both tries share the entries of one table."""
+
+    table = EntryTable.from_strings(_test_entries)
+    traditional_trie = {}
+    simplified_trie = {}
+    for entry_id, entry in enumerate(_test_entries):
+        traditional, simplified, _ = entry.split(" ", 2)
+        trie_insert_entry_id(traditional_trie, traditional, entry_id)
+        trie_insert_entry_id(simplified_trie, simplified, entry_id)
+
+    assert simplified_trie == {
+        "王": {True: 0, "子": {True: 1}},
+        "叶": {True: (2, 3)},
+    }
+
+    tokens = lexer(simplified_trie, "王子叶", 0, entries=table)
+    assert tokens == [
+        Token(
+            ttype=TType.CEDICT,
+            word="王子",
+            entry="王子 王子 [wáng zǐ] /prince/son of a king/",
+            start=0,
+            end=2,
+        ),
+        Token(
+            ttype=TType.CEDICT,
+            word="叶",
+            entry="葉 叶 [Yè] /surname Ye/\n葉 叶 [yè] /leaf/page/",
+            start=2,
+            end=3,
+        ),
+    ]
+
+    tokens = lexer(traditional_trie, "葉", 0, entries=table)
+    assert tokens[0].entry == "葉 叶 [Yè] /surname Ye/\n葉 叶 [yè] /leaf/page/"
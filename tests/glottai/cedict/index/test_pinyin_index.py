@@ -0,0 +1,145 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""tests/glottai/cedict/index/test_pinyin_index.py:
+
+Test for the index of the entries by their pinyin.
+
+pytest -q tests/glottai/cedict/index/test_pinyin_index.py
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import pytest
+
+from glottai.cedict.index.pinyin_index import (
+    PinyinIndex,
+    PinyinIndexException,
+    pinyin_key,
+)
+from glottai.cedict.utilities.cedict import read_cedict_entry_fields
+from glottai.cedict.utilities.paths import get_material_dir
+
+
+_cedict_example_file = (
+    get_material_dir() / ".cedict" / "cedict_example_4x3.txt"
+)
+
+
+@pytest.fixture
+def fields_and_index():
+    fields, _, _ = read_cedict_entry_fields(_cedict_example_file)
+    return fields, PinyinIndex.from_entry_fields(fields)
+
+
+def _words(fields, entry_ids):
+    return [fields[entry_id].simplified for entry_id in entry_ids]
+
+
+def test_pinyin_key_000():
+    assert pinyin_key("Wáng zǐ") == "wang2zi3"
+    assert pinyin_key("wang2 zi3") == "wang2zi3"
+    assert pinyin_key("nu:e4") == "nüe4"
+    assert pinyin_key("nüè") == "nüe4"
+    assert pinyin_key("Xī'ān") == "xi1an1"
+    assert pinyin_key("Ka3 la1 · Ma3 ke4 si1") == "ka3la1ma3ke4si1"
+    assert pinyin_key("lv4") == pinyin_key("lu:4") == "lü4"
+    assert pinyin_key("V C D") == "vcd"
+
+
+def test_pinyin_index_000(fields_and_index):
+    fields, index = fields_and_index
+
+    assert _words(fields, index.lookup("xue2 xi2")) == ["学习"]
+    assert index.lookup("xué xí") == index.lookup("xue2 xi2")
+    assert index.lookup("xuexi") == index.lookup("xue2 xi2")
+    assert index.lookup("xue2xi") == index.lookup("xue2 xi2")
+    assert index.lookup("xue xi4") == []
+
+    # Toned and toneless queries
+    assert _words(fields, index.lookup("Xi2")) == ["习", "习"]
+    assert _words(fields, index.lookup("da xue")) == ["大学", "大学"]
+    assert _words(fields, index.lookup("da4 xue2 sheng")) == ["大学生"]
+    assert index.lookup("") == []
+    assert index.lookup("wangzi") == []
+
+
+def test_pinyin_index_010(fields_and_index):
+    fields, index = fields_and_index
+
+    assert _words(fields, index.prefix_lookup("daxue")) == [
+        "大学",
+        "大学",
+        "大学生",
+        "大学城",
+        "大学部",
+    ]
+    assert _words(fields, index.prefix_lookup("da4 xue2 b")) == ["大学部"]
+    assert len(index.prefix_lookup("da", limit=2)) == 2
+
+
+def test_pinyin_index_020():
+    index = PinyinIndex.from_pinyin(["nu:e4", "lu:4", "lu4", "wang2 zi3"])
+
+    assert index.lookup("nüè") == [0]
+    assert index.lookup("lv4") == [1]
+    assert index.lookup("lu") == [2]
+    assert index.lookup("wángzǐ") == [3]
+
+
+def test_pinyin_index_021():
+    # Entries with Latin letters in their pinyin
+    index = PinyinIndex.from_pinyin(["V C D", "wei4", "N V D I A", "nu:3"])
+
+    assert index.lookup("VCD") == [0]
+    assert index.lookup("vcd") == [0]
+    assert index.lookup("V C D") == [0]
+    assert index.lookup("NVDIA") == [2]
+    assert index.lookup("nv") == [3]
+    assert index.prefix_lookup("v") == [0]
+
+
+def test_pinyin_index_030(fields_and_index, tmp_path):
+    _, index = fields_and_index
+    filename = tmp_path / "pinyin_index.marshal"
+    index.write(filename)
+
+    assert PinyinIndex.load(filename).trie == index.trie
+
+    filename.write_bytes(b"no index")
+    with pytest.raises(PinyinIndexException):
+        PinyinIndex.load(filename)
+
+
+def test_pinyin_index_fuzzy_lookup_000(fields_and_index):
+    fields, index = fields_and_index
+
+    assert _words(fields, index.fuzzy_lookup("xuexu")) == ["学习"]
+    assert _words(fields, index.fuzzy_lookup("xué xí", 0)) == ["学习"]
+    assert _words(fields, index.fuzzy_lookup("xie")) == ["习", "习", "学"]
+    assert _words(fields, index.fuzzy_lookup("daxeu", 2)) == [
+        "大学",
+        "大学",
+        "大学部",
+    ]
+    assert index.fuzzy_lookup("daxeu") == []
+    assert index.fuzzy_lookup("") == []
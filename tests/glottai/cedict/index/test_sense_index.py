@@ -0,0 +1,147 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""tests/glottai/cedict/index/test_sense_index.py:
+
+Test for the inverted index over the senses of the entries.
+
+pytest -q tests/glottai/cedict/index/test_sense_index.py
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import pytest
+
+from glottai.cedict.index import sense_index
+from glottai.cedict.index.sense_index import (
+    SenseIndex,
+    SenseIndexException,
+    tokenize_sense,
+)
+from glottai.cedict.utilities.cedict import read_cedict_entry_fields
+from glottai.cedict.utilities.paths import get_material_dir
+
+
+_cedict_example_file = (
+    get_material_dir() / ".cedict" / "cedict_example_4x3.txt"
+)
+
+
+@pytest.fixture
+def fields_and_index():
+    fields, _, _ = read_cedict_entry_fields(_cedict_example_file)
+    return fields, SenseIndex.from_entry_fields(fields)
+
+
+def _words(fields, entry_ids):
+    return [fields[entry_id].simplified for entry_id in entry_ids]
+
+
+def test_tokenize_sense_000():
+    assert tokenize_sense("(bound form) to practice") == [
+        "bound",
+        "form",
+        "to",
+        "practice",
+    ]
+    assert tokenize_sense("CL:所[suo3]") == ["cl", "所"]
+
+
+def test_sense_index_000(fields_and_index):
+    fields, index = fields_and_index
+
+    # The exact sense 'university' comes first,
+    # followed by the shorter senses
+    assert _words(fields, index.search("University")) == [
+        "大学",
+        "大学城",
+        "上海大学",
+        "北京大学",
+        "东京大学",
+        "大学生",
+    ]
+    assert _words(fields, index.search("university", limit=2)) == [
+        "大学",
+        "大学城",
+    ]
+    assert index.search("prince") == []
+    assert index.search("") == []
+
+
+def test_sense_index_010(fields_and_index):
+    fields, index = fields_and_index
+
+    # Exact senses first, then ranked by BM25
+    assert _words(fields, index.search("to study")) == [
+        "学",
+        "习",
+        "学习",
+        "大学部",
+    ]
+    assert _words(fields, index.search("Peking University")[:1]) == [
+        "北京大学"
+    ]
+
+
+def test_sense_index_020(fields_and_index, monkeypatch):
+    """Queries with frequent tokens find the same entries when the
+    frequent tokens are only probed.
+
+    """
+
+    fields, index = fields_and_index
+    expected = index.search("university student", limit=3)
+
+    monkeypatch.setattr(sense_index, "RARE_SIZE", 1)
+    assert index.search("university student", limit=3) == expected
+    assert _words(fields, expected)[0] == "大学生"
+
+
+def test_sense_index_030(fields_and_index, tmp_path):
+    fields, index = fields_and_index
+    filename = tmp_path / "sense_index.marshal"
+    index.write(filename)
+
+    loaded = SenseIndex.load(filename)
+    assert len(loaded) == len(index)
+    assert loaded.search("to study") == index.search("to study")
+
+    filename.write_bytes(b"no index")
+    with pytest.raises(SenseIndexException):
+        SenseIndex.load(filename)
+
+
+def test_sense_index_040():
+    """An entry containing all frequent tokens of a query but none
+    of their top entries is ranked by its BM25 score.
+
+    """
+
+    entry_senses = (
+        [["cherry"]] * 50000
+        + [["apple"]] * 2000
+        + [["banana"]] * 2000
+        + [["apple", "banana"]]
+    )
+    index = SenseIndex.from_senses(entry_senses)
+
+    assert index.search("banana apple", 3) == [54000, 50000, 50001]
@@ -0,0 +1,113 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""tests/glottai/cedict/lexer/test_char_class.py:
+
+Test for the classes of the characters not found in the dictionary.
+
+pytest -q tests/glottai/cedict/lexer/test_char_class.py
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import pytest
+
+from glottai.cedict.lexer.char_class import (
+    TABLE_SIZE,
+    classify_char,
+    get_char_class,
+    get_char_classes,
+    reset_char_classes,
+)
+from glottai.cedict.lexer.lexer import lexer
+from glottai.cedict.lexer.token import TType
+from glottai.cedict.settings import settings
+
+
+@pytest.fixture
+def reset():
+    reset_char_classes()
+    yield
+    reset_char_classes()
+
+
+def test_get_char_class_000():
+    for chars, ttype in [
+        ("\n\r\x85\u2028\u2029", TType.NEWLINE),
+        ("，。、！？「」『』《》：；…—·・（）", TType.PUNCTUATION),
+        ("！＂＃％＆（）＊，．／：；？［］｛｝", TType.PUNCTUATION),
+        ("〒〓＄＋＜＝＞～￥", TType.PUNCTUATION),
+        (".,;:!?\"'()[]-", TType.PUNCTUATION),
+        ("aZéǚＡｚ", TType.LATIN),
+        ("09０９٣", TType.DIGIT),
+        (" \t\x0b\x0c　", TType.WHITESPACE),
+        ("学王+$〆\U00020000", TType.UNKNOWN),
+    ]:
+        for char in chars:
+            assert TType(get_char_class(char)) == ttype, char
+
+
+def test_get_char_classes_000():
+    char_classes = get_char_classes()
+
+    assert len(char_classes) == TABLE_SIZE
+    assert get_char_classes() is char_classes
+    for code_point in range(0, TABLE_SIZE, 97):
+        char = chr(code_point)
+        assert char_classes[code_point] == classify_char(char)
+
+
+def test_punctuation_settings_000(reset, monkeypatch):
+    monkeypatch.setattr(
+        settings, "get_lexer_punctuation_categories", lambda: ["Po"]
+    )
+    monkeypatch.setattr(
+        settings, "get_lexer_punctuation_symbol_ranges", lambda: []
+    )
+    monkeypatch.setattr(settings, "get_lexer_punctuation_extra", lambda: "+")
+    reset_char_classes()
+
+    tokens = lexer({}, "「好」+＄。", 0)
+
+    assert [token.ttype for token in tokens] == [
+        TType.UNKNOWN,
+        TType.UNKNOWN,
+        TType.UNKNOWN,
+        TType.PUNCTUATION,
+        TType.UNKNOWN,
+        TType.PUNCTUATION,
+    ]
+
+
+def test_newline_000():
+    tokens = lexer({}, "a \r\n\u2028 b\x85", 0)
+
+    assert [(token.word, token.ttype) for token in tokens] == [
+        ("a", TType.LATIN),
+        (" ", TType.WHITESPACE),
+        ("\r", TType.NEWLINE),
+        ("\n", TType.NEWLINE),
+        ("\u2028", TType.NEWLINE),
+        (" ", TType.WHITESPACE),
+        ("b", TType.LATIN),
+        ("\x85", TType.NEWLINE),
+    ]
@@ -29,9 +29,14 @@ __license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
 __date__ = "2023/08/04"
 
 
+import pytest
+
 from glottai.cedict.lexer.lexer import (
+    LexerException,
     is_newline,
     is_punctuation,
+    iter_tokens,
+    lex_array,
     lexer,
     print_tokens,
 )
@@ -53,6 +58,14 @@ def test_is_punctuation_000():
     assert not is_punctuation("x")
 
 
+def test_is_punctuation_010():
+    for char in "、！？「」：；":
+        assert is_punctuation(char)
+
+    assert not is_punctuation("学")
+    assert not is_punctuation(" ")
+
+
 # Uncomment to generate the test trie "_test_trie1"
 # used in the unit test in the current file:
 # | def test_generate_test_trie1():
@@ -191,3 +204,107 @@ def test_lexer_000():
     ]
 
     assert tokens == expected_tokens
+
+
+def test_lexer_010():
+    trie = {
+        "大": {"学": {True: "大學 大学 [dà xué] /university/"}},
+        "A": {"A": {"制": {True: "AA制 AA制 [A A zhì] /to split the bill/"}}},
+    }
+    text = "AA制 in 大学 ｉｓ 100% OK\n  x"
+    tokens = lexer(trie, text, 0)
+
+    assert [(token.ttype, token.word) for token in tokens] == [
+        (TType.CEDICT, "AA制"),
+        (TType.WHITESPACE, " "),
+        (TType.LATIN, "in"),
+        (TType.WHITESPACE, " "),
+        (TType.CEDICT, "大学"),
+        (TType.WHITESPACE, " "),
+        (TType.LATIN, "ｉｓ"),
+        (TType.WHITESPACE, " "),
+        (TType.DIGIT, "100"),
+        (TType.PUNCTUATION, "%"),
+        (TType.WHITESPACE, " "),
+        (TType.LATIN, "OK"),
+        (TType.NEWLINE, "\n"),
+        (TType.WHITESPACE, "  "),
+        (TType.LATIN, "x"),
+    ]
+    assert tokens[8].start == 13 and tokens[8].end == 16
+    assert tokens[8].entry == "100 100 [100] /100/"
+
+
+def test_lexer_011():
+    # Pinyin with tone marks is a single Latin token
+    tokens = lexer({}, "Nǚhái", 0)
+
+    assert [(token.ttype, token.word) for token in tokens] == [
+        (TType.LATIN, "Nǚhái")
+    ]
+
+
+def test_lexer_012():
+    # Runs end where a word starts
+    trie = {
+        "A": {"T": {"M": {True: "ATM ATM [A T M] /ATM/"}}},
+        "T": {"恤": {True: "T恤 T恤 [T xù] /T-shirt/"}},
+        "3": {"C": {True: "3C 3C [san1 C] /3C/"}},
+        "卡": {True: "卡 卡 [kǎ] /card/"},
+    }
+    text = "myATM卡 ET恤 123C"
+    tokens = lexer(trie, text, 0)
+
+    assert [(token.ttype, token.word) for token in tokens] == [
+        (TType.LATIN, "my"),
+        (TType.CEDICT, "ATM"),
+        (TType.CEDICT, "卡"),
+        (TType.WHITESPACE, " "),
+        (TType.LATIN, "E"),
+        (TType.CEDICT, "T恤"),
+        (TType.WHITESPACE, " "),
+        (TType.DIGIT, "12"),
+        (TType.CEDICT, "3C"),
+    ]
+    assert lex_array(trie, text).to_list() == tokens
+
+    # Characters starting a word only end a run when the word is found
+    assert [token.word for token in lexer(trie, "ATTM", 0)] == ["ATTM"]
+
+
+def test_lexer_020():
+    text = "她叫李叶，是一个不太好看的女孩。"
+    tokens = lexer(_test_trie1, text, 0)
+
+    # Lex from an offset
+    assert lexer(_test_trie1, text, 5) == tokens[5:]
+
+    # Lex a window
+    window = lexer(_test_trie1, text, 5, end=11)
+    assert window == tokens[5:9]
+    assert (window[-1].word, window[-1].start, window[-1].end) == (
+        "不太好",
+        8,
+        11,
+    )
+
+    # No token extends beyond the end of the window
+    window = lexer(_test_trie1, text, 8, end=10)
+    assert [(token.word, token.ttype) for token in window] == [
+        ("不", TType.UNKNOWN),
+        ("太", TType.UNKNOWN),
+    ]
+    assert lexer(_test_trie1, "abc def", 1, end=5)[-1].word == "d"
+    assert lexer(_test_trie1, text, 3, end=3) == []
+
+
+def test_iter_tokens_000():
+    text = "她叫李叶，是一个不太好看的女孩。"
+    tokens = iter_tokens(_test_trie1, text)
+
+    assert next(tokens) == lexer(_test_trie1, text, 0)[0]
+    assert list(tokens) == lexer(_test_trie1, text, 1)
+
+    for start, end in [(-1, 3), (3, 2), (0, 17)]:
+        with pytest.raises(LexerException):
+            list(iter_tokens(_test_trie1, text, start, end))
@@ -0,0 +1,107 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""tests/glottai/cedict/lexer/test_parallel.py:
+
+Test for lexing large texts in a pool of worker processes.
+
+pytest -q tests/glottai/cedict/lexer/test_parallel.py
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import pytest
+
+from glottai.cedict.lexer import parallel
+from glottai.cedict.lexer.lexer import lexer
+from glottai.cedict.lexer.parallel import (
+    LexParallelException,
+    lex_parallel,
+    split_points,
+)
+from glottai.cedict.lexer.token import TokenArray
+from glottai.cedict.utilities.cedict import (
+    read_cedict_entry_fields,
+    read_cedict_tries,
+)
+from glottai.cedict.utilities.paths import get_material_dir
+
+
+_cedict_example_file = (
+    get_material_dir() / ".cedict" / "cedict_example_4x3.txt"
+)
+
+_text = (
+    "北京大学和东京大学的大学生学习。\n"
+    "Peking University 1898年 大学部，上海大学城！"
+    "学学习习大大学学生？"
+) * 20
+
+
+@pytest.fixture(scope="module")
+def trie():
+    _, _, _, trie = read_cedict_tries(_cedict_example_file)
+    return trie
+
+
+def test_split_points_000(trie):
+    positions = split_points(trie, _text, 8)
+
+    assert len(positions) == 7
+    assert positions == sorted(set(positions))
+    for position in positions:
+        assert _text[position - 1] in "\n。！？"
+
+
+def test_split_points_001():
+    # No split point inside a word
+    trie = {"吗": {"？": {"吧": {True: "ma ba"}}}}
+    text = "好吗？吧好吗？好"
+
+    assert split_points(trie, text, 2) == [7]
+
+
+@pytest.mark.parametrize("workers", [1, 2, 3])
+def test_lex_parallel_000(trie, workers, monkeypatch):
+    monkeypatch.setattr(parallel, "MIN_PARALLEL_LENGTH", 0)
+
+    tokens = lex_parallel(trie, _text, workers=workers)
+
+    assert isinstance(tokens, TokenArray)
+    assert tokens.to_list() == lexer(trie, _text, 0)
+
+
+def test_lex_parallel_001(monkeypatch):
+    monkeypatch.setattr(parallel, "MIN_PARALLEL_LENGTH", 0)
+    fields, _, trie = read_cedict_entry_fields(_cedict_example_file)
+
+    tokens = lex_parallel(trie, _text, workers=2, entries=fields)
+
+    expected = lexer(trie, _text, 0, entries=fields)
+    assert list(tokens) == expected
+    assert tokens.entries is fields
+    assert tokens[0].fields == expected[0].fields
+
+
+def test_lex_parallel_002(trie):
+    with pytest.raises(LexParallelException):
+        lex_parallel(trie, _text, workers=0)
@@ -0,0 +1,110 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""tests/glottai/cedict/lexer/test_session.py:
+
+Test for re-lexing texts incrementally after edits.
+
+pytest -q tests/glottai/cedict/lexer/test_session.py
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import random
+
+import pytest
+
+from glottai.cedict.lexer.lexer import LexerException, lexer
+from glottai.cedict.lexer.session import LexerSession
+from glottai.cedict.utilities.cedict import read_cedict_tries
+from glottai.cedict.utilities.paths import get_material_dir
+
+
+_cedict_example_file = (
+    get_material_dir() / ".cedict" / "cedict_example_4x3.txt"
+)
+
+_text = (
+    "北京大学和东京大学的大学生学习。\n"
+    "Peking University 1898年 大学部，上海大学城！\n"
+)
+
+_alphabet = "大学习生部城北京上海东。，\n ab1"
+
+
+@pytest.fixture(scope="module")
+def trie():
+    _, _, _, trie = read_cedict_tries(_cedict_example_file)
+    return trie
+
+
+def test_lexer_session_000(trie):
+    session = LexerSession(trie, _text)
+    assert session.tokens == lexer(trie, _text, 0)
+
+    # 东京大学 -> 东京大学 生
+    relex = session.edit(9, 0, "生")
+    assert session.text == _text[:9] + "生" + _text[9:]
+    assert session.tokens == lexer(trie, session.text, 0)
+    assert [token.word for token in relex.tokens] == ["东京大学", "生"]
+
+    # Delete the first line
+    session.edit(0, 17, "")
+    assert session.tokens == lexer(trie, session.text, 0)
+
+    # Replace 大学部 by 上海
+    offset = session.text.index("大学部")
+    session.edit(offset, 3, "上海")
+    assert session.tokens == lexer(trie, session.text, 0)
+
+
+def test_lexer_session_001(trie):
+    # Random edits before, after and at the previous edits
+    rng = random.Random(0)
+    for _ in range(100):
+        text = "".join(rng.choice(_alphabet) for _ in range(rng.randrange(40)))
+        session = LexerSession(trie, text)
+
+        for _ in range(10):
+            offset = rng.randrange(len(session.text) + 1)
+            deleted = rng.randrange(min(4, len(session.text) - offset) + 1)
+            inserted = "".join(
+                rng.choice(_alphabet) for _ in range(rng.randrange(4))
+            )
+            session.edit(offset, deleted, inserted)
+
+            if rng.random() < 0.5:
+                assert session.tokens == lexer(trie, session.text, 0)
+
+        assert session.tokens == lexer(trie, session.text, 0)
+
+
+def test_lexer_session_002(trie):
+    session = LexerSession(trie, "")
+    session.edit(0, 0, "大学")
+    assert session.tokens == lexer(trie, "大学", 0)
+
+    with pytest.raises(LexerException):
+        session.edit(1, 2, "")
+
+    with pytest.raises(LexerException):
+        session.edit(-1, 0, "学")
@@ -0,0 +1,122 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""tests/glottai/cedict/lexer/test_stream.py:
+
+Test for lexing texts read chunk by chunk from a file.
+
+pytest -q tests/glottai/cedict/lexer/test_stream.py
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import io
+from types import MappingProxyType
+
+import pytest
+
+from glottai.cedict.lexer.lexer import lexer
+from glottai.cedict.lexer import stream
+from glottai.cedict.lexer.stream import (
+    LexStreamException,
+    iter_lex,
+    max_key_length,
+)
+from glottai.cedict.utilities.cedict import read_cedict_tries
+from glottai.cedict.utilities.paths import get_material_dir
+
+
+_cedict_example_file = (
+    get_material_dir() / ".cedict" / "cedict_example_4x3.txt"
+)
+
+_text = (
+    "北京大学和东京大学的大学生学习。\n"
+    "Peking University 1898年 大学部，上海大学城！\n"
+    "学学习习大大学学生"
+) * 3
+
+
+@pytest.fixture(scope="module")
+def trie():
+    _, _, _, trie = read_cedict_tries(_cedict_example_file)
+    return trie
+
+
+def test_max_key_length_000(trie):
+    assert max_key_length(trie) == 4
+    assert max_key_length({}) == 0
+
+    # Tries behaving like a dictionary are walked
+    assert max_key_length(MappingProxyType(trie)) == 4
+
+    with pytest.raises(LexStreamException):
+        max_key_length(object())
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7, 16, 100, 10000])
+def test_iter_lex_000(trie, chunk_size):
+    expected = lexer(trie, _text, 0)
+    tokens = list(iter_lex(trie, io.StringIO(_text), chunk_size=chunk_size))
+
+    assert tokens == expected
+
+
+def test_iter_lex_001(trie):
+    assert list(iter_lex(trie, io.StringIO(""))) == []
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 16])
+def test_iter_lex_002(trie, monkeypatch, chunk_size):
+    """Runs longer than a chunk are not lexed again with every chunk."""
+
+    text = "大学" + "a" * 100 + "  " * 50 + "1" * 100 + "学习" + "b" * 100
+
+    lengths = []
+
+    def lexer_spy(trie, text, start, **kwargs):
+        lengths.append(len(text))
+        return lexer(trie, text, start, **kwargs)
+
+    monkeypatch.setattr(stream, "lexer", lexer_spy)
+    tokens = list(iter_lex(trie, io.StringIO(text), chunk_size=chunk_size))
+
+    assert tokens == lexer(trie, text, 0)
+    assert max(lengths) <= chunk_size + max_key_length(trie)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7])
+def test_iter_lex_003(chunk_size):
+    """Runs end at the words starting in them across chunk
+    boundaries.
+
+    """
+
+    trie = {
+        "A": {"T": {"M": {True: "ATM ATM [A T M] /ATM/"}}},
+        "T": {"恤": {True: "T恤 T恤 [T xù] /T-shirt/"}},
+        "3": {"C": {True: "3C 3C [san1 C] /3C/"}},
+    }
+    text = "myATMs ET恤 123C ATTM xxxxATxxxxATMxxxT恤 1113C" * 3
+    tokens = list(iter_lex(trie, io.StringIO(text), chunk_size=chunk_size))
+
+    assert tokens == lexer(trie, text, 0)
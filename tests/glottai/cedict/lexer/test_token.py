@@ -0,0 +1,112 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""tests/glottai/cedict/lexer/test_token.py:
+
+Test for the tokens and the token arrays.
+
+pytest -q tests/glottai/cedict/lexer/test_token.py
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import pytest
+
+from glottai.cedict.lexer.lexer import LexerException, lex_array, lexer
+from glottai.cedict.lexer.token import Token, TType, word_entry
+from glottai.cedict.utilities.cedict import (
+    read_cedict_entry_tries,
+    read_cedict_tries,
+)
+from glottai.cedict.utilities.paths import get_material_dir
+
+
+_cedict_example_file = (
+    get_material_dir() / ".cedict" / "cedict_example_4x3.txt"
+)
+
+_text = (
+    "北京大学和东京大学的大学生学习。\n"
+    "Peking University 1898年 大学部，上海大学城！"
+)
+
+
+@pytest.fixture(scope="module")
+def trie():
+    _, _, _, trie = read_cedict_tries(_cedict_example_file)
+    return trie
+
+
+def test_token_000():
+    token = Token(TType.UNKNOWN, "她", "她 她 [她] /她/", 0, 1)
+
+    assert not hasattr(token, "__dict__")
+    with pytest.raises(AttributeError):
+        token.pinyin = "tā"
+
+
+def test_lex_array_000(trie):
+    expected = lexer(trie, _text, 0)
+    tokens = lex_array(trie, _text)
+
+    assert len(tokens) == len(expected)
+    assert list(tokens) == expected
+    assert tokens.to_list() == expected
+    assert tokens[-1] == expected[-1]
+    assert tokens[3:7] == expected[3:7]
+
+    for token in tokens:
+        assert token.word == _text[token.start : token.end]
+
+    with pytest.raises(IndexError):
+        tokens[len(expected)]
+
+
+def test_lex_array_001(trie):
+    assert lex_array(trie, _text, 5, 20).to_list() == lexer(
+        trie, _text, 5, end=20
+    )
+    assert len(lex_array(trie, "")) == 0
+
+    with pytest.raises(LexerException):
+        lex_array(trie, _text, 10, 5)
+
+
+def test_lex_array_002():
+    table, _, trie = read_cedict_entry_tries(_cedict_example_file)
+    expected = lexer(trie, _text, 0, entries=table)
+    tokens = lex_array(trie, _text, entries=table)
+
+    assert list(tokens) == expected
+    assert [token.entry for token in tokens] == [
+        token.entry for token in expected
+    ]
+
+
+def test_token_001(trie):
+    tokens = lexer(trie, "大学，ok", 0)
+
+    # The pseudo entries are formatted when accessed
+    assert [token._entry for token in tokens[1:]] == [None, None]
+    assert tokens[1].entry == word_entry("，") == "， ， [，] /，/"
+    assert tokens[2].entry == "ok ok [ok] /ok/"
+    assert tokens[0].entry == trie["大"]["学"][True]
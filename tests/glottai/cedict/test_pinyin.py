@@ -0,0 +1,51 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""tests/glottai/cedict/test_pinyin.py:
+
+Test for the pinyin utilities.
+
+pytest -q tests/glottai/cedict/test_pinyin.py
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+from glottai.cedict.pinyin import (
+    tone_marks_to_numbers,
+    tone_marks_to_numbers_syllable,
+    tone_numbers_to_marks,
+)
+
+
+def test_tone_marks_to_numbers_syllable_000():
+    assert tone_marks_to_numbers_syllable("wáng") == "wang2"
+    assert tone_marks_to_numbers_syllable("huài") == "huai4"
+    assert tone_marks_to_numbers_syllable("nu:è") == "nüe4"
+    assert tone_marks_to_numbers_syllable("Ǎi") == "Ai3"
+    assert tone_marks_to_numbers_syllable("you") == "you"
+
+
+def test_tone_marks_to_numbers_000():
+    assert tone_marks_to_numbers("jiāo péng you") == "jiao1 peng2 you"
+
+    pinyin = "Lǚ lüè nǚ xiù huài"
+    assert tone_numbers_to_marks(tone_marks_to_numbers(pinyin)) == pinyin
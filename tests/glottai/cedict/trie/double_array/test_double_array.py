@@ -0,0 +1,180 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""tests/glottai/cedict/trie/double_array/test_double_array.py:
+
+Test for the memory-mapped double-array trie.
+
+pytest -q tests/glottai/cedict/trie/double_array/test_double_array.py
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import pytest
+
+from glottai.cedict.lexer.lexer import lexer
+from glottai.cedict.trie import trie_lookup
+from glottai.cedict.trie.double_array.build import (
+    build_double_array,
+    write_double_array_trie_to_file,
+)
+from glottai.cedict.trie.double_array.lookup import (
+    DoubleArrayTrie,
+    DoubleArrayTrieException,
+    double_array_lookup,
+)
+
+
+_test_trie1 = {
+    "她": {True: "她 她 [tā] /she/"},
+    "叫": {True: "叫 叫 [jiào] /to shout/to be called/"},
+    "李": {True: "李 李 [Lǐ] /surname Li/\n李 李 [lǐ] /plum/"},
+    "叶": {True: "葉 叶 [Yè] /surname Ye/\n葉 叶 [yè] /leaf/page/"},
+    "是": {True: "是 是 [shì] /to be/"},
+    "一": {True: "一 一 [yī] /one/"},
+    "个": {True: "個 个 [gè] /individual/"},
+    "不": {
+        "太": {"好": {True: "不太好 不太好 [bù tài hǎo] /not so good/not too well/"}}
+    },
+    "看": {True: "看 看 [kàn] /to see/to look at/to watch/"},
+    "的": {True: "的 的 [de] /of; ~'s (possessive particle)/"},
+    "女": {"孩": {True: "女孩 女孩 [nǚ hái] /girl; lass/"}},
+}
+
+_test_trie2 = {
+    "王": {
+        True: "王 王 [wáng] /king or monarch/",
+        "子": {True: "王子 王子 [wáng zǐ] /prince/son of a king/"},
+    },
+    "子": {True: "子 子 [zǐ] /son/child/"},
+    "小": {True: "小 小 [xiǎo] /small/tiny/few/young/"},
+}
+
+_test_variables = {"entries": "4", "time": "1684045073"}
+
+
+@pytest.fixture
+def da_trie(tmp_path):
+    filename = tmp_path / "trie.da"
+    write_double_array_trie_to_file(filename, _test_variables, _test_trie2)
+    with DoubleArrayTrie(filename) as trie:
+        yield trie
+
+
+def test_build_double_array_000():
+    alphabet, base, check, entries = build_double_array(_test_trie2)
+
+    assert alphabet == "子小王"
+    assert len(base) == len(check)
+    assert sorted(entries) == sorted(
+        [
+            "王 王 [wáng] /king or monarch/",
+            "王子 王子 [wáng zǐ] /prince/son of a king/",
+            "子 子 [zǐ] /son/child/",
+            "小 小 [xiǎo] /small/tiny/few/young/",
+        ]
+    )
+
+
+def test_build_double_array_001(tmp_path):
+    # An empty trie is a single root cell
+    assert build_double_array({}) == ("", [0], [-2], [])
+
+    # A trie with an entry for the empty word only
+    assert build_double_array({True: "entry"}) == ("", [-1], [-2], ["entry"])
+
+    filename = tmp_path / "trie.da"
+    write_double_array_trie_to_file(filename, _test_variables, {})
+    with DoubleArrayTrie(filename) as trie:
+        assert len(trie) == 0
+        assert double_array_lookup(trie, "王子", 2, 0) == (None, None, 0)
+
+
+def test_double_array_trie_000(da_trie):
+    assert da_trie.variables == _test_variables
+    assert len(da_trie) == 4
+
+
+def test_double_array_lookup_000(da_trie):
+    text = "小王子王x"
+    text_length = len(text)
+
+    assert double_array_lookup(da_trie, text, text_length, 0) == (
+        "小",
+        "小 小 [xiǎo] /small/tiny/few/young/",
+        1,
+    )
+    assert double_array_lookup(da_trie, text, text_length, 1) == (
+        "王子",
+        "王子 王子 [wáng zǐ] /prince/son of a king/",
+        3,
+    )
+    assert double_array_lookup(da_trie, text, text_length, 3) == (
+        "王",
+        "王 王 [wáng] /king or monarch/",
+        4,
+    )
+    assert double_array_lookup(da_trie, text, text_length, 4) == (
+        None,
+        None,
+        4,
+    )
+
+    # The lookup must not look beyond TEXT_LENGTH
+    assert double_array_lookup(da_trie, text, 2, 1) == (
+        "王",
+        "王 王 [wáng] /king or monarch/",
+        2,
+    )
+
+
+def test_double_array_lookup_010(tmp_path):
+    """The double-array trie finds the same words as the dictionary
+    trie.
+
+    """
+
+    filename = tmp_path / "trie.da"
+    write_double_array_trie_to_file(filename, _test_variables, _test_trie1)
+
+    text = "她叫李叶，是一个不太好看的女孩。不太"
+    text_length = len(text)
+
+    with DoubleArrayTrie(filename) as trie:
+        for start in range(text_length):
+            word, entry, end = trie_lookup(_test_trie1, text, text_length, start)
+            assert double_array_lookup(trie, text, text_length, start)[:2] == (
+                word,
+                entry,
+            )
+
+        tokens = lexer(trie, text, 0, lookup=double_array_lookup)
+
+    assert tokens == lexer(_test_trie1, text, 0)
+
+
+def test_double_array_trie_010(tmp_path):
+    filename = tmp_path / "trie.da"
+    filename.write_bytes(b"no double-array trie")
+
+    with pytest.raises(DoubleArrayTrieException):
+        DoubleArrayTrie(filename)
@@ -0,0 +1,156 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""tests/glottai/cedict/trie/louds/test_louds.py:
+
+Test for the succinct LOUDS trie and its bit vector.
+
+pytest -q tests/glottai/cedict/trie/louds/test_louds.py
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import random
+
+from glottai.cedict.lexer.lexer import lexer
+from glottai.cedict.trie.louds.bitvector import BitVector
+from glottai.cedict.trie.louds.louds import LoudsTrie, louds_lookup
+
+
+_test_items1 = [
+    ("她", "她 她 [tā] /she/"),
+    ("叫", "叫 叫 [jiào] /to shout/to be called/"),
+    ("李", "李 李 [Lǐ] /surname Li/"),
+    ("李", "李 李 [lǐ] /plum/"),
+    ("叶", "葉 叶 [Yè] /surname Ye/"),
+    ("叶", "葉 叶 [yè] /leaf/page/"),
+    ("是", "是 是 [shì] /to be/"),
+    ("一", "一 一 [yī] /one/"),
+    ("个", "個 个 [gè] /individual/"),
+    ("不太好", "不太好 不太好 [bù tài hǎo] /not so good/not too well/"),
+    ("看", "看 看 [kàn] /to see/to look at/to watch/"),
+    ("的", "的 的 [de] /of; ~'s (possessive particle)/"),
+    ("女孩", "女孩 女孩 [nǚ hái] /girl; lass/"),
+]
+
+_test_trie1 = {
+    "她": {True: "她 她 [tā] /she/"},
+    "叫": {True: "叫 叫 [jiào] /to shout/to be called/"},
+    "李": {True: "李 李 [Lǐ] /surname Li/\n李 李 [lǐ] /plum/"},
+    "叶": {True: "葉 叶 [Yè] /surname Ye/\n葉 叶 [yè] /leaf/page/"},
+    "是": {True: "是 是 [shì] /to be/"},
+    "一": {True: "一 一 [yī] /one/"},
+    "个": {True: "個 个 [gè] /individual/"},
+    "不": {
+        "太": {"好": {True: "不太好 不太好 [bù tài hǎo] /not so good/not too well/"}}
+    },
+    "看": {True: "看 看 [kàn] /to see/to look at/to watch/"},
+    "的": {True: "的 的 [de] /of; ~'s (possessive particle)/"},
+    "女": {"孩": {True: "女孩 女孩 [nǚ hái] /girl; lass/"}},
+}
+
+
+def test_bitvector_000():
+    bv = BitVector([1, 0, 1, 1, 0])
+
+    assert len(bv) == 5
+    assert [bv[i] for i in range(5)] == [1, 0, 1, 1, 0]
+    assert [bv.rank1(i) for i in range(6)] == [0, 1, 1, 2, 3, 3]
+    assert [bv.select1(k) for k in range(1, 4)] == [0, 2, 3]
+    assert [bv.select0(k) for k in range(1, 3)] == [1, 4]
+    assert bv.next_zero(2) == 4
+
+
+def test_bitvector_010():
+    random.seed(0)
+    bits = [int(random.random() < 0.3) for _ in range(5000)]
+    bv = BitVector(bits)
+
+    ones = [i for i, bit in enumerate(bits) if bit]
+    zeros = [i for i, bit in enumerate(bits) if not bit]
+
+    assert all(bv.rank1(i) == sum(bits[:i]) for i in range(0, 5000, 7))
+    assert all(bv.select1(k) == i for k, i in enumerate(ones, 1))
+    assert all(bv.select0(k) == i for k, i in enumerate(zeros, 1))
+
+
+def test_louds_trie_000():
+    trie = LoudsTrie([("a", "a"), ("b", "b"), ("aa", "aa"), ("ab", "ab")])
+
+    assert len(trie) == 4
+    assert trie.labels == "\0abab"
+    assert "aa" in trie
+    assert "ba" not in trie
+    assert trie["ab"] == "ab"
+
+
+def test_louds_trie_010():
+    trie = LoudsTrie(_test_items1)
+
+    assert trie["李"] == "李 李 [Lǐ] /surname Li/\n李 李 [lǐ] /plum/"
+    assert "不太" not in trie
+    assert trie.find("不太") is not None
+
+
+def test_louds_lookup_000():
+    trie = LoudsTrie(_test_items1)
+    text = "不太好看x"
+    text_length = len(text)
+
+    assert louds_lookup(trie, text, text_length, 0) == (
+        "不太好",
+        "不太好 不太好 [bù tài hǎo] /not so good/not too well/",
+        3,
+    )
+    assert louds_lookup(trie, text, text_length, 1) == (None, None, 1)
+    assert louds_lookup(trie, text, 2, 0) == (None, None, 0)
+
+
+def test_louds_lookup_010():
+    """The LOUDS trie lexes like the dictionary trie."""
+
+    trie = LoudsTrie(_test_items1)
+    text = "她叫李叶，是一个不太好看的女孩。"
+
+    tokens = lexer(trie, text, 0, lookup=louds_lookup)
+
+    assert tokens == lexer(_test_trie1, text, 0)
+
+
+def test_louds_prefix_items_000():
+    trie = LoudsTrie(
+        [("王", "王"), ("王子", "王子"), ("王八", "王八"), ("小", "小")]
+    )
+
+    assert list(trie.prefix_items("王")) == [
+        ("王", "王"),
+        ("王八", "王八"),
+        ("王子", "王子"),
+    ]
+    assert list(trie.prefix_items("王子")) == [("王子", "王子")]
+    assert list(trie.prefix_items("大")) == []
+    assert [word for word, _ in trie.prefix_items()] == [
+        "小",
+        "王",
+        "王八",
+        "王子",
+    ]
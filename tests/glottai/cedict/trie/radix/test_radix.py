@@ -0,0 +1,135 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""tests/glottai/cedict/trie/radix/test_radix.py:
+
+Test for the path-compressed radix trie.
+
+pytest -q tests/glottai/cedict/trie/radix/test_radix.py
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+from glottai.cedict.lexer.lexer import lexer
+from glottai.cedict.trie.radix.radix import RadixTrie, radix_lookup
+
+
+_test_trie1 = {
+    "她": {True: "她 她 [tā] /she/"},
+    "叫": {True: "叫 叫 [jiào] /to shout/to be called/"},
+    "李": {True: "李 李 [Lǐ] /surname Li/\n李 李 [lǐ] /plum/"},
+    "叶": {True: "葉 叶 [Yè] /surname Ye/\n葉 叶 [yè] /leaf/page/"},
+    "是": {True: "是 是 [shì] /to be/"},
+    "一": {True: "一 一 [yī] /one/"},
+    "个": {True: "個 个 [gè] /individual/"},
+    "不": {
+        "太": {"好": {True: "不太好 不太好 [bù tài hǎo] /not so good/not too well/"}}
+    },
+    "看": {True: "看 看 [kàn] /to see/to look at/to watch/"},
+    "的": {True: "的 的 [de] /of; ~'s (possessive particle)/"},
+    "女": {"孩": {True: "女孩 女孩 [nǚ hái] /girl; lass/"}},
+}
+
+
+def test_radix_trie_insert_000():
+    trie = RadixTrie()
+    trie.insert("一个个", "一个个")
+
+    assert trie.root.edges["一"][0] == "一个个"
+    assert trie.node_count() == 2
+
+    # Split the edge
+    trie.insert("一", "一")
+    assert trie.root.edges["一"][0] == "一"
+    assert trie.node_count() == 3
+
+    # Split the edge without a value at the split point
+    trie.insert("一会", "一会")
+    trie.insert("一会儿", "一会儿")
+    assert trie.node_count() == 5
+
+    trie.insert("一", "one")
+    assert trie["一"] == "一\none"
+    assert "一个" not in trie
+    assert list(trie) == ["一", "一个个", "一会", "一会儿"]
+
+
+def test_radix_trie_items_000():
+    trie = RadixTrie()
+    for word in ["a", "b", "aa", "ab", "ba", "bb", "abc"]:
+        trie.insert(word, word)
+
+    assert [word for word, _ in trie.items()] == [
+        "a",
+        "aa",
+        "ab",
+        "abc",
+        "b",
+        "ba",
+        "bb",
+    ]
+    assert [word for word, _ in trie.items("ab")] == ["ab", "abc"]
+    assert [word for word, _ in trie.items("c")] == []
+    assert len(trie) == 7
+
+
+def test_radix_trie_from_trie_000():
+    trie = RadixTrie.from_trie(_test_trie1)
+
+    assert dict(trie.items()) == {
+        "她": "她 她 [tā] /she/",
+        "叫": "叫 叫 [jiào] /to shout/to be called/",
+        "李": "李 李 [Lǐ] /surname Li/\n李 李 [lǐ] /plum/",
+        "叶": "葉 叶 [Yè] /surname Ye/\n葉 叶 [yè] /leaf/page/",
+        "是": "是 是 [shì] /to be/",
+        "一": "一 一 [yī] /one/",
+        "个": "個 个 [gè] /individual/",
+        "不太好": "不太好 不太好 [bù tài hǎo] /not so good/not too well/",
+        "看": "看 看 [kàn] /to see/to look at/to watch/",
+        "的": "的 的 [de] /of; ~'s (possessive particle)/",
+        "女孩": "女孩 女孩 [nǚ hái] /girl; lass/",
+    }
+
+    # The chains 不-太-好 and 女-孩 collapsed into single edges
+    assert trie.node_count() == 12
+
+
+def test_radix_lookup_000():
+    trie = RadixTrie()
+    trie.insert("不太好", "不太好")
+    trie.insert("不", "不")
+    text = "不太好看"
+
+    assert radix_lookup(trie, text, 4, 0) == ("不太好", "不太好", 3)
+    assert radix_lookup(trie, text, 2, 0) == ("不", "不", 1)
+    assert radix_lookup(trie, text, 4, 1) == (None, None, 1)
+
+
+def test_radix_lookup_010():
+    """The radix trie lexes like the dictionary trie."""
+
+    trie = RadixTrie.from_trie(_test_trie1)
+    text = "她叫李叶，是一个不太好看的女孩。不太"
+
+    assert lexer(trie, text, 0, lookup=radix_lookup) == lexer(
+        _test_trie1, text, 0
+    )
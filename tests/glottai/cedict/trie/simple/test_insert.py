@@ -29,7 +29,11 @@ __license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
 __date__ = "2023/06/17"
 
 
-from glottai.cedict.trie.insert import trie_insert
+from glottai.cedict.trie.insert import (
+    trie_insert,
+    trie_insert_all,
+    trie_insert_entry_id,
+)
 
 
 def test_trie_insert_000():
@@ -151,3 +155,47 @@ def test_trie_insert_020():
         "的": {True: "的 的 [de] /(attribution)/"},
         "女": {"孩": {True: "女孩 女孩 [nǚ hái] /girl; lass/"}},
     }
+
+
+def test_trie_insert_entry_id_000():
+    trie = {}
+    trie_insert_entry_id(trie, "ab", 0)
+    trie_insert_entry_id(trie, "a", 1)
+    trie_insert_entry_id(trie, "a", 2)
+    trie_insert_entry_id(trie, "a", 3)
+    print("trie:", trie)
+
+    assert trie == {"a": {True: (1, 2, 3), "b": {True: 0}}}
+
+
+def test_trie_insert_all_000():
+    items = [
+        ("一", "一 一 [yī] /one/"),
+        ("一个个", "一個個 一个个 [yī gè gè] /each and every one/"),
+        ("个", "個 个 [gè] /(classifier)"),
+        ("不太好", "不太好 不太好 [bù tài hǎo] /not so good/not too well/"),
+        ("一会儿", "一會兒 一会儿 [yī huì r] /a while/"),
+        ("个", "個 个 [gè] /individual/"),
+        ("一", "弌 一 [yī] /one/"),
+    ]
+
+    # The same trie as the one built by trie_insert()
+    # for unsorted and sorted items
+    expected_trie = {}
+    for key, value in items:
+        trie_insert(expected_trie, key, value)
+
+    trie = trie_insert_all({}, items)
+    print("trie:", trie)
+    assert trie == expected_trie
+
+    trie = trie_insert_all({}, sorted(items, key=lambda item: item[0]))
+    print("trie:", trie)
+    assert trie == expected_trie
+
+
+def test_trie_insert_all_010():
+    trie = {"a": {True: "a"}}
+    trie_insert_all(trie, [("ab", "ab"), ("a", "a2")])
+
+    assert trie == {"a": {True: "a\na2", "b": {True: "ab"}}}
@@ -0,0 +1,103 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""tests/glottai/cedict/trie/simple/test_load.py:
+
+Test for loading generated trie files via snapshots.
+
+pytest -q tests/glottai/cedict/trie/simple/test_load.py
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+from glottai.cedict.trie.simple.load import get_snapshot_file, load_trie_file
+from glottai.cedict.trie.simple.write import write_trie_to_file
+
+
+_test_header = [
+    "# CC-CEDICT",
+    "# Community maintained free Chinese-English dictionary.",
+]
+
+_test_variables = {"entries": "2", "time": "1684045073"}
+
+_test_trie = {
+    "王": {
+        True: "王 王 [wáng] /king or monarch/",
+        "子": {True: "王子 王子 [wáng zǐ] /prince/son of a king/"},
+    },
+}
+
+
+def write_test_trie_file(trie_file, variables=_test_variables):
+    with open(trie_file, "w") as fh:
+        write_trie_to_file(fh, _test_header, variables, _test_trie)
+
+
+def test_load_trie_file_000(tmp_path, capsys):
+    trie_file = tmp_path / "cedict_trie_simplified.py"
+    write_test_trie_file(trie_file)
+
+    # The first load compiles the trie file and writes the snapshot
+    assert load_trie_file(trie_file, report=True) == (
+        _test_variables,
+        _test_trie,
+    )
+    assert get_snapshot_file(trie_file).is_file()
+    assert "from trie file" in capsys.readouterr().out
+
+    # The second load uses the snapshot
+    assert load_trie_file(trie_file, report=True) == (
+        _test_variables,
+        _test_trie,
+    )
+    assert "from snapshot" in capsys.readouterr().out
+
+
+def test_load_trie_file_010(tmp_path, capsys):
+    """A snapshot becomes stale when the trie file changes."""
+
+    trie_file = tmp_path / "cedict_trie_simplified.py"
+    write_test_trie_file(trie_file)
+    load_trie_file(trie_file)
+
+    variables = dict(_test_variables, time="1709010021")
+    write_test_trie_file(trie_file, variables=variables)
+
+    assert load_trie_file(trie_file, report=True) == (variables, _test_trie)
+    assert "from trie file" in capsys.readouterr().out
+
+    assert load_trie_file(trie_file, report=True) == (variables, _test_trie)
+    assert "from snapshot" in capsys.readouterr().out
+
+
+def test_load_trie_file_020(tmp_path):
+    """Without snapshots the trie file is always compiled."""
+
+    trie_file = tmp_path / "cedict_trie_simplified.py"
+    write_test_trie_file(trie_file)
+
+    assert load_trie_file(trie_file, snapshot=False) == (
+        _test_variables,
+        _test_trie,
+    )
+    assert not get_snapshot_file(trie_file).exists()
@@ -0,0 +1,204 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""tests/glottai/cedict/trie/simple/test_search.py:
+
+Test for searching the words of a trie.
+
+pytest -q tests/glottai/cedict/trie/simple/test_search.py
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import pytest
+
+from glottai.cedict.trie.simple.insert import trie_insert
+from glottai.cedict.trie.simple.search import (
+    trie_complete,
+    trie_find_node,
+    trie_fuzzy,
+    trie_match,
+    trie_reverse,
+)
+
+
+def _make_trie(words):
+    trie = {}
+    for word in words:
+        trie_insert(trie, word, word.upper())
+
+    return trie
+
+
+def test_trie_find_node_000():
+    trie = _make_trie(["a", "ab", "abc"])
+
+    assert trie_find_node(trie, "") is trie
+    assert trie_find_node(trie, "ab") == {True: "AB", "c": {True: "ABC"}}
+    assert trie_find_node(trie, "b") is None
+
+
+def test_trie_complete_000():
+    trie = _make_trie(["b", "ba", "abc", "a", "ab", "bb", "aab"])
+
+    # Words come in the order of write_trie_to_file()
+    assert [word for word, _ in trie_complete(trie)] == [
+        "a",
+        "aab",
+        "ab",
+        "abc",
+        "b",
+        "ba",
+        "bb",
+    ]
+    assert list(trie_complete(trie, "ab")) == [("ab", "AB"), ("abc", "ABC")]
+    assert list(trie_complete(trie, "c")) == []
+
+
+def test_trie_complete_001():
+    trie = _make_trie(["b", "ba", "abc", "a", "ab", "bb", "aab"])
+
+    assert [word for word, _ in trie_complete(trie, limit=2)] == ["a", "aab"]
+    assert [word for word, _ in trie_complete(trie, limit=2, offset=5)] == [
+        "ba",
+        "bb",
+    ]
+    assert [word for word, _ in trie_complete(trie, "a", offset=1)] == [
+        "aab",
+        "ab",
+        "abc",
+    ]
+    assert list(trie_complete(trie, limit=0)) == []
+    assert list(trie_complete(trie, offset=10)) == []
+
+
+def test_trie_complete_002():
+    # Only the subtree needed for the requested words is visited
+    class Node(dict):
+        visited = []
+
+        def items(self):
+            Node.visited.append(self)
+            return super().items()
+
+    trie = Node({"a": Node({True: "A", "b": Node({True: "AB"})})})
+    trie["b"] = Node({True: "B", "c": Node({True: "BC"})})
+
+    assert list(trie_complete(trie, limit=1)) == [("a", "A")]
+    assert len(Node.visited) == 2
+
+
+def _levenshtein(word1, word2):
+    row = list(range(len(word2) + 1))
+    for i, char1 in enumerate(word1, 1):
+        previous, row = row, [i]
+        for j, char2 in enumerate(word2, 1):
+            row.append(
+                min(
+                    previous[j] + 1,
+                    row[j - 1] + 1,
+                    previous[j - 1] + (char1 != char2),
+                )
+            )
+
+    return row[-1]
+
+
+def test_trie_fuzzy_000():
+    trie = _make_trie(["王", "王子", "王国", "小王子", "子"])
+
+    assert trie_fuzzy(trie, "王字") == [
+        ("王", "王", 1),
+        ("王国", "王国", 1),
+        ("王子", "王子", 1),
+    ]
+    assert trie_fuzzy(trie, "王子", 0) == [("王子", "王子", 0)]
+    assert [word for word, _, _ in trie_fuzzy(trie, "王子")] == [
+        "王子",
+        "子",
+        "小王子",
+        "王",
+        "王国",
+    ]
+    assert trie_fuzzy(trie, "大学") == []
+
+
+def test_trie_fuzzy_001():
+    words = ["a", "ab", "abc", "acb", "b", "ba", "bac", "cab", "abcd", "dcba"]
+    trie = _make_trie(words)
+
+    # Compare with the distances to all words
+    for word in ["", "a", "ab", "bca", "abdc", "xyz", "aaaa"]:
+        for max_distance in range(4):
+            expected = sorted(
+                (other, _levenshtein(word, other))
+                for other in words
+                if _levenshtein(word, other) <= max_distance
+            )
+            found = trie_fuzzy(trie, word, max_distance)
+            assert sorted((other, d) for other, _, d in found) == expected
+
+
+def test_trie_fuzzy_002():
+    trie = _make_trie(["wang2zi3", "wang4", "wan3"])
+
+    # The characters in SKIP are skipped for free
+    found = trie_fuzzy(trie, "wangzi", skip="12345")
+    assert [word for word, _, _ in found] == ["wang2zi3"]
+    assert [
+        (word, distance)
+        for word, _, distance in trie_fuzzy(trie, "wan", skip="12345")
+    ] == [("wan3", 0), ("wang4", 1)]
+
+
+def test_trie_reverse_000():
+    trie = _make_trie(["大学", "学", "中学"])
+
+    assert trie_reverse(trie) == {
+        "学": {True: "学", "大": {True: "大学"}, "中": {True: "中学"}}
+    }
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_trie_match_000(reverse):
+    words = ["中国", "中华民国", "中美国", "大学", "中学", "学"]
+    trie = _make_trie(words)
+    reverse_trie = trie_reverse(trie) if reverse else None
+
+    def match(pattern, limit=None):
+        found = trie_match(trie, pattern, limit, reverse_trie)
+        return [word for word, _ in found]
+
+    assert match("中?国") == ["中美国"]
+    assert match("中??国") == ["中华民国"]
+    assert match("中*国") == ["中华民国", "中国", "中美国"]
+    assert match("*学") == ["中学", "大学", "学"]
+    assert match("?学") == ["中学", "大学"]
+    assert match("*") == sorted(words)
+    assert match("**学") == ["中学", "大学", "学"]
+    assert match("*华*") == ["中华民国"]
+    assert match("大学") == ["大学"]
+    assert match("大") == []
+    assert match("*学", limit=2) == ["中学", "大学"]
+    assert trie_match(trie, "中国", reverse_trie=reverse_trie) == [
+        ("中国", "中国")
+    ]
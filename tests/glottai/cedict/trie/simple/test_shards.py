@@ -0,0 +1,116 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""tests/glottai/cedict/trie/simple/test_shards.py:
+
+Test for writing tries in shards and loading them lazily.
+
+pytest -q tests/glottai/cedict/trie/simple/test_shards.py
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import pytest
+
+from glottai.cedict.lexer.lexer import lexer
+from glottai.cedict.trie.simple.shards import ShardedTrie
+from glottai.cedict.trie.simple.write import (
+    get_shard_name,
+    write_trie_to_file,
+)
+
+
+_test_header = ["# CC-CEDICT"]
+
+_test_variables = {"entries": "13", "time": "1684045073"}
+
+_test_trie1 = {
+    "她": {True: "她 她 [tā] /she/"},
+    "叫": {True: "叫 叫 [jiào] /to shout/to be called/"},
+    "李": {True: "李 李 [Lǐ] /surname Li/\n李 李 [lǐ] /plum/"},
+    "叶": {True: "葉 叶 [Yè] /surname Ye/\n葉 叶 [yè] /leaf/page/"},
+    "是": {True: "是 是 [shì] /to be/"},
+    "一": {True: "一 一 [yī] /one/"},
+    "个": {True: "個 个 [gè] /individual/"},
+    "不": {
+        "太": {"好": {True: "不太好 不太好 [bù tài hǎo] /not so good/not too well/"}}
+    },
+    "看": {True: "看 看 [kàn] /to see/to look at/to watch/"},
+    "的": {True: "的 的 [de] /of; ~'s (possessive particle)/"},
+    "女": {"孩": {True: "女孩 女孩 [nǚ hái] /girl; lass/"}},
+}
+
+
+def write_sharded_trie(tmp_path, shard_by="char"):
+    index_file = tmp_path / "cedict_trie_simplified.py"
+    with open(index_file, "w", encoding="utf-8") as fh:
+        write_trie_to_file(
+            fh,
+            _test_header,
+            _test_variables,
+            _test_trie1,
+            shard_dir=tmp_path / "shards",
+            shard_by=shard_by,
+        )
+
+    return index_file
+
+
+def test_get_shard_name_000():
+    assert get_shard_name("王") == "shard_00738b"
+    assert get_shard_name("王", shard_by="block") == "shard_0073xx"
+
+
+def test_sharded_trie_000(tmp_path):
+    index_file = write_sharded_trie(tmp_path)
+    assert len(list((tmp_path / "shards").glob("*.py"))) == len(_test_trie1)
+
+    trie = ShardedTrie(index_file)
+    assert trie.variables == _test_variables
+    assert len(trie) == len(_test_trie1)
+    assert "李" in trie
+    assert "王" not in trie
+    assert trie.loaded_shards() == []
+
+    assert trie["不"] == _test_trie1["不"]
+    assert trie.loaded_shards() == [get_shard_name("不")]
+
+    with pytest.raises(KeyError):
+        trie["王"]
+
+
+def test_sharded_trie_010(tmp_path):
+    """A sharded trie lexes like the dictionary trie
+    and only loads the shards of the characters found in the text.
+
+    """
+
+    index_file = write_sharded_trie(tmp_path, shard_by="block")
+    trie = ShardedTrie(index_file)
+
+    text = "她叫李叶，是一个不太好看的女孩。"
+    assert lexer(trie, text, 0) == lexer(_test_trie1, text, 0)
+
+    text = "一个"
+    trie = ShardedTrie(index_file)
+    lexer(trie, text, 0)
+    assert trie.loaded_shards() == ["shard_004exx"]
@@ -0,0 +1,153 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""tests/glottai/cedict/trie/simple/test_update.py:
+
+Test for patching tries with the changes between CC-CEDICT files.
+
+pytest -q tests/glottai/cedict/trie/simple/test_update.py
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import pytest
+
+from glottai.cedict.trie.simple.update import (
+    TrieUpdateException,
+    apply_changes,
+    trie_differences,
+    trie_order_entries,
+    trie_remove,
+    trie_replace,
+)
+from glottai.cedict.utilities.cedict import read_cedict_tries
+from glottai.cedict.utilities.diff import Change, iter_diff
+from glottai.cedict.utilities.paths import get_material_dir
+
+
+_cedict_xiaowangzi_file = (
+    get_material_dir() / ".cedict" / "cedict_xiaowangzi.txt"
+)
+
+
+def test_trie_remove_000():
+    trie = {"a": {True: "x\ny", "b": {True: "z"}}}
+
+    assert trie_remove(trie, "a", "x")
+    assert trie == {"a": {True: "y", "b": {True: "z"}}}
+
+    assert trie_remove(trie, "ab", "z")
+    assert trie == {"a": {True: "y"}}
+
+    assert trie_remove(trie, "a", "y")
+    assert trie == {}
+
+
+def test_trie_remove_001():
+    trie = {"a": {True: "x", "b": {True: "z"}}}
+
+    assert not trie_remove(trie, "a", "y")
+    assert not trie_remove(trie, "b", "x")
+    assert not trie_remove(trie, "abc", "z")
+    assert trie == {"a": {True: "x", "b": {True: "z"}}}
+
+
+def test_trie_replace_000():
+    trie = {"a": {True: "x\ny\nz"}}
+
+    assert trie_replace(trie, "a", "y", "w")
+    assert trie == {"a": {True: "x\nw\nz"}}
+    assert not trie_replace(trie, "a", "y", "w")
+
+
+def test_trie_differences_000():
+    trie1 = {"a": {True: "x\ny"}, "b": {True: "z"}}
+    trie2 = {"a": {True: "y\nx", "c": {True: "c"}}}
+
+    # The values of a key are compared in order
+    assert list(trie_differences(trie1, trie2)) == ["a", "ac", "b"]
+    assert list(trie_differences(trie1, trie1)) == []
+
+
+def test_apply_changes_000(tmp_path):
+    lines = _cedict_xiaowangzi_file.read_text(encoding="utf-8").splitlines()
+
+    # Remove 小, change 王子 and add 王國 / 王国
+    new_lines = [line for line in lines if not line.startswith("小 ")]
+    new_lines[-1] = "王子 王子 [wang2 zi3] /prince/"
+    new_lines.append("王國 王国 [wang2 guo2] /kingdom/")
+    new_file = tmp_path / "cedict.txt"
+    new_file.write_text("\n".join(new_lines) + "\n", encoding="utf-8")
+
+    changes = list(iter_diff(_cedict_xiaowangzi_file, new_file))
+    _, _, old_traditional, old_simplified = read_cedict_tries(
+        _cedict_xiaowangzi_file
+    )
+    _, _, new_traditional, new_simplified = read_cedict_tries(new_file)
+
+    assert apply_changes(old_traditional, changes) == new_traditional
+    assert (
+        apply_changes(old_simplified, changes, form="simplified")
+        == new_simplified
+    )
+    assert new_simplified["王"]["国"] == {
+        True: "王國 王国 [wáng guó] /kingdom/"
+    }
+
+
+def test_apply_changes_001():
+    trie = {}
+    changes = [Change("remove", "小 小 [xiao3] /small/", None)]
+
+    with pytest.raises(TrieUpdateException):
+        apply_changes(trie, changes)
+
+
+def test_apply_changes_002(tmp_path):
+    """Added entries are put in the order of the new cedict file."""
+
+    old_lines = ["髮 发 [fa4] /hair/"]
+    new_lines = ["發 发 [fa1] /to send out/", "髮 发 [fa4] /hair/"]
+
+    old_file = tmp_path / "old.txt"
+    old_file.write_text("\n".join(old_lines) + "\n", encoding="utf-8")
+    new_file = tmp_path / "new.txt"
+    new_file.write_text("\n".join(new_lines) + "\n", encoding="utf-8")
+
+    changes = list(iter_diff(old_file, new_file))
+    _, _, _, fresh = read_cedict_tries(new_file)
+
+    _, _, _, appended = read_cedict_tries(old_file)
+    apply_changes(appended, changes, form="simplified")
+    assert list(trie_differences(appended, fresh)) == ["发"]
+
+    _, _, _, ordered = read_cedict_tries(old_file)
+    apply_changes(ordered, changes, form="simplified", entries=new_lines)
+    assert list(trie_differences(ordered, fresh)) == []
+    assert ordered == fresh
+
+
+def test_trie_order_entries_000():
+    trie = {"a": {True: "a a [a] /y/\na a [a] /z/\na a [a] /x/"}}
+
+    trie_order_entries(trie, ["a a [a] /x/", "b b [b] /b/", "a a [a] /y/"])
+    assert trie == {"a": {True: "a a [a] /x/\na a [a] /y/\na a [a] /z/"}}
@@ -0,0 +1,127 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""tests/glottai/cedict/trie/sqlite/test_store.py:
+
+Test for the CC-CEDICT SQLite store.
+
+pytest -q tests/glottai/cedict/trie/sqlite/test_store.py
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import pytest
+
+from glottai.cedict.lexer.lexer import lexer
+from glottai.cedict.trie import trie_lookup
+from glottai.cedict.trie.sqlite.store import (
+    SqliteTrie,
+    SqliteTrieException,
+    sqlite_lookup,
+    write_sqlite_store,
+)
+from glottai.cedict.utilities.cedict import read_cedict_tries
+from glottai.cedict.utilities.paths import get_material_dir
+
+
+_cedict_example_file = (
+    get_material_dir() / ".cedict" / "cedict_example_4x3.txt"
+)
+
+
+@pytest.fixture
+def sqlite_file(tmp_path):
+    filename = tmp_path / "cedict.sqlite"
+    write_sqlite_store(filename, _cedict_example_file)
+
+    return filename
+
+
+def test_sqlite_trie_000(sqlite_file):
+    with SqliteTrie(sqlite_file, "simplified") as trie:
+        assert len(trie) == 12
+        assert trie.variables["entries"] == "12"
+        assert trie.max_word_length == 4
+
+        assert trie["学习"] == "學習 学习 [xué xí] /to learn/to study/"
+        assert trie.lookup("习") == (
+            "習 习 [Xí] /surname Xi/\n"
+            "習 习 [xí] /(bound form) to practice/to study/habit/custom/"
+        )
+        assert "學習" not in trie
+        assert trie.lookup("学大") is None
+
+
+def test_sqlite_trie_010(sqlite_file):
+    with SqliteTrie(sqlite_file, "traditional") as trie:
+        assert [word for word, _ in trie.prefix_items("大學")] == [
+            "大學",
+            "大學城",
+            "大學生",
+            "大學部",
+        ]
+        assert trie.prefix_items("大學", limit=2)[0][1].count("\n") == 1
+        assert len(trie.prefix_items("大學", limit=2)) == 2
+        assert trie.prefix_items("小") == []
+
+
+def test_sqlite_trie_020(sqlite_file):
+    with SqliteTrie(sqlite_file) as trie:
+        assert trie.pinyin_items("xue2 xi2") == [
+            "學習 学习 [xué xí] /to learn/to study/"
+        ]
+        assert trie.pinyin_items("xué xí") == trie.pinyin_items("xue2 xi2")
+
+        entries = trie.search_senses("university")
+        assert len(entries) == 6
+        assert trie.search_senses('"Tokyo University"') == [
+            "東京大學 东京大学 [Dōng jīng Dà xué] /Tokyo University, Japan/"
+        ]
+
+
+def test_sqlite_lookup_000(sqlite_file):
+    """The lexer finds the same tokens in the SQLite store as in the
+    dictionary trie.
+
+    """
+
+    _, _, _, simplified_trie = read_cedict_tries(_cedict_example_file)
+    text = "北京大学生学习上海大学。"
+
+    with SqliteTrie(sqlite_file, "simplified") as trie:
+        assert lexer(trie, text, 0, lookup=sqlite_lookup) == lexer(
+            simplified_trie, text, 0
+        )
+        assert sqlite_lookup(trie, text, len(text), 0) == trie_lookup(
+            simplified_trie, text, len(text), 0
+        )
+        assert sqlite_lookup(trie, text, len(text), 11) == (None, None, 11)
+
+
+def test_sqlite_trie_030(tmp_path):
+    with pytest.raises(SqliteTrieException):
+        SqliteTrie(tmp_path / "missing.sqlite")
+
+    filename = tmp_path / "garbage.sqlite"
+    filename.write_bytes(b"no sqlite database" * 100)
+    with pytest.raises(SqliteTrieException):
+        SqliteTrie(filename)
@@ -0,0 +1,246 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""tests/glottai/cedict/utilities/test_build.py:
+
+Test for building the CC-CEDICT trie files.
+
+pytest -q tests/glottai/cedict/utilities/test_build.py
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+import pytest
+
+from glottai.cedict.settings import settings
+from glottai.cedict.trie.double_array.lookup import (
+    DoubleArrayTrie,
+    double_array_lookup,
+)
+from glottai.cedict.trie.simple.update import TrieUpdateException
+from glottai.cedict.utilities.build import (
+    CedictBuildException,
+    build_cedict_entry_fields_file,
+    build_cedict_index_files,
+    build_cedict_trie_files,
+    update_cedict_trie_files,
+)
+from glottai.cedict.utilities.paths import (
+    get_cedict_trie_package_dir,
+    get_material_dir,
+)
+
+
+_cedict_xiaowangzi_file = (
+    get_material_dir() / ".cedict" / "cedict_xiaowangzi.txt"
+)
+
+
+def _use_tmp_trie_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        settings,
+        "get_cedict_trie_file",
+        lambda form="traditional": tmp_path / f"cedict_trie_{form}.py",
+    )
+    monkeypatch.setattr(
+        settings,
+        "get_cedict_trie_da_file",
+        lambda form="traditional": tmp_path / f"cedict_trie_{form}.da",
+    )
+
+
+def _da_lookups(tmp_path, form):
+    with DoubleArrayTrie(tmp_path / f"cedict_trie_{form}.da") as da_trie:
+        return [
+            double_array_lookup(da_trie, text, len(text), 0)
+            for text in ["小", "王子", "王", "子王", "王國"]
+        ]
+
+
+def _write_new_cedict_file(tmp_path):
+    lines = _cedict_xiaowangzi_file.read_text(encoding="utf-8").splitlines()
+    lines = [line.replace("=4", "=3") for line in lines]
+    lines.remove("小 小 [xiao3] /small/tiny/few/young/")
+    lines[-1] = "王子 王子 [wang2 zi3] /prince/"
+
+    new_file = tmp_path / "cedict.txt"
+    new_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    return new_file
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_build_cedict_trie_files_000(parallel, tmp_path, monkeypatch):
+    _use_tmp_trie_files(tmp_path, monkeypatch)
+
+    variables = build_cedict_trie_files(
+        _cedict_xiaowangzi_file, parallel=parallel
+    )
+
+    assert variables["entries"] == "4"
+    for form in ["traditional", "simplified"]:
+        trie_file = f"cedict_trie_{form}.py"
+        expected = get_cedict_trie_package_dir() / trie_file
+        assert (tmp_path / trie_file).read_text(encoding="utf-8") == (
+            expected.read_text(encoding="utf-8")
+        )
+
+        lookups = _da_lookups(tmp_path, form)
+        assert [word for word, _, _ in lookups] == [
+            "小",
+            "王子",
+            "王",
+            "子",
+            "王",
+        ]
+        assert lookups[1][1] == "王子 王子 [wáng zǐ] /prince/son of a king/"
+
+
+def test_build_cedict_trie_files_001(tmp_path, monkeypatch, capsys):
+    _use_tmp_trie_files(tmp_path, monkeypatch)
+
+    build_cedict_trie_files(_cedict_xiaowangzi_file, report=True)
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 6
+    assert lines[0].startswith(f"Parsed {_cedict_xiaowangzi_file} in ")
+    assert lines[-1].startswith("Built both trie files in ")
+
+
+def test_update_cedict_trie_files_000(tmp_path, monkeypatch):
+    _use_tmp_trie_files(tmp_path, monkeypatch)
+    new_file = _write_new_cedict_file(tmp_path)
+
+    build_cedict_trie_files(_cedict_xiaowangzi_file)
+    changes = update_cedict_trie_files(
+        _cedict_xiaowangzi_file, new_file, check=True
+    )
+    assert [change.op for change in changes] == ["remove", "change"]
+
+    # The updated trie files equal freshly built ones
+    updated = {}
+    updated_lookups = {}
+    for form in ["traditional", "simplified"]:
+        trie_file = tmp_path / f"cedict_trie_{form}.py"
+        updated[form] = trie_file.read_text(encoding="utf-8")
+        updated_lookups[form] = _da_lookups(tmp_path, form)
+
+    build_cedict_trie_files(new_file)
+    for form in ["traditional", "simplified"]:
+        trie_file = tmp_path / f"cedict_trie_{form}.py"
+        assert updated[form] == trie_file.read_text(encoding="utf-8")
+        assert "'entries': '3'" in updated[form]
+        assert updated_lookups[form] == _da_lookups(tmp_path, form)
+        assert updated_lookups[form][0] == (None, None, 0)
+        assert updated_lookups[form][1][1] == "王子 王子 [wáng zǐ] /prince/"
+
+
+def test_update_cedict_trie_files_001(tmp_path, monkeypatch):
+    _use_tmp_trie_files(tmp_path, monkeypatch)
+    new_file = _write_new_cedict_file(tmp_path)
+
+    # Build the trie files from a cedict file
+    # with an entry missing in the old cedict file
+    other_file = tmp_path / "other.txt"
+    other_file.write_text(
+        _cedict_xiaowangzi_file.read_text(encoding="utf-8")
+        + "王國 王国 [wang2 guo2] /kingdom/\n",
+        encoding="utf-8",
+    )
+    build_cedict_trie_files(other_file)
+
+    with pytest.raises(CedictBuildException):
+        update_cedict_trie_files(
+            _cedict_xiaowangzi_file, new_file, check=True
+        )
+
+
+def test_update_cedict_trie_files_002(tmp_path, monkeypatch):
+    _use_tmp_trie_files(tmp_path, monkeypatch)
+    new_file = _write_new_cedict_file(tmp_path)
+
+    # The trie files have not been built from the old cedict file
+    build_cedict_trie_files(new_file)
+
+    with pytest.raises(TrieUpdateException):
+        update_cedict_trie_files(_cedict_xiaowangzi_file, new_file)
+
+
+def test_update_cedict_trie_files_003(tmp_path, monkeypatch):
+    """The entries of a word are in the order of the new cedict file."""
+
+    _use_tmp_trie_files(tmp_path, monkeypatch)
+
+    old_file = tmp_path / "old.txt"
+    old_file.write_text("髮 发 [fa4] /hair/\n", encoding="utf-8")
+    new_file = tmp_path / "new.txt"
+    new_file.write_text(
+        "發 发 [fa1] /to send out/\n髮 发 [fa4] /hair/\n", encoding="utf-8"
+    )
+
+    build_cedict_trie_files(old_file)
+    update_cedict_trie_files(old_file, new_file, check=True)
+    updated = (tmp_path / "cedict_trie_simplified.py").read_text(
+        encoding="utf-8"
+    )
+
+    build_cedict_trie_files(new_file)
+    assert updated == (tmp_path / "cedict_trie_simplified.py").read_text(
+        encoding="utf-8"
+    )
+
+
+def test_build_cedict_entry_fields_file_000(tmp_path, monkeypatch):
+    from glottai.cedict.datastructures.entry_table.entry_fields import (
+        EntryFields,
+    )
+
+    entry_fields_file = tmp_path / "cedict_entry_fields.ef"
+    monkeypatch.setattr(
+        settings, "get_cedict_entry_fields_file", lambda: entry_fields_file
+    )
+
+    build_cedict_entry_fields_file(_cedict_xiaowangzi_file)
+
+    with EntryFields.open(entry_fields_file) as fields:
+        assert len(fields) == 4
+        assert fields.trie("simplified")["王"]["子"] == {True: 3}
+        assert fields[3].pinyin_marks == "wáng zǐ"
+
+
+def test_build_cedict_index_files_000(tmp_path, monkeypatch):
+    from glottai.cedict.index.pinyin_index import PinyinIndex
+    from glottai.cedict.index.sense_index import SenseIndex
+
+    for name in ["entry_fields", "sense_index", "pinyin_index"]:
+        monkeypatch.setattr(
+            settings,
+            f"get_cedict_{name}_file",
+            lambda name=name: tmp_path / f"cedict_{name}",
+        )
+
+    build_cedict_index_files(_cedict_xiaowangzi_file)
+
+    sense_index = SenseIndex.load(tmp_path / "cedict_sense_index")
+    pinyin_index = PinyinIndex.load(tmp_path / "cedict_pinyin_index")
+    assert sense_index.search("prince") == [3]
+    assert pinyin_index.lookup("wangzi") == [3]
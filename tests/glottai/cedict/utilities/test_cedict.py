@@ -0,0 +1,131 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""tests/glottai/cedict/utilities/test_cedict.py:
+
+Test for the CC-CEDICT utilities.
+
+pytest -q tests/glottai/cedict/utilities/test_cedict.py
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+from glottai.cedict.utilities.cedict import (
+    get_cedict_entry_word,
+    read_cedict,
+    read_cedict_entries,
+    read_cedict_entry_tries,
+    read_cedict_trie_items,
+    read_cedict_tries,
+    read_cedict_variables,
+)
+from glottai.cedict.utilities.paths import get_material_dir
+
+
+_cedict_xiaowangzi_file = (
+    get_material_dir() / ".cedict" / "cedict_xiaowangzi.txt"
+)
+
+
+def test_read_cedict_entries_000():
+    entries = list(read_cedict_entries(_cedict_xiaowangzi_file))
+
+    assert len(entries) == 4
+    assert entries[0] == "小 小 [xiao3] /small/tiny/few/young/"
+    assert entries[3] == "王子 王子 [wang2 zi3] /prince/son of a king/"
+
+
+def test_get_cedict_entry_word_000():
+    entry = "學習 学习 [xue2 xi2] /to learn/to study/"
+
+    assert get_cedict_entry_word(entry) == "學習"
+    assert get_cedict_entry_word(entry, form="simplified") == "学习"
+
+
+def test_read_cedict_trie_items_000():
+    items = list(read_cedict_trie_items(_cedict_xiaowangzi_file))
+
+    assert items[3] == ("王子", "王子 王子 [wáng zǐ] /prince/son of a king/")
+
+
+def test_read_cedict_entry_tries_000():
+    table, traditional_trie, simplified_trie = read_cedict_entry_tries(
+        _cedict_xiaowangzi_file
+    )
+
+    assert len(table) == 4
+    assert traditional_trie == simplified_trie
+    assert simplified_trie["王"] == {True: 1, "子": {True: 3}}
+    assert table.get(simplified_trie["王"]["子"][True]) == (
+        "王子 王子 [wáng zǐ] /prince/son of a king/"
+    )
+
+
+def _gzip_file(filename, tmp_path):
+    import gzip
+    import shutil
+
+    gz_file = tmp_path / (filename.name + ".gz")
+    with open(filename, "rb") as f_in:
+        with gzip.open(gz_file, "wb") as f_out:
+            shutil.copyfileobj(f_in, f_out)
+
+    return gz_file
+
+
+def test_read_cedict_000(tmp_path):
+    gz_file = _gzip_file(_cedict_xiaowangzi_file, tmp_path)
+    header, variables, entries = read_cedict(gz_file)
+
+    assert header == [
+        "# CC-CEDICT",
+        "# Community maintained free Chinese-English dictionary.",
+        "#",
+        "# Example file with only 4 entries",
+        "#",
+    ]
+    assert variables == read_cedict_variables(_cedict_xiaowangzi_file)
+    assert list(entries) == list(
+        read_cedict_entries(_cedict_xiaowangzi_file)
+    )
+
+
+def test_read_cedict_tries_000(tmp_path):
+    import io
+    from glottai.cedict.trie.simple.write import write_trie_to_file
+    from glottai.cedict.utilities.paths import get_cedict_trie_package_dir
+
+    gz_file = _gzip_file(_cedict_xiaowangzi_file, tmp_path)
+    header, variables, traditional_trie, simplified_trie = (
+        read_cedict_tries(gz_file)
+    )
+
+    assert traditional_trie == simplified_trie
+    assert simplified_trie["王"]["子"][True] == (
+        "王子 王子 [wáng zǐ] /prince/son of a king/"
+    )
+
+    # The streamed build reproduces the shipped trie file
+    fh = io.StringIO()
+    write_trie_to_file(fh, header, variables, simplified_trie)
+    trie_file = get_cedict_trie_package_dir() / "cedict_trie_simplified.py"
+    assert fh.getvalue() == trie_file.read_text(encoding="utf-8")
@@ -0,0 +1,91 @@
+# ==========================================================
+# Copyright 2026 Dietrich Bollmann
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ----------------------------------------------------------
+
+"""tests/glottai/cedict/utilities/test_diff.py:
+
+Test for the CC-CEDICT diff.
+
+pytest -q tests/glottai/cedict/utilities/test_diff.py
+
+"""
+
+__author__ = "Dietrich Bollmann"
+__email__ = "dietrich@newskylabs.net"
+__copyright__ = "Copyright 2026 Dietrich Bollmann"
+__license__ = "Apache License 2.0, http://www.apache.org/licenses/LICENSE-2.0"
+__date__ = "2026/10/17"
+
+
+from glottai.cedict.utilities.diff import Change, diff, iter_diff
+
+
+_old_lines = [
+    "# old file",
+    "aaa aaa entry for aaa",
+    "ccc ccc eliminated entry",
+    "ddd ddd old entry for ddd",
+]
+
+_new_lines = [
+    "# new file",
+    "aaa aaa entry for aaa",
+    "bbb bbb added entry for bbb",
+    "ddd ddd new entry for ddd",
+]
+
+
+def _write_files(tmp_path):
+    old_file = tmp_path / "old.txt"
+    new_file = tmp_path / "new.txt"
+    old_file.write_text("\n".join(_old_lines) + "\n", encoding="utf-8")
+    new_file.write_text("\n".join(_new_lines) + "\n", encoding="utf-8")
+
+    return old_file, new_file
+
+
+def test_iter_diff_000(tmp_path):
+    old_file, new_file = _write_files(tmp_path)
+
+    assert list(iter_diff(old_file, new_file)) == [
+        Change("add", None, "bbb bbb added entry for bbb"),
+        Change("remove", "ccc ccc eliminated entry", None),
+        Change(
+            "change", "ddd ddd old entry for ddd", "ddd ddd new entry for ddd"
+        ),
+    ]
+
+
+def test_iter_diff_001(tmp_path):
+    old_file, _ = _write_files(tmp_path)
+
+    assert list(iter_diff(old_file, old_file)) == []
+
+
+def test_diff_000(tmp_path, capsys):
+    old_file, new_file = _write_files(tmp_path)
+
+    diff(old_file, new_file)
+
+    assert capsys.readouterr().out == (
+        "\n"
+        "+ bbb bbb added entry for bbb\n"
+        "\n"
+        "- ccc ccc eliminated entry\n"
+        "\n"
+        "< ddd ddd old entry for ddd\n"
+        "> ddd ddd new entry for ddd\n"
+        "\n"
+    )